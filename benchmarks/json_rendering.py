@@ -0,0 +1,88 @@
+"""Compare topic list rendering: `jsonable_encoder` + `JSONResponse` vs `ApiResponse`,
+and the row layout vs `format=columnar`.
+
+Renders a page of synthetic `Topic` rows each way (no database needed):
+
+    python -m benchmarks.json_rendering [rows] [iterations]
+
+Both paths must produce the same JSON document; the new path is checked against
+the old one before timing.
+"""
+
+import datetime
+import json
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from database.tenant_models.models import Topic
+from web.responses import ApiResponse
+
+
+def make_topics(count: int) -> List[Topic]:
+    load_date = datetime.datetime(2025, 1, 1, 12, 30)
+    return [
+        Topic(
+            tid=tid,
+            sid=10,
+            load_date=load_date,
+            topic_id=f"topic-{tid}",
+            topic_name=f"Topic {tid}",
+            topic_status=1,
+            topic_description="A description long enough to look like real content. " * 4,
+            industry_sizing=tid * 0.5,
+            average_sizing=tid * 0.25,
+            average_sizing_label="Large",
+            topic_growth=0.12,
+            topic_consensus=0.8,
+            topic_consensus_label="High",
+            action_required="Monitor",
+            masterfile_version=3,
+        )
+        for tid in range(count)
+    ]
+
+
+def legacy(content: Dict[str, Any]) -> bytes:
+    return bytes(JSONResponse(status_code=200, content=jsonable_encoder(content)).body)
+
+
+def current(content: Dict[str, Any]) -> bytes:
+    return bytes(ApiResponse(status_code=200, content=content).body)
+
+
+def measure(name: str, render: Callable[[Dict[str, Any]], bytes], content: Any, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        render(content)
+        timings.append(time.perf_counter() - start)
+    p50 = statistics.median(timings)
+    print(f"{name:<8} p50: {p50 * 1000:8.2f} ms")
+    return p50
+
+
+def main(rows: int = 1_000, iterations: int = 50) -> None:
+    topics = make_topics(rows)
+    content = {"topics": topics, "next_cursor": None}
+    assert json.loads(legacy(content)) == json.loads(current(content))
+
+    print(f"{rows} topics, {iterations} iterations")
+    legacy_p50 = measure("legacy", legacy, content, iterations)
+    current_p50 = measure("current", current, content, iterations)
+    print(f"speed-up: {legacy_p50 / current_p50:.1f}x")
+
+    names = list(Topic.__table__.c.keys())  # type: ignore[attr-defined]
+    tuples = [tuple(getattr(topic, name) for name in names) for topic in topics]
+    columnar = {"topics": dict(zip(names, zip(*tuples))), "next_cursor": None}
+    columnar_p50 = measure("columnar", current, columnar, iterations)
+    print(f"speed-up: {legacy_p50 / columnar_p50:.1f}x")
+    print(f"bytes: rows {len(current(content))}, columnar {len(current(columnar))}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
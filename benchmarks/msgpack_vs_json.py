@@ -0,0 +1,70 @@
+"""Compare JSON and MessagePack topic list bodies: payload size, encode and decode time.
+
+Renders a page of synthetic `Topic` rows both ways (no database needed), in
+the row and columnar layouts:
+
+    python -m benchmarks.msgpack_vs_json [rows] [iterations]
+
+Both bodies must decode to the same topics (datetimes compared as instants)
+before timing.
+"""
+
+import datetime
+import json
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict
+
+import msgpack
+
+from benchmarks.json_rendering import make_topics
+from database.tenant_models.models import Topic
+from web.responses import render_json, render_msgpack
+
+
+def p50(action: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def decode_msgpack(body: bytes) -> Any:
+    return msgpack.unpackb(body, timestamp=3)
+
+
+def compare(layout: str, content: Dict[str, Any], runs: int) -> None:
+    as_json, as_msgpack = render_json(content), render_msgpack(content)
+    print(f"{layout}: json {len(as_json):>9,} B   msgpack {len(as_msgpack):>9,} B")
+    for name, encode, decode, body in (
+        ("json", render_json, json.loads, as_json),
+        ("msgpack", render_msgpack, decode_msgpack, as_msgpack),
+    ):
+        encode_p50 = p50(lambda: encode(content), runs)
+        decode_p50 = p50(lambda: decode(body), runs)
+        print(
+            f"  {name:<8} encode p50: {encode_p50 * 1000:7.2f} ms"
+            f"   decode p50: {decode_p50 * 1000:7.2f} ms"
+        )
+
+
+def main(rows: int = 1_000, iterations: int = 50) -> None:
+    topics = make_topics(rows)
+    content = {"topics": topics, "next_cursor": None}
+    decoded = decode_msgpack(render_msgpack(content))["topics"]
+    for topic, row in zip(topics, decoded):
+        assert row["load_date"] == topic.load_date.replace(tzinfo=datetime.timezone.utc)
+        assert row["industry_sizing"] == topic.industry_sizing
+
+    print(f"{rows} topics, {iterations} iterations")
+    compare("rows", content, iterations)
+    names = list(Topic.__table__.c.keys())  # type: ignore[attr-defined]
+    columns = {name: [getattr(topic, name) for topic in topics] for name in names}
+    compare("columnar", {"topics": columns, "next_cursor": None}, iterations)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,90 @@
+"""Compare database round trips of the permissions endpoint: five lookups vs one bundle query.
+
+The bundle path reads feature codes from a warm reference-data cache, as the service does.
+
+Runs against the database configured through the POSTGRES_* environment variables:
+
+    python -m benchmarks.permissions_round_trips <org_id> <sow_id> [iterations]
+
+Round trips count connection checkouts (pre-ping), statements and COMMITs.
+"""
+
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+from sqlalchemy import event
+
+from database.manager import db
+from repositories.permissions_repository import PermissionsRepository
+from repositories.reference_data_repository import (
+    CachedReferenceDataRepository,
+    ReferenceDataRepository,
+)
+
+
+def legacy_lookups(
+    repo: PermissionsRepository, reference_data: ReferenceDataRepository, org_id: str, sow_id: int
+) -> None:
+    """The sequence `PermissionsService` ran before the bundle query existed."""
+    sow = repo.get_sow(org_id, sow_id)
+    if sow is None:
+        return
+    reference_data.get_feature_codes_for_org(org_id)
+    repo.get_experiments(sow.cs_sow_id)
+    repo.has_opportunity_platforms(org_id, sow.sid)  # type: ignore[arg-type]
+
+
+def measure(name: str, call: Callable[[], Any], iterations: int) -> None:
+    round_trips = 0
+
+    def count(*_: Any) -> None:
+        nonlocal round_trips
+        round_trips += 1
+
+    events = ("checkout", "before_cursor_execute", "commit")
+    for event_name in events:
+        event.listen(db.engine, event_name, count)
+    timings = []
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - start)
+    finally:
+        for event_name in events:
+            event.remove(db.engine, event_name, count)
+
+    print(
+        f"{name:<8} round trips/call: {round_trips / iterations:5.1f}"
+        f"  p50: {statistics.median(timings) * 1000:7.2f} ms"
+    )
+
+
+def bundle_lookups(
+    repo: PermissionsRepository,
+    reference_data: CachedReferenceDataRepository,
+    org_id: str,
+    sow_id: int,
+) -> None:
+    """The sequence `PermissionsService` runs now, with warm reference data."""
+    if repo.get_permissions_bundle(org_id, sow_id) is not None:
+        reference_data.get_feature_codes_for_org(org_id)
+
+
+def main(org_id: str, sow_id: int, iterations: int = 50) -> None:
+    repo = PermissionsRepository(db)
+    reference_data = ReferenceDataRepository(db)
+    cached_reference_data = CachedReferenceDataRepository(reference_data)
+    cached_reference_data.get_feature_codes_for_org(org_id)
+    measure("legacy", lambda: legacy_lookups(repo, reference_data, org_id, sow_id), iterations)
+    measure(
+        "bundle",
+        lambda: bundle_lookups(repo, cached_reference_data, org_id, sow_id),
+        iterations,
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], int(sys.argv[2]), *(int(arg) for arg in sys.argv[3:4]))
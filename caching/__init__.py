@@ -0,0 +1,13 @@
+"""In-process caching primitives shared by repositories, services and routes."""
+
+from .single_flight import FlightStats, SingleFlight, coalesce, coalesce_async
+from .ttl_cache import CacheStats, TTLCache
+
+__all__ = [
+    "CacheStats",
+    "FlightStats",
+    "SingleFlight",
+    "TTLCache",
+    "coalesce",
+    "coalesce_async",
+]
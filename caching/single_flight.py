@@ -0,0 +1,209 @@
+"""Coalescing of identical concurrent calls into one execution ("single flight").
+
+While a call for a key is running, further calls for the same key wait for it
+and receive its result (or exception) instead of running again. Nothing is kept
+once the call finishes, so this only merges calls that overlap in time; unlike
+`TTLCache` it never serves a result that is already stale.
+"""
+
+import functools
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Concatenate,
+    Dict,
+    Hashable,
+    Optional,
+    ParamSpec,
+    Tuple,
+    TypeVar,
+)
+
+import anyio
+
+P = ParamSpec("P")
+R = TypeVar("R")
+S = TypeVar("S")
+
+
+@dataclass
+class FlightStats:
+    """Counters reported by `SingleFlight.stats()`."""
+
+    executions: int = 0
+    coalesced: int = 0
+    errors: int = 0
+    in_flight: int = 0
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class _AsyncCall:
+    done: anyio.Event = field(default_factory=anyio.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs one call per key at a time and shares its outcome with concurrent callers.
+
+    `do` serves threads (sync repositories run in the threadpool) and `do_async`
+    tasks on the event loop (async repositories). Every caller gets the same
+    result objects, so only coalesce results that no caller mutates and that do
+    not depend on the session that loaded them (plain values, tuples, bytes; not
+    ORM rows, whose unit of work expires them when the first request ends).
+
+    Example:
+        flights = SingleFlight()
+        page = flights.do(("acme", "get_page", query), lambda: repo.get_page("acme", query))
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Hashable, _AsyncCall] = {}
+        self._stats = FlightStats()
+
+    def do(self, key: Hashable, function: Callable[[], R]) -> R:
+        """Return `function()`, or the outcome of the identical call already running."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            self._count(leader)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            self._finish(self._calls, key, call.error)
+            call.done.set()
+        return call.result  # type: ignore[no-any-return]
+
+    async def do_async(self, key: Hashable, function: Callable[[], Awaitable[R]]) -> R:
+        """Async `do`: await `function()`, or the identical call already running.
+
+        The leading call is shielded from cancellation, so a caller that goes away
+        does not fail the others waiting on it.
+        """
+        with self._lock:
+            call = self._async_calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._async_calls[key] = _AsyncCall()
+            self._count(leader)
+
+        if not leader:
+            await call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        with anyio.CancelScope(shield=True):
+            try:
+                call.result = await function()
+            except Exception as error:
+                call.error = error
+            finally:
+                self._finish(self._async_calls, key, call.error)
+                call.done.set()
+        if call.error is not None:
+            raise call.error
+        return call.result  # type: ignore[no-any-return]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return asdict(self._stats)
+
+    def _count(self, leader: bool) -> None:
+        if leader:
+            self._stats.executions += 1
+            self._stats.in_flight += 1
+        else:
+            self._stats.coalesced += 1
+
+    def _finish(self, calls: Dict[Hashable, Any], key: Hashable, error: Any) -> None:
+        with self._lock:
+            del calls[key]
+            self._stats.in_flight -= 1
+            if error is not None:
+                self._stats.errors += 1
+
+
+def _call_key(method: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    """`(method, args, kwargs)`, or None when an argument is unhashable."""
+    key = (method.__qualname__, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def coalesce(
+    flights: SingleFlight,
+) -> Callable[[Callable[Concatenate[S, P], R]], Callable[Concatenate[S, P], R]]:
+    """Route a sync repository method through `flights`, keyed by method and arguments.
+
+    The tenant schema is the first argument of every repository method, so it is
+    part of the key. Calls with unhashable arguments run on their own.
+    """
+
+    def decorate(method: Callable[Concatenate[S, P], R]) -> Callable[Concatenate[S, P], R]:
+        @functools.wraps(method)
+        def wrapper(self: S, /, *args: P.args, **kwargs: P.kwargs) -> R:
+            key = _call_key(method, args, kwargs)
+            if key is None:
+                return method(self, *args, **kwargs)
+            return flights.do(key, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorate
+
+
+def coalesce_async(
+    flights: SingleFlight,
+) -> Callable[
+    [Callable[Concatenate[S, P], Awaitable[R]]], Callable[Concatenate[S, P], Awaitable[R]]
+]:
+    """Async variant of `coalesce` for `async def` repository methods."""
+
+    def decorate(
+        method: Callable[Concatenate[S, P], Awaitable[R]],
+    ) -> Callable[Concatenate[S, P], Awaitable[R]]:
+        @functools.wraps(method)
+        async def wrapper(self: S, /, *args: P.args, **kwargs: P.kwargs) -> R:
+            key = _call_key(method, args, kwargs)
+            if key is None:
+                return await method(self, *args, **kwargs)
+            return await flights.do_async(key, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorate
+
+
+# Shared by the topic version probe, columnar page reads and rendered topic list
+# pages, whose identical calls arrive in bursts; reported under /_metrics.
+repository_flights = SingleFlight()
+
+__all__ = ["FlightStats", "SingleFlight", "coalesce", "coalesce_async", "repository_flights"]
@@ -0,0 +1,121 @@
+"""A bounded, thread-safe LRU cache with per-entry expiry and hit/miss counters."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """Counters reported by `TTLCache.stats()`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+    weight: int = 0
+
+
+class TTLCache(Generic[K, V]):
+    """LRU cache bounded by entry count and, optionally, by total weight.
+
+    Entries expire `ttl` seconds after they are stored, or at the absolute
+    `expires_at` (on the cache clock) given to `set`. `weigher` measures each value
+    (e.g. `len` for bytes) so `max_weight` can bound memory; the least recently used
+    entries are evicted first. Every method takes an internal lock, so one cache can
+    be shared by the threadpool and the event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[V], int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self._weigher = weigher
+        self._clock = clock
+        self._entries: "OrderedDict[K, Tuple[V, Optional[float], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value for `key`, or None when missing or expired."""
+        return self.lookup(key)[1]
+
+    def lookup(self, key: K) -> Tuple[bool, Optional[V]]:
+        """Return `(found, value)`, telling a cached `None` apart from a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at, weight = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return True, value
+                self._remove(key, weight)
+                self._stats.expirations += 1
+            self._stats.misses += 1
+            return False, None
+
+    def set(self, key: K, value: V, expires_at: Optional[float] = None) -> None:
+        """Store `value`; it expires at `expires_at`, else after `ttl`, else never."""
+        if expires_at is None and self.ttl is not None:
+            expires_at = self._clock() + self.ttl
+        weight = self._weigher(value) if self._weigher is not None else 0
+        if self.max_weight is not None and weight > self.max_weight:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._stats.weight -= previous[2]
+            self._entries[key] = (value, expires_at, weight)
+            self._stats.weight += weight
+            while len(self._entries) > self.maxsize or (
+                self.max_weight is not None and self._stats.weight > self.max_weight
+            ):
+                oldest, (_, _, oldest_weight) = next(iter(self._entries.items()))
+                self._remove(oldest, oldest_weight)
+                self._stats.evictions += 1
+
+    def get_or_load(self, key: K, loader: Callable[[], V]) -> V:
+        """Return the cached value, calling `loader` and caching its result on a miss.
+
+        `None` results are cached too, so negative lookups stay off the database.
+        """
+        found, value = self.lookup(key)
+        if found:
+            return value  # type: ignore[return-value]
+        loaded = loader()
+        self.set(key, loaded)
+        return loaded
+
+    def invalidate(self, key: Optional[K] = None) -> None:
+        """Drop one entry, or every entry when `key` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._stats.weight = 0
+                return
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._remove(key, entry[2])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._stats.size = len(self._entries)
+            return asdict(self._stats)
+
+    def _remove(self, key: K, weight: int) -> None:
+        del self._entries[key]
+        self._stats.weight -= weight
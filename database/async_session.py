@@ -0,0 +1,88 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database.tenant_routing import (
+    TenantRouting,
+    schema_translate_options,
+    search_path_statement,
+)
+from database.unit_of_work import READ_ONLY_EXECUTION_OPTIONS, AsyncUnitOfWork
+
+
+class AsyncDBSession:
+    """Async variant of `DBSession` backed by an asyncio driver (e.g. asyncpg).
+
+    Exposes the same `session()` / `tenant_session()` pair, as async context
+    managers, so async repositories can keep many queries in flight from a
+    single worker without occupying threadpool slots.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        tenant_routing: TenantRouting = TenantRouting.SEARCH_PATH,
+    ):
+        self.engine = create_async_engine(
+            db_url, pool_pre_ping=True, pool_size=pool_size, max_overflow=max_overflow
+        )
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self.tenant_routing = tenant_routing
+
+    async def open_session(self, read_only: bool = False) -> AsyncSession:
+        """Open a session; read-only sessions run without a transaction.
+
+        Unlike `DBSession`, read replicas are not balanced here: every async
+        session is served by the primary.
+        """
+        session = self.SessionLocal()
+        if read_only:
+            await session.connection(execution_options=READ_ONLY_EXECUTION_OPTIONS)
+        return session
+
+    @asynccontextmanager
+    async def session(self, read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        session = await self.open_session(read_only)
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    @asynccontextmanager
+    async def tenant_session(
+        self, tenant_schema: str, read_only: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Opens an async session routed to the tenant schema + public
+        (see `database.tenant_routing`).
+        """
+        session = await self.open_session(read_only)
+        try:
+            if self.tenant_routing is TenantRouting.SCHEMA_TRANSLATE:
+                connection = await session.connection()
+                await connection.execution_options(**schema_translate_options(tenant_schema))
+            else:
+                await session.exec(search_path_statement(tenant_schema))  # type: ignore[call-overload]
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    def unit_of_work(self, read_only: bool = False) -> AsyncUnitOfWork:
+        """Return a request-scoped `AsyncUnitOfWork`; the caller is responsible for closing it."""
+        return AsyncUnitOfWork(
+            self.SessionLocal, read_only=read_only, tenant_routing=self.tenant_routing
+        )
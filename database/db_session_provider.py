@@ -2,11 +2,22 @@ from typing import Any, Protocol
 
 
 class DBSessionProvider(Protocol):
-    """Protocol for a DB provider that exposes both public and tenant-scoped sessions."""
+    """Protocol for a DB provider that exposes both public and tenant-scoped sessions.
 
-    def session(self) -> Any: ...
+    Repositories pass `read_only=True` for queries that may be served by a read replica.
+    """
 
-    def tenant_session(self, schema: str) -> Any: ...
+    def session(self, read_only: bool = False) -> Any: ...
 
+    def tenant_session(self, schema: str, read_only: bool = False) -> Any: ...
 
-__all__ = ["DBSessionProvider"]
+
+class AsyncDBSessionProvider(Protocol):
+    """Async counterpart of `DBSessionProvider`; both methods return async context managers."""
+
+    def session(self, read_only: bool = False) -> Any: ...
+
+    def tenant_session(self, schema: str, read_only: bool = False) -> Any: ...
+
+
+__all__ = ["AsyncDBSessionProvider", "DBSessionProvider"]
@@ -0,0 +1,61 @@
+"""Containment tests on JSON-array columns that an index can answer.
+
+Several tenant models store many-to-many links as JSON arrays (e.g.
+`Source.topic_ids`). `json_array_contains(column, value)` asks "does the array
+hold `value`?" without parsing rows in Python:
+
+- on PostgreSQL it renders `CAST(column AS JSONB) @> CAST('[value]' AS JSONB)`,
+  which a GIN `jsonb_path_ops` index on the same expression answers in
+  sublinear time (see `database/sql/json_array_indexes.sql`);
+- elsewhere (sqlite in tests) it falls back to an `EXISTS` over `json_each`.
+
+The value is bound as the JSON text `[value]`, so compiled statements are cached
+and reused across values.
+"""
+
+import json
+from typing import Any
+
+from sqlalchemy import Boolean, ColumnElement, String, bindparam
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.visitors import InternalTraversal
+
+
+class JsonArrayContains(ColumnElement[bool]):
+    """Boolean clause: the JSON array in `column` contains `value`."""
+
+    inherit_cache = True
+    type = Boolean()
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("array", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column: ColumnElement[Any], value: Any) -> None:
+        self.column = column
+        self.array = bindparam(None, json.dumps([value]), type_=String(), unique=True)
+
+
+def json_array_contains(column: Any, value: Any) -> ColumnElement[bool]:
+    return JsonArrayContains(column, value)
+
+
+@compiles(JsonArrayContains)
+def _compile_json_each(element: JsonArrayContains, compiler: SQLCompiler, **kw: Any) -> str:
+    column = compiler.process(element.column, **kw)
+    array = compiler.process(element.array, **kw)
+    return (
+        f"EXISTS (SELECT 1 FROM json_each({column}) "
+        f"WHERE json_each.value = json_extract({array}, '$[0]'))"
+    )
+
+
+@compiles(JsonArrayContains, "postgresql")
+def _compile_jsonb_containment(element: JsonArrayContains, compiler: SQLCompiler, **kw: Any) -> str:
+    column = compiler.process(element.column, **kw)
+    array = compiler.process(element.array, **kw)
+    return f"CAST({column} AS JSONB) @> CAST({array} AS JSONB)"
+
+
+__all__ = ["JsonArrayContains", "json_array_contains"]
@@ -3,10 +3,13 @@ from typing import Any, Type
 
 from dotenv import load_dotenv
 from sqlmodel import select
+from starlette.concurrency import run_in_threadpool
 
+from database.async_session import AsyncDBSession
 from database.session import DBSession
 from database.shared import SQLModelType
 from database.tenant_models.models import Topic, Trend
+from database.tenant_routing import TenantRouting
 
 load_dotenv()
 
@@ -15,23 +18,65 @@ DB_USER = os.environ.get("POSTGRES_USER")
 DB_PASSWORD = os.environ.get("POSTGRES_PASSWORD")
 DB_NAME = os.environ.get("POSTGRES_DB")
 DB_PORT = os.environ.get("POSTGRES_PORT", 5432)
+# When enabled, routes run their queries through the asyncpg-backed `async_db`.
+DB_ASYNC = os.environ.get("POSTGRES_ASYNC", "false").lower() in ("1", "true", "yes")
+DB_ASYNC_POOL_SIZE = int(os.environ.get("POSTGRES_ASYNC_POOL_SIZE", 20))
+DB_ASYNC_MAX_OVERFLOW = int(os.environ.get("POSTGRES_ASYNC_MAX_OVERFLOW", 80))
+DB_TENANT_ROUTING = TenantRouting(
+    os.environ.get("POSTGRES_TENANT_ROUTING", TenantRouting.SEARCH_PATH).lower()
+)
+# Comma-separated read replica hosts sharing the primary's credentials, database and port.
+DB_REPLICA_HOSTS = [
+    host.strip() for host in os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(",") if host.strip()
+]
+DB_REPLICA_MAX_LAG_SECONDS = float(os.environ.get("POSTGRES_REPLICA_MAX_LAG_SECONDS", 5))
 
 db = DBSession(
-    f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?sslmode=require"
+    f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?sslmode=require",
+    tenant_routing=DB_TENANT_ROUTING,
+    replica_urls=[
+        f"postgresql://{DB_USER}:{DB_PASSWORD}@{host}:{DB_PORT}/{DB_NAME}?sslmode=require"
+        for host in DB_REPLICA_HOSTS
+    ],
+    max_replica_lag_seconds=DB_REPLICA_MAX_LAG_SECONDS,
 )
 
+async_db: AsyncDBSession | None = None
+if DB_ASYNC:
+    async_db = AsyncDBSession(
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?ssl=require",
+        pool_size=DB_ASYNC_POOL_SIZE,
+        max_overflow=DB_ASYNC_MAX_OVERFLOW,
+        tenant_routing=DB_TENANT_ROUTING,
+    )
+
 
 def get_all(model: Type[SQLModelType], tenant_schema: str | None = None) -> list[SQLModelType]:
     """Fetch all rows for the given SqlModel `model`."""
     if tenant_schema:
-        with db.tenant_session(tenant_schema) as session:
+        with db.tenant_session(tenant_schema, read_only=True) as session:
             statement = select(model)
             return list(session.exec(statement).all())
 
-    with db.session() as session:
+    with db.session(read_only=True) as session:
         return list(session.exec(select(model)).all())
 
 
+async def fetch_all(
+    model: Type[SQLModelType], tenant_schema: str | None = None
+) -> list[SQLModelType]:
+    """Async `get_all`: uses `async_db` when enabled, otherwise the sync engine in the threadpool."""
+    if async_db is None:
+        return await run_in_threadpool(get_all, model, tenant_schema)
+
+    if tenant_schema:
+        async with async_db.tenant_session(tenant_schema, read_only=True) as session:
+            return list((await session.exec(select(model))).all())
+
+    async with async_db.session(read_only=True) as session:
+        return list((await session.exec(select(model))).all())
+
+
 def get_by_id(
     model: Type[SQLModelType], id: Any, tenant_schema: str | None = None
 ) -> SQLModelType | None:
@@ -0,0 +1,107 @@
+"""Health-aware load balancing across PostgreSQL read replicas.
+
+`ReplicaSet` only keeps track of replica health; `DBSession` asks it for
+candidates when it opens a read-only session and reports back connection
+failures and measured replication lag. When no replica qualifies, `DBSession`
+falls back to the primary.
+"""
+
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("uvicorn.error")
+
+# Seconds the replica is behind the primary; 0 while it has replayed everything it received.
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+@dataclass
+class Replica:
+    """A replica engine and its last known health."""
+
+    engine: Engine
+    down_until: float = 0.0
+    lag_seconds: float = 0.0
+    lag_checked_at: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+    @property
+    def in_flight(self) -> int:
+        """Connections currently checked out from this replica's pool."""
+        checkedout: Callable[[], int] | None = getattr(self.engine.pool, "checkedout", None)
+        return checkedout() if checkedout is not None else 0
+
+
+class ReplicaSet:
+    """Picks replicas by fewest in-flight connections, skipping down or lagging ones.
+
+    A replica that fails to connect is skipped for `down_cooldown` seconds. Lag is
+    re-measured at most every `lag_check_interval` seconds; a replica more than
+    `max_lag_seconds` behind is skipped until a later measurement clears it.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        max_lag_seconds: float = 5.0,
+        lag_check_interval: float = 10.0,
+        down_cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.replicas = [Replica(engine) for engine in engines]
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_interval = lag_check_interval
+        self.down_cooldown = down_cooldown
+        self._clock = clock
+        self._rotation = itertools.count()
+
+    def lag_check_due(self, replica: Replica) -> bool:
+        """Whether the replica's lag should be measured on its next connection (PostgreSQL only)."""
+        if replica.engine.dialect.name != "postgresql":
+            return False
+        if replica.lag_checked_at is None:
+            return True
+        return self._clock() - replica.lag_checked_at >= self.lag_check_interval
+
+    def is_lagging(self, replica: Replica) -> bool:
+        return replica.lag_seconds > self.max_lag_seconds
+
+    def candidates(self) -> List[Replica]:
+        """Return usable replicas, least loaded first; ties rotate between calls."""
+        now = self._clock()
+        usable = [
+            replica
+            for replica in self.replicas
+            if replica.down_until <= now
+            and (not self.is_lagging(replica) or self.lag_check_due(replica))
+        ]
+        if not usable:
+            return []
+        offset = next(self._rotation) % len(usable)
+        rotated = usable[offset:] + usable[:offset]
+        return sorted(rotated, key=lambda replica: replica.in_flight)
+
+    def mark_down(self, replica: Replica) -> None:
+        replica.down_until = self._clock() + self.down_cooldown
+        logger.warning("Read replica %s is down; using other replicas or the primary", replica.name)
+
+    def record_lag(self, replica: Replica, lag_seconds: float) -> None:
+        replica.lag_seconds = lag_seconds
+        replica.lag_checked_at = self._clock()
+        if self.is_lagging(replica):
+            logger.warning("Read replica %s is %.1fs behind the primary", replica.name, lag_seconds)
+
+
+__all__ = ["REPLICA_LAG_QUERY", "Replica", "ReplicaSet"]
@@ -0,0 +1,45 @@
+"""Pydantic models for the growth opportunity hierarchy response."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from database.tenant_models.models import Estimator, GrowthOpportunityTopics
+
+
+class MarketNode(BaseModel):
+    mid: Optional[int]
+    market: str
+    market_level_market_size: Decimal
+    estimators: List[Estimator] = []
+
+
+class GeographyNode(BaseModel):
+    ggoid: Optional[int]
+    name: str
+    geography_id: str
+    geography_name: str
+    description: str
+    customer_need: str
+    growth_space_market_size: Decimal
+    strategic_fit_score: Optional[float] = None
+    ranking_index: Optional[float] = None
+    markets: List[MarketNode] = []
+
+
+class GrowthOpportunityNode(BaseModel):
+    """A root growth opportunity with its topics and, up to `depth`, its subtree."""
+
+    goid: Optional[int]
+    load_date: datetime
+    growth_opportunity_id: str
+    rating: Optional[int] = None
+    currency: str = "USD"
+    topics: List[GrowthOpportunityTopics] = []
+    geographies: List[GeographyNode] = []
+
+
+class GrowthOpportunityHierarchyResponse(BaseModel):
+    growth_opportunities: List[GrowthOpportunityNode]
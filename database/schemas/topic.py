@@ -1,9 +1,14 @@
 """Pydantic models for topic-related API responses."""
 
+import os
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from database.tenant_models.models import MaturityScore, Opportunity, Source, Trend
+
+TOPICS_MAX_BATCH_SIZE = int(os.environ.get("TOPICS_MAX_BATCH_SIZE", 500))
 
 
 class TopicResponse(BaseModel):
@@ -43,12 +48,60 @@ class TopicResponse(BaseModel):
 
 
 class TopicsListResponse(BaseModel):
-    """Response model for listing topics."""
+    """Response model for one page of topics; `next_cursor` is None on the last page."""
 
     topics: List[TopicResponse]
+    next_cursor: Optional[str] = None
+
+
+class TopicsColumnarResponse(BaseModel):
+    """One page of topics with `format=columnar`: each requested field appears once,
+    mapped to its values in row order (`topics[field][i]` belongs to the i-th topic).
+    """
+
+    topics: Dict[str, List[Any]] = Field(
+        examples=[{"tid": [1, 2], "topic_id": ["t-1", "t-2"], "topic_name": ["A", "B"]}]
+    )
+    next_cursor: Optional[str] = None
 
 
 class TopicItemResponse(BaseModel):
     """Response model for a single topic item."""
 
     topic: TopicResponse
+
+
+class TopicBatchRequest(BaseModel):
+    """Request body of the batch topic lookup."""
+
+    topic_ids: List[str] = Field(min_length=1, max_length=TOPICS_MAX_BATCH_SIZE)
+
+
+class TopicBatchResponse(BaseModel):
+    """Topics found, keyed by topic_id, and the requested ids that matched nothing."""
+
+    topics: Dict[str, TopicResponse]
+    missing: List[str]
+
+
+class TopicDriverResponse(BaseModel):
+    """A driver of a topic, with the strength of their link."""
+
+    did: Optional[int]
+    driver_id: str
+    driver_name: str
+    driver_description: Optional[str] = None
+    strength: Optional[float] = None
+    polarity: Optional[float] = None
+    cooccurrence: Optional[int] = None
+
+
+class TopicGraphResponse(BaseModel):
+    """A topic with its trend, drivers, sources, opportunities and latest maturity scores."""
+
+    topic: TopicResponse
+    trend: Optional[Trend] = None
+    drivers: List[TopicDriverResponse]
+    sources: List[Source]
+    opportunities: List[Opportunity]
+    maturity_scores: List[MaturityScore]
@@ -1,19 +1,75 @@
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Sequence
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session
 
+from database.replicas import REPLICA_LAG_QUERY, ReplicaSet
+from database.tenant_routing import (
+    TenantRouting,
+    schema_translate_options,
+    search_path_statement,
+)
+from database.unit_of_work import READ_ONLY_EXECUTION_OPTIONS, UnitOfWork
+
 
 class DBSession:
-    def __init__(self, db_url: str):
+    """Session factory over a primary database and optional read replicas.
+
+    Sessions opened with `read_only=True` run without a transaction and are
+    served by the least-loaded healthy replica, falling back to the primary
+    when no replica is configured, reachable or caught up.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        tenant_routing: TenantRouting = TenantRouting.SEARCH_PATH,
+        replica_urls: Sequence[str] = (),
+        max_replica_lag_seconds: float = 5.0,
+    ):
         self.engine = create_engine(db_url, pool_pre_ping=True, future=True)
         self.SessionLocal = sessionmaker(bind=self.engine, class_=Session, expire_on_commit=False)
+        self.tenant_routing = tenant_routing
+        self.replicas = ReplicaSet(
+            [create_engine(url, pool_pre_ping=True, future=True) for url in replica_urls],
+            max_lag_seconds=max_replica_lag_seconds,
+        )
+
+    def open_session(self, read_only: bool = False) -> Session:
+        """Open a session on the primary or, when `read_only`, on a healthy replica.
+
+        Read-only sessions connect eagerly so an unreachable or lagging replica
+        can be skipped before the caller issues any query.
+        """
+        if not read_only:
+            return self.SessionLocal()
+
+        for replica in self.replicas.candidates():
+            session = self.SessionLocal(bind=replica.engine)
+            try:
+                connection = session.connection(execution_options=READ_ONLY_EXECUTION_OPTIONS)
+                if self.replicas.lag_check_due(replica):
+                    lag = connection.execute(REPLICA_LAG_QUERY).scalar()
+                    self.replicas.record_lag(replica, float(lag or 0))
+            except DBAPIError:
+                session.close()
+                self.replicas.mark_down(replica)
+                continue
+            if self.replicas.is_lagging(replica):
+                session.close()
+                continue
+            return session
 
-    @contextmanager
-    def session(self) -> Generator[Session, None, None]:
         session = self.SessionLocal()
+        session.connection(execution_options=READ_ONLY_EXECUTION_OPTIONS)
+        return session
+
+    @contextmanager
+    def session(self, read_only: bool = False) -> Generator[Session, None, None]:
+        session = self.open_session(read_only)
         try:
             yield session
             session.commit()
@@ -24,14 +80,20 @@ class DBSession:
             session.close()
 
     @contextmanager
-    def tenant_session(self, tenant_schema: str) -> Generator[Session, None, None]:
+    def tenant_session(
+        self, tenant_schema: str, read_only: bool = False
+    ) -> Generator[Session, None, None]:
         """
-        Opens a session with the PostgreSQL search_path set
-        to the tenant schema + public.
+        Opens a session routed to the tenant schema + public, either through
+        the PostgreSQL search_path or through schema translation
+        (see `database.tenant_routing`).
         """
-        session = self.SessionLocal()
+        session = self.open_session(read_only)
         try:
-            session.exec(text(f"SET search_path TO {tenant_schema.lower()}, public"))  # type: ignore[call-overload]
+            if self.tenant_routing is TenantRouting.SCHEMA_TRANSLATE:
+                session.connection().execution_options(**schema_translate_options(tenant_schema))
+            else:
+                session.exec(search_path_statement(tenant_schema))  # type: ignore[call-overload]
             yield session
             session.commit()
         except Exception:
@@ -39,3 +101,11 @@ class DBSession:
             raise
         finally:
             session.close()
+
+    def unit_of_work(self, read_only: bool = False) -> UnitOfWork:
+        """Return a request-scoped `UnitOfWork`; the caller is responsible for closing it."""
+        return UnitOfWork(
+            lambda: self.open_session(read_only),
+            read_only=read_only,
+            tenant_routing=self.tenant_routing,
+        )
@@ -0,0 +1,14 @@
+-- Foreign-key indexes behind repositories.growth_opportunity_repository, applied to every tenant
+-- schema. Each hierarchy level is selected by its parent key; roots are found through their topics.
+-- Run by hand (CONCURRENTLY, outside a transaction).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_growthopportunitytopicsmodel_topic_id
+    ON client_interface_growthopportunitytopicsmodel (topic_id, goid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_growthopportunitytopicsmodel_goid
+    ON client_interface_growthopportunitytopicsmodel (goid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_geographygrowthopportunitymodel_goid
+    ON client_interface_geographygrowthopportunitymodel (goid, ggoid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_marketmodel_ggoid
+    ON client_interface_marketmodel (ggoid, mid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_estimatormodel_mid
+    ON client_interface_estimatormodel (mid, eid);
@@ -0,0 +1,13 @@
+-- GIN indexes backing database.json_array.json_array_contains, applied to every tenant schema.
+-- The indexed expression matches the one the queries render (CAST(col AS JSONB) @> ...); when the
+-- column already is jsonb the cast is a no-op. Run by hand (CONCURRENTLY, outside a transaction).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_sourcemodel_topic_ids_gin
+    ON client_interface_sourcemodel USING GIN ((CAST(topic_ids AS JSONB)) jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_insightsourcemodel_insight_ids_gin
+    ON client_interface_insightsourcemodel USING GIN ((CAST(insight_ids AS JSONB)) jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_growthopportunitysource_go_ids_gin
+    ON client_interface_growthopportunitysource
+    USING GIN ((CAST(growth_opportunity_ids AS JSONB)) jsonb_path_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_growthopportunitymodel_topic_ids_gin
+    ON client_interface_growthopportunitymodel USING GIN ((CAST(topic_ids AS JSONB)) jsonb_path_ops);
@@ -0,0 +1,29 @@
+-- Recommended indexes for the topic endpoints, applied to every tenant schema.
+-- The tables are owned by the loader, so these are run by hand (CONCURRENTLY, outside a transaction).
+
+-- Keyset pages of /api/v2/topics/: `tid > :after ORDER BY tid`, optionally scoped by `sid`.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_topicmodel_live_tid_idx
+    ON client_interface_topicmodel (tid) WHERE for_deletion = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_topicmodel_live_sid_tid_idx
+    ON client_interface_topicmodel (sid, tid) WHERE for_deletion = false;
+
+-- Sorted pages (`sort=[-]<metric>`): ORDER BY <metric> ASC NULLS LAST, tid (DESC NULLS FIRST, tid DESC
+-- read backwards), so one index serves both directions. Each page is one range seek; a page crossing
+-- between the values and the NULLs is a UNION ALL of one seek on each side. The same indexes back the
+-- min_/max_ range filters.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_topicmodel_live_growth_idx
+    ON client_interface_topicmodel (topic_growth_normalized ASC NULLS LAST, tid) WHERE for_deletion = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_topicmodel_live_consensus_idx
+    ON client_interface_topicmodel (topic_consensus_normalized ASC NULLS LAST, tid) WHERE for_deletion = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_topicmodel_live_sizing_idx
+    ON client_interface_topicmodel (average_sizing ASC NULLS LAST, tid) WHERE for_deletion = false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_topicmodel_live_status_idx
+    ON client_interface_topicmodel (topic_status, tid) WHERE for_deletion = false;
+
+-- `new_discovery=true` picks out a small slice of the table.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_topicmodel_new_discovery_idx
+    ON client_interface_topicmodel (tid) WHERE for_deletion = false AND new_discovery;
+
+-- Topic lookups by topic_id (single and batch): latest sid per topic_id.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS client_interface_topicmodel_live_topic_id_idx
+    ON client_interface_topicmodel (topic_id, sid DESC, tid DESC) WHERE for_deletion = false;
@@ -0,0 +1,42 @@
+"""Strategies for routing tenant-model queries to the tenant's PostgreSQL schema.
+
+Tenant models (`database.tenant_models`) declare no schema; public models are
+pinned to "public". Two routing modes are supported:
+
+- `search_path`: send `SET search_path TO <tenant>, public` when a tenant
+  session opens (one extra round trip, and the setting stays on the pooled
+  connection until the next tenant session overwrites it).
+- `schema_translate`: render the tenant schema into each statement through
+  SQLAlchemy's `schema_translate_map`. The map is applied after compilation, so
+  one compiled statement is cached and reused for every tenant, no statement is
+  sent to the server, and nothing is left behind on the pooled connection.
+"""
+
+from enum import StrEnum
+from typing import Any, Dict
+
+from sqlalchemy import TextClause, text
+
+
+class TenantRouting(StrEnum):
+    """How tenant sessions select the tenant schema."""
+
+    SEARCH_PATH = "search_path"
+    SCHEMA_TRANSLATE = "schema_translate"
+
+
+def search_path_statement(tenant_schema: str) -> TextClause:
+    """Return the `SET search_path` statement used by `TenantRouting.SEARCH_PATH`."""
+    return text(f"SET search_path TO {tenant_schema.lower()}, public")
+
+
+def schema_translate_options(tenant_schema: str) -> Dict[str, Any]:
+    """Return the connection execution options used by `TenantRouting.SCHEMA_TRANSLATE`.
+
+    The `None` key maps every table without an explicit schema (the tenant
+    models) to the tenant schema, leaving "public" tables untouched.
+    """
+    return {"schema_translate_map": {None: tenant_schema.lower()}}
+
+
+__all__ = ["TenantRouting", "schema_translate_options", "search_path_statement"]
@@ -0,0 +1,156 @@
+"""Request-scoped units of work.
+
+A unit of work wraps a single `Session` that is shared by every repository call
+made while handling one HTTP request, so the request checks out one pooled
+connection, routes it to the tenant schema once and commits (or not) in one place.
+Both classes satisfy the session-provider protocols in
+`database.db_session_provider`, so repositories take them unchanged.
+"""
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Callable, Generator, Optional
+
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database.tenant_routing import (
+    TenantRouting,
+    schema_translate_options,
+    search_path_statement,
+)
+
+# Read-only work runs outside an explicit transaction: no BEGIN and no COMMIT
+# round trips, and returning the connection to the pool has nothing to roll back.
+READ_ONLY_EXECUTION_OPTIONS = {"isolation_level": "AUTOCOMMIT"}
+
+
+class UnitOfWork:
+    """`DBSessionProvider` that hands out one lazily opened `Session` per unit of work."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        read_only: bool = False,
+        tenant_routing: TenantRouting = TenantRouting.SEARCH_PATH,
+    ) -> None:
+        self._session_factory = session_factory
+        self.read_only = read_only
+        self.tenant_routing = tenant_routing
+        self._session: Optional[Session] = None
+        self._tenant_schema: Optional[str] = None
+
+    @property
+    def in_use(self) -> bool:
+        """Whether a session has been opened (i.e. there is anything to commit or close)."""
+        return self._session is not None
+
+    def _get_session(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+            if self.read_only and not self._session.in_transaction():
+                self._session.connection(execution_options=READ_ONLY_EXECUTION_OPTIONS)
+        return self._session
+
+    @contextmanager
+    def session(self, read_only: bool = False) -> Generator[Session, None, None]:
+        """Yield the shared session; `read_only` is decided once for the whole unit of work."""
+        yield self._get_session()
+
+    @contextmanager
+    def tenant_session(
+        self, tenant_schema: str, read_only: bool = False
+    ) -> Generator[Session, None, None]:
+        """Yield the shared session, routing it only when the tenant changes.
+
+        Under schema translation the map is updated in place on the session's
+        connection, so switching tenants costs no round trip at all.
+        """
+        session = self._get_session()
+        schema = tenant_schema.lower()
+        if schema != self._tenant_schema:
+            if self.tenant_routing is TenantRouting.SCHEMA_TRANSLATE:
+                session.connection().execution_options(**schema_translate_options(schema))
+            else:
+                session.exec(search_path_statement(schema))  # type: ignore[call-overload]
+            self._tenant_schema = schema
+        yield session
+
+    def close(self, commit: bool = True) -> None:
+        """Commit (unless read-only or `commit` is False, then roll back) and release the session."""
+        if self._session is None:
+            return
+        try:
+            if commit and not self.read_only:
+                self._session.commit()
+            else:
+                self._session.rollback()
+        finally:
+            self._session.close()
+            self._session = None
+            self._tenant_schema = None
+
+
+class AsyncUnitOfWork:
+    """Async counterpart of `UnitOfWork` sharing one `AsyncSession`."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        read_only: bool = False,
+        tenant_routing: TenantRouting = TenantRouting.SEARCH_PATH,
+    ) -> None:
+        self._session_factory = session_factory
+        self.read_only = read_only
+        self.tenant_routing = tenant_routing
+        self._session: Optional[AsyncSession] = None
+        self._tenant_schema: Optional[str] = None
+
+    @property
+    def in_use(self) -> bool:
+        """Whether a session has been opened (i.e. there is anything to commit or close)."""
+        return self._session is not None
+
+    async def _get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+            if self.read_only and not self._session.in_transaction():
+                await self._session.connection(execution_options=READ_ONLY_EXECUTION_OPTIONS)
+        return self._session
+
+    @asynccontextmanager
+    async def session(self, read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """Yield the shared session; `read_only` is decided once for the whole unit of work."""
+        yield await self._get_session()
+
+    @asynccontextmanager
+    async def tenant_session(
+        self, tenant_schema: str, read_only: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Yield the shared session, routing it only when the tenant changes."""
+        session = await self._get_session()
+        schema = tenant_schema.lower()
+        if schema != self._tenant_schema:
+            if self.tenant_routing is TenantRouting.SCHEMA_TRANSLATE:
+                connection = await session.connection()
+                await connection.execution_options(**schema_translate_options(schema))
+            else:
+                await session.exec(search_path_statement(schema))  # type: ignore[call-overload]
+            self._tenant_schema = schema
+        yield session
+
+    async def close(self, commit: bool = True) -> None:
+        """Commit (unless read-only or `commit` is False, then roll back) and release the session."""
+        if self._session is None:
+            return
+        try:
+            if commit and not self.read_only:
+                await self._session.commit()
+            else:
+                await self._session.rollback()
+        finally:
+            await self._session.close()
+            self._session = None
+            self._tenant_schema = None
+
+
+__all__ = ["AsyncUnitOfWork", "UnitOfWork"]
@@ -1,28 +1,82 @@
+import hashlib
+import os
+import threading
+import time
 from typing import Any, Dict
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 
+from caching import TTLCache
+
 SECRET_KEY = "a-string-secret-at-least-256-bits-long"
 ALGORITHM = "HS256"
 
 BEARER_HEADER = HTTPBearer()
 
+# Verified claims keyed by the token's sha256, each entry expiring at the token's own `exp`.
+JWT_CACHE_SIZE = int(os.environ.get("JWT_CACHE_SIZE", 10_000))
+_claims_cache: TTLCache[str, Dict[str, Any]] = TTLCache(JWT_CACHE_SIZE)
+_verification_lock = threading.Lock()
+_verification = {"count": 0, "seconds": 0.0}
+
+
+def _expired_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired JWT",
+    )
+
+
+def _verify(token: str) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        payload: Dict[str, Any] = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    finally:
+        with _verification_lock:
+            _verification["count"] += 1
+            _verification["seconds"] += time.perf_counter() - started
+    return payload
+
 
 def validate_jwt(
     credentials: HTTPAuthorizationCredentials = Depends(BEARER_HEADER),
 ) -> Dict[str, Any]:
     """
     Dependency that validates a JWT from `Authorization: Bearer <JWT_TOKEN>`
+
+    Verified claims are cached until the token's `exp`; tokens without `exp` are
+    verified on every request.
     """
     token = credentials.credentials
+    key = hashlib.sha256(token.encode()).hexdigest()
+
+    cached = _claims_cache.get(key)
+    if cached is not None:
+        if cached["exp"] <= time.time():
+            _claims_cache.invalidate(key)
+            raise _expired_token()
+        return dict(cached)
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = _verify(token)
     except JWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired JWT",
-        )
+        raise _expired_token()
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _claims_cache.set(key, payload, expires_at=time.monotonic() + (exp - time.time()))
+    return dict(payload)
+
+
+def jwt_cache_stats() -> Dict[str, float]:
+    """Cache counters plus the verification time spent and (estimated from hits) saved."""
+    stats: Dict[str, float] = dict(_claims_cache.stats())
+    with _verification_lock:
+        count, seconds = _verification["count"], _verification["seconds"]
+    average = seconds / count if count else 0.0
+    stats["verifications"] = count
+    stats["verification_seconds"] = seconds
+    stats["saved_seconds"] = stats["hits"] * average
+    return stats
@@ -1,35 +1,81 @@
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+import anyio
 from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from database.manager import get_all
+from caching.single_flight import repository_flights
+from database.manager import fetch_all
 from database.public_models.models import Client
+from jwt_validator import jwt_cache_stats
 from routes.client_router import client_router
+from routes.dependencies import (
+    TENANT_REGISTRY_REFRESH_SECONDS,
+    get_reference_data,
+    get_tenant_registry,
+    get_topic_list_cache,
+)
+from routes.export_router import export_router
+from routes.growth_opportunity_router import growth_opportunity_router
+from routes.ingest_router import ingest_router
 from routes.permissions_router import permissions_router
 from routes.topic_router import topic_router
+from web.compression import CompressionMiddleware
+from web.negotiation import NegotiationMiddleware
+from web.responses import ApiResponse
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Load the tenant registry before serving and keep it fresh in the background."""
+    registry = get_tenant_registry()
+    await run_in_threadpool(registry.load)
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(registry.refresh_forever, TENANT_REGISTRY_REFRESH_SECONDS)
+        yield
+        task_group.cancel_scope.cancel()
+
+
+app = FastAPI(default_response_class=ApiResponse, lifespan=lifespan)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(NegotiationMiddleware)
 logger = logging.getLogger("uvicorn.error")
 
 
 @app.get("/")
-def read_root() -> JSONResponse:
-    clients: list[Client] = get_all(Client)
-    return JSONResponse(status_code=200, content=jsonable_encoder({"clients": clients}))
+async def read_root() -> ApiResponse:
+    clients: list[Client] = await fetch_all(Client)
+    return ApiResponse(status_code=200, content={"clients": clients})
 
 
 @app.get("/error")
-def error() -> JSONResponse:
-    return JSONResponse(status_code=500, content={"status": "Generic error"})
+async def error() -> ApiResponse:
+    return ApiResponse(status_code=500, content={"status": "Generic error"})
 
 
 @app.get("/_health")
-def health() -> JSONResponse:
-    return JSONResponse(status_code=200, content={"status": "OK"})
+async def health() -> ApiResponse:
+    return ApiResponse(status_code=200, content={"status": "OK"})
+
+
+@app.get("/_metrics")
+async def metrics() -> ApiResponse:
+    caches = {
+        "reference_data": get_reference_data().stats(),
+        "topic_lists": get_topic_list_cache().stats(),
+        "jwt": jwt_cache_stats(),
+        "tenant_registry": get_tenant_registry().stats(),
+    }
+    return ApiResponse(
+        status_code=200, content={"caches": caches, "single_flight": repository_flights.stats()}
+    )
 
 
 app.include_router(client_router)
+app.include_router(export_router)
+app.include_router(growth_opportunity_router)
+app.include_router(ingest_router)
 app.include_router(permissions_router)
 app.include_router(topic_router)
@@ -0,0 +1,95 @@
+"""Repository for bulk exports of tenant tables.
+
+Rows are read through a server-side cursor (`yield_per`) and handed out one
+batch at a time, so memory stays flat however large the table is. Server-side
+cursors need a transaction (psycopg2 named cursors and asyncpg cursors both
+refuse to run under AUTOCOMMIT), so exports open their own tenant session
+instead of borrowing the request's read-only unit of work.
+`AsyncExportRepository` runs the same statement on an `AsyncDBSessionProvider`.
+"""
+
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+from sqlalchemy import Select, Table, select
+
+from database.db_session_provider import AsyncDBSessionProvider, DBSessionProvider
+from database.tenant_models.models import (
+    Driver,
+    MaturityScore,
+    Opportunity,
+    Source,
+    Topic,
+    TopicDelta,
+    Trend,
+)
+
+ExportRow = Dict[str, Any]
+
+EXPORT_TABLES: Dict[str, Table] = {
+    "topics": Topic.__table__,  # type: ignore[attr-defined]
+    "trends": Trend.__table__,  # type: ignore[attr-defined]
+    "drivers": Driver.__table__,  # type: ignore[attr-defined]
+    "sources": Source.__table__,  # type: ignore[attr-defined]
+    "opportunities": Opportunity.__table__,  # type: ignore[attr-defined]
+    "topic_deltas": TopicDelta.__table__,  # type: ignore[attr-defined]
+    "maturity_scores": MaturityScore.__table__,  # type: ignore[attr-defined]
+}
+
+
+def _export_statement(table: Table, limit: int, batch_size: int) -> Select[Any]:
+    """Every column of `table` in primary-key order, at most `limit` rows, fetched in batches."""
+    return (
+        select(table)
+        .order_by(*table.primary_key.columns)
+        .limit(limit)
+        .execution_options(yield_per=batch_size)
+    )
+
+
+class ExportRepository:
+    """Streams tenant table rows from an injectable DB provider.
+
+    Example:
+        repo = ExportRepository(db)  # where `db` is the manager.db object
+    """
+
+    def __init__(self, db_provider: DBSessionProvider) -> None:
+        self.db = db_provider
+
+    def iter_batches(
+        self, tenant_schema: str, table: str, limit: int, batch_size: int
+    ) -> Iterator[List[ExportRow]]:
+        """Yield the rows of export `table` as lists of at most `batch_size` column dicts.
+
+        The session (and its cursor) stays open until the iterator is exhausted or closed.
+        """
+        statement = _export_statement(EXPORT_TABLES[table], limit, batch_size)
+        with self.db.tenant_session(tenant_schema) as session:
+            result = session.connection().execute(statement)
+            for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+
+
+class AsyncExportRepository:
+    """Async variant of `ExportRepository` for an `AsyncDBSessionProvider`.
+
+    Example:
+        repo = AsyncExportRepository(async_db)  # where `async_db` is manager.async_db
+    """
+
+    def __init__(self, db_provider: AsyncDBSessionProvider) -> None:
+        self.db = db_provider
+
+    async def iter_batches(
+        self, tenant_schema: str, table: str, limit: int, batch_size: int
+    ) -> AsyncIterator[List[ExportRow]]:
+        """Yield the rows of export `table` as lists of at most `batch_size` column dicts."""
+        statement = _export_statement(EXPORT_TABLES[table], limit, batch_size)
+        async with self.db.tenant_session(tenant_schema) as session:
+            connection = await session.connection()
+            result = await connection.stream(statement)
+            async for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+
+
+__all__ = ["EXPORT_TABLES", "AsyncExportRepository", "ExportRepository", "ExportRow"]
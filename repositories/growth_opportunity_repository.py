@@ -0,0 +1,172 @@
+"""Repository for the growth opportunity hierarchy of a SOW.
+
+The hierarchy is `BaseGrowthOpportunity` → `GeographyGrowthOpportunity` →
+`Market` → `Estimator`, with `GrowthOpportunityTopics` on each root. Roots carry
+no SOW link, so a SOW's roots are those tagged with one of the SOW's topics.
+
+`get_levels` loads the tree breadth-first: one query per level, each selecting
+its rows through a subquery on the level above, so no id lists are sent and the
+query count depends only on `depth`. Callers assemble the levels in memory.
+`AsyncGrowthOpportunityRepository` runs the same statements on an
+`AsyncDBSessionProvider`.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from database.db_session_provider import AsyncDBSessionProvider, DBSessionProvider
+from database.tenant_models.models import (
+    BaseGrowthOpportunity,
+    Estimator,
+    GeographyGrowthOpportunity,
+    GrowthOpportunityTopics,
+    Market,
+    Topic,
+)
+
+# Levels below the roots: geographies, markets, estimators.
+MAX_HIERARCHY_DEPTH = 3
+
+
+@dataclass
+class GrowthOpportunityLevels:
+    """The rows of each hierarchy level, ordered by primary key; deeper levels may be empty."""
+
+    roots: List[BaseGrowthOpportunity] = field(default_factory=list)
+    topics: List[GrowthOpportunityTopics] = field(default_factory=list)
+    geographies: List[GeographyGrowthOpportunity] = field(default_factory=list)
+    markets: List[Market] = field(default_factory=list)
+    estimators: List[Estimator] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _LevelStatements:
+    roots: SelectOfScalar[BaseGrowthOpportunity]
+    topics: SelectOfScalar[GrowthOpportunityTopics]
+    geographies: SelectOfScalar[GeographyGrowthOpportunity]
+    markets: SelectOfScalar[Market]
+    estimators: SelectOfScalar[Estimator]
+
+
+def _level_statements(
+    sow_id: int, after_goid: Optional[int], limit: Optional[int]
+) -> _LevelStatements:
+    sow_roots = (
+        select(GrowthOpportunityTopics.goid)
+        .join(Topic, Topic.topic_id == GrowthOpportunityTopics.topic_id)  # type: ignore[arg-type]
+        .where(Topic.sid == sow_id, Topic.for_deletion == False)  # noqa: E712
+    )
+    root_ids = select(BaseGrowthOpportunity.goid).where(
+        BaseGrowthOpportunity.for_deletion == False,  # noqa: E712
+        BaseGrowthOpportunity.goid.in_(sow_roots),  # type: ignore[union-attr]
+    )
+    if after_goid is not None:
+        root_ids = root_ids.where(BaseGrowthOpportunity.goid > after_goid)  # type: ignore[operator]
+    root_ids = root_ids.order_by(BaseGrowthOpportunity.goid).limit(limit)  # type: ignore[arg-type]
+    geography_ids = select(GeographyGrowthOpportunity.ggoid).where(
+        GeographyGrowthOpportunity.goid.in_(root_ids)  # type: ignore[attr-defined]
+    )
+    market_ids = select(Market.mid).where(Market.ggoid.in_(geography_ids))  # type: ignore[attr-defined]
+    return _LevelStatements(
+        roots=select(BaseGrowthOpportunity)
+        .where(BaseGrowthOpportunity.goid.in_(root_ids))  # type: ignore[union-attr]
+        .order_by(BaseGrowthOpportunity.goid),  # type: ignore[arg-type]
+        topics=select(GrowthOpportunityTopics)
+        .where(GrowthOpportunityTopics.goid.in_(root_ids))  # type: ignore[attr-defined]
+        .order_by(GrowthOpportunityTopics.id),  # type: ignore[arg-type]
+        geographies=select(GeographyGrowthOpportunity)
+        .where(GeographyGrowthOpportunity.ggoid.in_(geography_ids))  # type: ignore[union-attr]
+        .order_by(GeographyGrowthOpportunity.ggoid),  # type: ignore[arg-type]
+        markets=select(Market)
+        .where(Market.mid.in_(market_ids))  # type: ignore[union-attr]
+        .order_by(Market.mid),  # type: ignore[arg-type]
+        estimators=select(Estimator)
+        .where(Estimator.mid.in_(market_ids))  # type: ignore[attr-defined]
+        .order_by(Estimator.eid),  # type: ignore[arg-type]
+    )
+
+
+class GrowthOpportunityRepository:
+    """Loads a SOW's growth opportunity hierarchy from an injectable DB provider.
+
+    Example:
+        repo = GrowthOpportunityRepository(db)  # where `db` is the manager.db object
+    """
+
+    def __init__(self, db_provider: DBSessionProvider) -> None:
+        self.db = db_provider
+
+    def get_levels(
+        self,
+        tenant_schema: str,
+        sow_id: int,
+        depth: int = MAX_HIERARCHY_DEPTH,
+        after_goid: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> GrowthOpportunityLevels:
+        """Return up to `limit` roots after `after_goid` and `depth` levels below them.
+
+        Runs at most `2 + depth` queries (roots, their topics, then one per level).
+        """
+        statements = _level_statements(sow_id, after_goid, limit)
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            levels = GrowthOpportunityLevels(roots=list(session.exec(statements.roots).all()))
+            if not levels.roots:
+                return levels
+            levels.topics = list(session.exec(statements.topics).all())
+            if depth >= 1:
+                levels.geographies = list(session.exec(statements.geographies).all())
+            if depth >= 2 and levels.geographies:
+                levels.markets = list(session.exec(statements.markets).all())
+            if depth >= 3 and levels.markets:
+                levels.estimators = list(session.exec(statements.estimators).all())
+            return levels
+
+
+class AsyncGrowthOpportunityRepository:
+    """Async variant of `GrowthOpportunityRepository` for an `AsyncDBSessionProvider`.
+
+    Example:
+        repo = AsyncGrowthOpportunityRepository(async_db)  # where `async_db` is manager.async_db
+    """
+
+    def __init__(self, db_provider: AsyncDBSessionProvider) -> None:
+        self.db = db_provider
+
+    async def get_levels(
+        self,
+        tenant_schema: str,
+        sow_id: int,
+        depth: int = MAX_HIERARCHY_DEPTH,
+        after_goid: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> GrowthOpportunityLevels:
+        """Return up to `limit` roots after `after_goid` and `depth` levels below them.
+
+        Runs at most `2 + depth` queries (roots, their topics, then one per level).
+        """
+        statements = _level_statements(sow_id, after_goid, limit)
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            roots = (await session.exec(statements.roots)).all()
+            levels = GrowthOpportunityLevels(roots=list(roots))
+            if not levels.roots:
+                return levels
+            levels.topics = list((await session.exec(statements.topics)).all())
+            if depth >= 1:
+                levels.geographies = list((await session.exec(statements.geographies)).all())
+            if depth >= 2 and levels.geographies:
+                levels.markets = list((await session.exec(statements.markets)).all())
+            if depth >= 3 and levels.markets:
+                levels.estimators = list((await session.exec(statements.estimators)).all())
+            return levels
+
+
+__all__ = [
+    "MAX_HIERARCHY_DEPTH",
+    "AsyncGrowthOpportunityRepository",
+    "GrowthOpportunityLevels",
+    "GrowthOpportunityRepository",
+]
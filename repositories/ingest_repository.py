@@ -0,0 +1,297 @@
+"""Repository for bulk masterfile loads into tenant tables.
+
+A load writes every table of one SOW's new `masterfile_version` in a single
+transaction: rows are appended with PostgreSQL `COPY` (a plain multi-row INSERT
+on other dialects), the SOW's rows from earlier versions are flagged
+`for_deletion` (link rows, which carry neither a SOW nor a version, are deleted
+with the rows they link), and the SOW's own `masterfile_version` is bumped last, so
+readers see either the previous masterfile or the new one, never a mix. Tables
+loaded with their own primary keys have their serial sequence moved past the
+largest key in the same transaction, so later ordinary INSERTs do not collide.
+`AsyncIngestRepository` runs the same load on an `AsyncDBSessionProvider`.
+"""
+
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+from sqlalchemy import (
+    Connection,
+    Delete,
+    Dialect,
+    Select,
+    Table,
+    Update,
+    delete,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import SQLModel
+from starlette.concurrency import iterate_in_threadpool
+
+from database.db_session_provider import AsyncDBSessionProvider, DBSessionProvider
+from database.tenant_models.models import Driver, TenantSow, Topic, Topic2Driver, TopicDelta, Trend
+
+IngestRow = Dict[str, Any]
+# (table name, validated rows) in load order; one table's batches are consecutive.
+IngestBatches = Iterable[Tuple[str, List[IngestRow]]]
+
+# Ingestible tables in foreign-key order.
+INGEST_TABLES: Dict[str, Type[SQLModel]] = {
+    "trends": Trend,
+    "drivers": Driver,
+    "topics": Topic,
+    "topic2drivers": Topic2Driver,
+    "topic_deltas": TopicDelta,
+}
+
+# Column tying a table's rows to their SOW, for tables that carry one.
+SOW_COLUMNS = {"trends": "sid", "drivers": "sow_sid", "topics": "sid", "topic_deltas": "sow_sid"}
+# Link tables without a SOW or version of their own: (column, parent table it points at).
+LINK_COLUMNS = {"topic2drivers": ("topic_tid", "topics")}
+
+
+class StaleMasterfileVersion(Exception):
+    """The SOW already holds this `masterfile_version` or a later one."""
+
+    def __init__(self, current_version: int) -> None:
+        super().__init__(f"SOW is already at masterfile_version {current_version}.")
+        self.current_version = current_version
+
+
+@dataclass
+class IngestResult:
+    """Rows written per table by one load."""
+
+    rows: Dict[str, int]
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+
+def ingest_table(name: str) -> Table:
+    return INGEST_TABLES[name].__table__  # type: ignore[attr-defined, no-any-return]
+
+
+def _lock_sow_statement(sow_id: int) -> Any:
+    return (
+        select(TenantSow.masterfile_version)  # type: ignore[call-overload]
+        .where(TenantSow.sid == sow_id)
+        .with_for_update()
+    )
+
+
+def _superseded_statement(name: str, sow_id: int, masterfile_version: int) -> Any:
+    """Primary keys of the SOW's rows of `name` from masterfiles other than `masterfile_version`."""
+    table = ingest_table(name)
+    (key,) = table.primary_key.columns
+    return select(key).where(
+        table.c[SOW_COLUMNS[name]] == sow_id,
+        table.c.masterfile_version != masterfile_version,
+    )
+
+
+def _retire_statements(sow_id: int, masterfile_version: int) -> List[Update | Delete]:
+    """Delete links to the SOW's rows from earlier masterfiles and flag those rows,
+    then move the SOW to the new masterfile."""
+    statements: List[Update | Delete] = []
+    for name, (link_column, parent) in LINK_COLUMNS.items():
+        table = ingest_table(name)
+        superseded = _superseded_statement(parent, sow_id, masterfile_version)
+        statements.append(delete(table).where(table.c[link_column].in_(superseded)))
+    for name, sow_column in SOW_COLUMNS.items():
+        table = ingest_table(name)
+        if "for_deletion" not in table.c or "masterfile_version" not in table.c:
+            continue
+        live: List[ColumnElement[bool]] = [
+            table.c[sow_column] == sow_id,
+            table.c.masterfile_version != masterfile_version,
+            table.c.for_deletion == False,  # noqa: E712
+        ]
+        statements.append(update(table).where(*live).values(for_deletion=True))
+    statements.append(
+        update(TenantSow.__table__)  # type: ignore[attr-defined]
+        .where(TenantSow.__table__.c.sid == sow_id)  # type: ignore[attr-defined]
+        .values(masterfile_version=masterfile_version, load_date=func.current_timestamp())
+    )
+    return statements
+
+
+def _keyed(name: str, batch: List[IngestRow]) -> bool:
+    """Whether `batch` supplies its table's primary key rather than taking it from the sequence."""
+    (key,) = ingest_table(name).primary_key.columns
+    return key.name in batch[0]
+
+
+def _sequence_statements(dialect: Dialect, schema: str, names: Iterable[str]) -> List[Select[Any]]:
+    """Move each table's serial sequence to its largest primary key (PostgreSQL only).
+
+    COPY and explicit keys leave the sequence behind, and the next INSERT that
+    takes its key from it would collide with a loaded row.
+    """
+    if dialect.name != "postgresql":
+        return []
+    quote = dialect.identifier_preparer.quote
+    statements: List[Select[Any]] = []
+    for name in names:
+        table = ingest_table(name)
+        (key,) = table.primary_key.columns
+        sequence = func.pg_get_serial_sequence(f"{quote(schema)}.{quote(table.name)}", key.name)
+        statements.append(select(func.setval(sequence, func.max(key))))
+    return statements
+
+
+def _copy_value(value: Any) -> str:
+    """Render one value in COPY's text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        text = value.isoformat()
+    elif isinstance(value, (list, dict)):
+        text = json.dumps(value)
+    else:
+        text = str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy_data(rows: Sequence[IngestRow], columns: Sequence[str]) -> bytes:
+    lines = ("\t".join(_copy_value(row[column]) for column in columns) for row in rows)
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _copy_sql(connection: Connection, schema: str, table: Table, columns: Sequence[str]) -> str:
+    quote = connection.dialect.identifier_preparer.quote
+    names = ", ".join(quote(column) for column in columns)
+    return f"COPY {quote(schema)}.{quote(table.name)} ({names}) FROM STDIN"
+
+
+def _write_batch(connection: Connection, schema: str, name: str, rows: List[IngestRow]) -> None:
+    table = ingest_table(name)
+    columns = list(rows[0])
+    if connection.dialect.name != "postgresql":
+        connection.execute(table.insert(), rows)
+        return
+    # COPY bypasses schema translation, so the target is always schema-qualified.
+    cursor = connection.connection.dbapi_connection.cursor()  # type: ignore[union-attr]
+    try:
+        cursor.copy_expert(
+            _copy_sql(connection, schema.lower(), table, columns),
+            io.BytesIO(_copy_data(rows, columns)),
+        )
+    finally:
+        cursor.close()
+
+
+class IngestRepository:
+    """Loads masterfiles into tenant tables from an injectable DB provider.
+
+    Example:
+        repo = IngestRepository(db)  # where `db` is the manager.db object
+    """
+
+    def __init__(self, db_provider: DBSessionProvider) -> None:
+        self.db = db_provider
+
+    def ingest(
+        self, tenant_schema: str, sow_id: int, masterfile_version: int, batches: IngestBatches
+    ) -> Optional[IngestResult]:
+        """Write `batches` as the SOW's `masterfile_version` in one transaction.
+
+        Returns None when the SOW does not exist and raises `StaleMasterfileVersion`
+        when it is not behind `masterfile_version`. Any exception raised while
+        `batches` is consumed (e.g. a validation error) rolls the whole load back.
+        """
+        rows: Dict[str, int] = {}
+        keyed: Set[str] = set()
+        with self.db.tenant_session(tenant_schema) as session:
+            connection = session.connection()
+            current = connection.execute(_lock_sow_statement(sow_id)).scalar_one_or_none()
+            if current is None:
+                return None
+            if current >= masterfile_version:
+                raise StaleMasterfileVersion(current)
+            for name, batch in batches:
+                if batch:
+                    _write_batch(connection, tenant_schema, name, batch)
+                    rows[name] = rows.get(name, 0) + len(batch)
+                    if _keyed(name, batch):
+                        keyed.add(name)
+            schema = tenant_schema.lower()
+            for sequence in _sequence_statements(connection.dialect, schema, keyed):
+                connection.execute(sequence)
+            for statement in _retire_statements(sow_id, masterfile_version):
+                connection.execute(statement)
+        return IngestResult(rows)
+
+
+class AsyncIngestRepository:
+    """Async variant of `IngestRepository` for an `AsyncDBSessionProvider`.
+
+    Example:
+        repo = AsyncIngestRepository(async_db)  # where `async_db` is manager.async_db
+    """
+
+    def __init__(self, db_provider: AsyncDBSessionProvider) -> None:
+        self.db = db_provider
+
+    async def ingest(
+        self, tenant_schema: str, sow_id: int, masterfile_version: int, batches: IngestBatches
+    ) -> Optional[IngestResult]:
+        """Write `batches` as the SOW's `masterfile_version` in one transaction.
+
+        `batches` is advanced in the threadpool, so parsing and validating the
+        upload never blocks the event loop.
+        """
+        rows: Dict[str, int] = {}
+        keyed: Set[str] = set()
+        async with self.db.tenant_session(tenant_schema) as session:
+            connection = await session.connection()
+            result = await connection.execute(_lock_sow_statement(sow_id))
+            current = result.scalar_one_or_none()
+            if current is None:
+                return None
+            if current >= masterfile_version:
+                raise StaleMasterfileVersion(current)
+            async for name, batch in iterate_in_threadpool(iter(batches)):
+                if not batch:
+                    continue
+                if connection.dialect.name == "postgresql":
+                    raw = await connection.get_raw_connection()
+                    columns = list(batch[0])
+                    await raw.driver_connection.copy_to_table(
+                        ingest_table(name).name,
+                        source=_copy_data(batch, columns),
+                        columns=columns,
+                        schema_name=tenant_schema.lower(),
+                    )
+                else:
+                    await connection.execute(ingest_table(name).insert(), batch)
+                rows[name] = rows.get(name, 0) + len(batch)
+                if _keyed(name, batch):
+                    keyed.add(name)
+            schema = tenant_schema.lower()
+            for sequence in _sequence_statements(connection.dialect, schema, keyed):
+                await connection.execute(sequence)
+            for statement in _retire_statements(sow_id, masterfile_version):
+                await connection.execute(statement)
+        return IngestResult(rows)
+
+
+__all__ = [
+    "INGEST_TABLES",
+    "LINK_COLUMNS",
+    "AsyncIngestRepository",
+    "IngestBatches",
+    "IngestRepository",
+    "IngestResult",
+    "IngestRow",
+    "StaleMasterfileVersion",
+    "ingest_table",
+]
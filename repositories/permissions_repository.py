@@ -1,45 +1,127 @@
 """Repository for the permissions endpoint.
 
-Fetches tenant SOW, client tier features, experiments, and opportunity platform
-availability from both the public and tenant schemas.
+Fetches tenant SOW, experiments, and opportunity platform availability from
+both the public and tenant schemas. `PermissionsRepository` runs on a sync
+`DBSessionProvider`; `AsyncPermissionsRepository` runs the same statements on an
+`AsyncDBSessionProvider`. Client tier features are reference data, served by
+`repositories.reference_data_repository`.
+
+`get_permissions_bundle` answers the SOW-specific part in a single round trip;
+the granular lookups remain for callers that only need one piece.
 """
 
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
 
+from sqlalchemy import Select, and_, exists
 from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
 
-from database.db_session_provider import DBSessionProvider
-from database.public_models.models import Client, Experiment, PublicSow, ServiceFeature, TierFeature
+from database.db_session_provider import AsyncDBSessionProvider, DBSessionProvider
+from database.public_models.models import Experiment, PublicSow
 from database.tenant_models.models import Opportunity, TenantSow
 
 
+def _sow_statement(sow_id: int) -> SelectOfScalar[TenantSow]:
+    return select(TenantSow).where(TenantSow.sid == sow_id)
+
+
+def _public_sow_ids_statement(cs_sow_id: str) -> SelectOfScalar[int] | SelectOfScalar[None]:
+    return (
+        select(PublicSow.id)
+        .where(PublicSow.sow_id == cs_sow_id)
+        .order_by(PublicSow.id.desc())  # type: ignore[union-attr]
+    )
+
+
+def _experiments_statement(public_sow_ids: List[Optional[int]]) -> SelectOfScalar[Experiment]:
+    return select(Experiment).where(
+        Experiment.sow_id.in_(public_sow_ids)  # type: ignore[attr-defined]
+    )
+
+
+def _opportunity_statement(sow_sid: int) -> SelectOfScalar[Opportunity]:
+    return (
+        select(Opportunity)
+        .where(
+            Opportunity.sid == sow_sid,
+            Opportunity.for_deletion == False,  # noqa: E712
+        )
+        .limit(1)
+    )
+
+
+@dataclass
+class PermissionsBundle:
+    """The SOW-specific data the permissions endpoint needs."""
+
+    sow_sid: int
+    cs_sow_id: Optional[str]
+    experiments: List[Experiment] = field(default_factory=list)
+    has_opportunity_platforms: bool = False
+
+
+def _permissions_bundle_statement(sow_id: int) -> Select[Any]:
+    """One SELECT over the tenant SOW with the opportunity lookup as a subquery.
+
+    Yields one row per experiment (a single row with a NULL experiment when there
+    are none); the opportunity flag repeats on every row.
+    """
+    public_sow_ids = select(PublicSow.id).where(PublicSow.sow_id == TenantSow.cs_sow_id)
+    has_opportunities = exists().where(
+        Opportunity.sid == TenantSow.sid,  # type: ignore[arg-type]
+        Opportunity.for_deletion == False,  # type: ignore[arg-type]  # noqa: E712
+    )
+    statement: Select[Any] = (
+        select(
+            TenantSow.sid,
+            TenantSow.cs_sow_id,
+            has_opportunities.label("opportunity_platforms"),
+            Experiment,
+        )
+        .select_from(TenantSow)
+        .outerjoin(
+            Experiment,
+            and_(
+                TenantSow.cs_sow_id != "",  # type: ignore[arg-type]
+                Experiment.sow_id.in_(public_sow_ids),  # type: ignore[attr-defined]
+            ),
+        )
+        .where(TenantSow.sid == sow_id)
+    )
+    return statement
+
+
+def _permissions_bundle(rows: Sequence[Any]) -> Optional[PermissionsBundle]:
+    if not rows:
+        return None
+    sid, cs_sow_id, has_opportunities, _ = rows[0]
+    return PermissionsBundle(
+        sow_sid=sid,
+        cs_sow_id=cs_sow_id,
+        experiments=[row[3] for row in rows if row[3] is not None],
+        has_opportunity_platforms=bool(has_opportunities),
+    )
+
+
 class PermissionsRepository:
     """Repository for data required by the permissions endpoint."""
 
     def __init__(self, db_provider: DBSessionProvider) -> None:
         self.db = db_provider
 
+    def get_permissions_bundle(
+        self, tenant_schema: str, sow_id: int
+    ) -> Optional[PermissionsBundle]:
+        """Return the SOW's experiments and opportunity flag in one query, or None."""
+        statement = _permissions_bundle_statement(sow_id)
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return _permissions_bundle(session.exec(statement).all())
+
     def get_sow(self, tenant_schema: str, sow_id: int) -> Optional[TenantSow]:
         """Return the TenantSow with the given sid, or None."""
-        with self.db.tenant_session(tenant_schema) as session:
-            stmt = select(TenantSow).where(TenantSow.sid == sow_id)
-            return session.exec(stmt).first()  # type: ignore[no-any-return]
-
-    def get_client_tier_id(self, org_id: str) -> Optional[int]:
-        """Return the tier_id for the cs_interface Client matching org_id."""
-        with self.db.session() as session:
-            stmt = select(Client.tier_id).where(Client.customer_id == org_id.lower())
-            return session.exec(stmt).first()  # type: ignore[no-any-return]
-
-    def get_feature_codes(self, tier_id: int) -> List[str]:
-        """Return all feature codes available for the given service tier."""
-        with self.db.session() as session:
-            stmt = (
-                select(ServiceFeature.code)
-                .join(TierFeature, TierFeature.feature_id == ServiceFeature.id)  # type: ignore[arg-type]
-                .where(TierFeature.tier_id == tier_id)
-            )
-            return list(session.exec(stmt).all())
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return session.exec(_sow_statement(sow_id)).first()  # type: ignore[no-any-return]
 
     def get_experiments(self, cs_sow_id: Optional[str]) -> List[Experiment]:
         """Return all Experiment rows associated with the given cs_sow_id.
@@ -49,32 +131,51 @@ class PermissionsRepository:
         """
         if not cs_sow_id:
             return []
-        with self.db.session() as session:
-            public_sow_ids_stmt = (
-                select(PublicSow.id)
-                .where(PublicSow.sow_id == cs_sow_id)
-                .order_by(PublicSow.id.desc())  # type: ignore[union-attr]
-            )
-            public_sow_ids = list(session.exec(public_sow_ids_stmt).all())
+        with self.db.session(read_only=True) as session:
+            public_sow_ids = list(session.exec(_public_sow_ids_statement(cs_sow_id)).all())
             if not public_sow_ids:
                 return []
-            exp_stmt = select(Experiment).where(
-                Experiment.sow_id.in_(public_sow_ids)  # type: ignore[attr-defined]
-            )
-            return list(session.exec(exp_stmt).all())
+            return list(session.exec(_experiments_statement(public_sow_ids)).all())
 
     def has_opportunity_platforms(self, tenant_schema: str, sow_sid: int) -> bool:
         """Return True if any non-deleted Opportunity row exists for the given sow."""
-        with self.db.tenant_session(tenant_schema) as session:
-            stmt = (
-                select(Opportunity)
-                .where(
-                    Opportunity.sid == sow_sid,
-                    Opportunity.for_deletion == False,  # noqa: E712
-                )
-                .limit(1)
-            )
-            return session.exec(stmt).first() is not None
-
-
-__all__ = ["PermissionsRepository"]
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return session.exec(_opportunity_statement(sow_sid)).first() is not None
+
+
+class AsyncPermissionsRepository:
+    """Async variant of `PermissionsRepository` for an `AsyncDBSessionProvider`."""
+
+    def __init__(self, db_provider: AsyncDBSessionProvider) -> None:
+        self.db = db_provider
+
+    async def get_permissions_bundle(
+        self, tenant_schema: str, sow_id: int
+    ) -> Optional[PermissionsBundle]:
+        """Return the SOW's experiments and opportunity flag in one query, or None."""
+        statement = _permissions_bundle_statement(sow_id)
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return _permissions_bundle((await session.exec(statement)).all())
+
+    async def get_sow(self, tenant_schema: str, sow_id: int) -> Optional[TenantSow]:
+        """Return the TenantSow with the given sid, or None."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return (await session.exec(_sow_statement(sow_id))).first()  # type: ignore[no-any-return]
+
+    async def get_experiments(self, cs_sow_id: Optional[str]) -> List[Experiment]:
+        """Return all Experiment rows associated with the given cs_sow_id."""
+        if not cs_sow_id:
+            return []
+        async with self.db.session(read_only=True) as session:
+            public_sow_ids = list((await session.exec(_public_sow_ids_statement(cs_sow_id))).all())
+            if not public_sow_ids:
+                return []
+            return list((await session.exec(_experiments_statement(public_sow_ids))).all())
+
+    async def has_opportunity_platforms(self, tenant_schema: str, sow_sid: int) -> bool:
+        """Return True if any non-deleted Opportunity row exists for the given sow."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return (await session.exec(_opportunity_statement(sow_sid))).first() is not None
+
+
+__all__ = ["AsyncPermissionsRepository", "PermissionsBundle", "PermissionsRepository"]
@@ -0,0 +1,91 @@
+"""Repositories for public-schema reference data.
+
+Client tiers and tier feature codes change rarely (typically once a week), so
+`CachedReferenceDataRepository` keeps them in process behind a TTL and explicit
+invalidation, in front of `ReferenceDataRepository`. A successful masterfile
+ingest invalidates this process's copy; other workers catch up within the TTL.
+"""
+
+from typing import Dict, List, Optional
+
+from sqlmodel import select
+
+from caching import TTLCache
+from database.db_session_provider import DBSessionProvider
+from database.public_models.models import Client, ServiceFeature, TierFeature
+
+
+class ReferenceDataRepository:
+    """Reads client tiers and tier features from the public schema."""
+
+    def __init__(self, db_provider: DBSessionProvider) -> None:
+        self.db = db_provider
+
+    def get_client_tier_id(self, org_id: str) -> Optional[int]:
+        """Return the tier_id for the cs_interface Client matching org_id."""
+        statement = select(Client.tier_id).where(Client.customer_id == org_id.lower())
+        with self.db.session(read_only=True) as session:
+            return session.exec(statement).first()  # type: ignore[no-any-return]
+
+    def get_feature_codes(self, tier_id: int) -> List[str]:
+        """Return all feature codes available for the given service tier."""
+        statement = (
+            select(ServiceFeature.code)
+            .join(TierFeature, TierFeature.feature_id == ServiceFeature.id)  # type: ignore[arg-type]
+            .where(TierFeature.tier_id == tier_id)
+        )
+        with self.db.session(read_only=True) as session:
+            return list(session.exec(statement).all())
+
+    def get_feature_codes_for_org(self, org_id: str) -> List[str]:
+        """Return the feature codes of the org's tier ([] when it has none)."""
+        tier_id = self.get_client_tier_id(org_id)
+        return self.get_feature_codes(tier_id) if tier_id is not None else []
+
+
+class CachedReferenceDataRepository:
+    """`ReferenceDataRepository` behind bounded TTL caches with hit/miss counters.
+
+    Example:
+        reference_data = CachedReferenceDataRepository(ReferenceDataRepository(db))
+        reference_data.invalidate()  # after tiers, features or masterfiles change
+    """
+
+    def __init__(
+        self,
+        repository: ReferenceDataRepository,
+        ttl: float = 300.0,
+        max_clients: int = 10_000,
+        max_tiers: int = 1_000,
+    ) -> None:
+        self.repository = repository
+        self.client_tiers: TTLCache[str, Optional[int]] = TTLCache(max_clients, ttl=ttl)
+        self.tier_features: TTLCache[int, List[str]] = TTLCache(max_tiers, ttl=ttl)
+
+    def get_client_tier_id(self, org_id: str) -> Optional[int]:
+        key = org_id.lower()
+        return self.client_tiers.get_or_load(key, lambda: self.repository.get_client_tier_id(key))
+
+    def get_feature_codes(self, tier_id: int) -> List[str]:
+        return self.tier_features.get_or_load(
+            tier_id, lambda: self.repository.get_feature_codes(tier_id)
+        )
+
+    def get_feature_codes_for_org(self, org_id: str) -> List[str]:
+        """Return the feature codes of the org's tier ([] when it has none)."""
+        tier_id = self.get_client_tier_id(org_id)
+        return self.get_feature_codes(tier_id) if tier_id is not None else []
+
+    def invalidate(self) -> None:
+        """Drop every cached entry; the next lookups reload from the database."""
+        self.client_tiers.invalidate()
+        self.tier_features.invalidate()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "client_tiers": self.client_tiers.stats(),
+            "tier_features": self.tier_features.stats(),
+        }
+
+
+__all__ = ["CachedReferenceDataRepository", "ReferenceDataRepository"]
@@ -0,0 +1,140 @@
+"""Reverse lookups over JSON-array link columns.
+
+Tenant models keep several many-to-many links as JSON arrays on one side
+(`Source.topic_ids`, `InsightSource.insight_ids`,
+`GrowthOpportunitySource.growth_opportunity_ids`, `GrowthOpportunity.topic_ids`).
+`ReverseLookupRepository` answers the other direction ("which sources mention
+topic X?") with `database.json_array.json_array_contains`, which the GIN indexes
+in `database/sql/json_array_indexes.sql` serve without scanning the table.
+`AsyncReverseLookupRepository` runs the same statements on an
+`AsyncDBSessionProvider`.
+"""
+
+from typing import List
+
+from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from database.db_session_provider import AsyncDBSessionProvider, DBSessionProvider
+from database.json_array import json_array_contains
+from database.tenant_models.models import (
+    GrowthOpportunity,
+    GrowthOpportunitySource,
+    InsightSource,
+    Source,
+)
+
+
+def _sources_for_topic_statement(tid: int) -> SelectOfScalar[Source]:
+    return (
+        select(Source)
+        .where(
+            json_array_contains(Source.topic_ids, tid),
+            Source.for_deletion == False,  # noqa: E712
+        )
+        .order_by(Source.soid)  # type: ignore[arg-type]
+    )
+
+
+def _insight_sources_statement(insight_id: int) -> SelectOfScalar[InsightSource]:
+    return (
+        select(InsightSource)
+        .where(json_array_contains(InsightSource.insight_ids, insight_id))
+        .order_by(InsightSource.id)  # type: ignore[arg-type]
+    )
+
+
+def _growth_opportunity_sources_statement(goid: int) -> SelectOfScalar[GrowthOpportunitySource]:
+    return (
+        select(GrowthOpportunitySource)
+        .where(
+            json_array_contains(GrowthOpportunitySource.growth_opportunity_ids, goid),
+            GrowthOpportunitySource.for_deletion == False,  # noqa: E712
+        )
+        .order_by(GrowthOpportunitySource.gosid)  # type: ignore[arg-type]
+    )
+
+
+def _growth_opportunities_for_topic_statement(topic_id: str) -> SelectOfScalar[GrowthOpportunity]:
+    return (
+        select(GrowthOpportunity)
+        .where(
+            json_array_contains(GrowthOpportunity.topic_ids, topic_id),
+            GrowthOpportunity.for_deletion == False,  # noqa: E712
+        )
+        .order_by(GrowthOpportunity.goid)  # type: ignore[arg-type]
+    )
+
+
+class ReverseLookupRepository:
+    """Finds the rows whose JSON-array links mention a given id.
+
+    Example:
+        repo = ReverseLookupRepository(db)  # where `db` is the manager.db object
+    """
+
+    def __init__(self, db_provider: DBSessionProvider) -> None:
+        self.db = db_provider
+
+    def get_sources_for_topic(self, tenant_schema: str, tid: int) -> List[Source]:
+        """Return the Sources whose `topic_ids` hold the topic's `tid`."""
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list(session.exec(_sources_for_topic_statement(tid)).all())
+
+    def get_insight_sources(self, tenant_schema: str, insight_id: int) -> List[InsightSource]:
+        """Return the InsightSources whose `insight_ids` hold `insight_id`."""
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list(session.exec(_insight_sources_statement(insight_id)).all())
+
+    def get_growth_opportunity_sources(
+        self, tenant_schema: str, goid: int
+    ) -> List[GrowthOpportunitySource]:
+        """Return the GrowthOpportunitySources whose `growth_opportunity_ids` hold `goid`."""
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list(session.exec(_growth_opportunity_sources_statement(goid)).all())
+
+    def get_growth_opportunities_for_topic(
+        self, tenant_schema: str, topic_id: str
+    ) -> List[GrowthOpportunity]:
+        """Return the GrowthOpportunities whose `topic_ids` hold `topic_id`."""
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list(session.exec(_growth_opportunities_for_topic_statement(topic_id)).all())
+
+
+class AsyncReverseLookupRepository:
+    """Async variant of `ReverseLookupRepository` for an `AsyncDBSessionProvider`.
+
+    Example:
+        repo = AsyncReverseLookupRepository(async_db)  # where `async_db` is manager.async_db
+    """
+
+    def __init__(self, db_provider: AsyncDBSessionProvider) -> None:
+        self.db = db_provider
+
+    async def get_sources_for_topic(self, tenant_schema: str, tid: int) -> List[Source]:
+        """Return the Sources whose `topic_ids` hold the topic's `tid`."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list((await session.exec(_sources_for_topic_statement(tid))).all())
+
+    async def get_insight_sources(self, tenant_schema: str, insight_id: int) -> List[InsightSource]:
+        """Return the InsightSources whose `insight_ids` hold `insight_id`."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list((await session.exec(_insight_sources_statement(insight_id))).all())
+
+    async def get_growth_opportunity_sources(
+        self, tenant_schema: str, goid: int
+    ) -> List[GrowthOpportunitySource]:
+        """Return the GrowthOpportunitySources whose `growth_opportunity_ids` hold `goid`."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list((await session.exec(_growth_opportunity_sources_statement(goid))).all())
+
+    async def get_growth_opportunities_for_topic(
+        self, tenant_schema: str, topic_id: str
+    ) -> List[GrowthOpportunity]:
+        """Return the GrowthOpportunities whose `topic_ids` hold `topic_id`."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            statement = _growth_opportunities_for_topic_statement(topic_id)
+            return list((await session.exec(statement)).all())
+
+
+__all__ = ["AsyncReverseLookupRepository", "ReverseLookupRepository"]
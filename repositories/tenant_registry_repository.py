@@ -0,0 +1,138 @@
+"""Resolution of a token's `orgId` to the tenant's PostgreSQL schema.
+
+The mapping lives in `CIClient` (`client_interface_client.org_id` → `schema_name`)
+in the public schema. `TenantRegistry` keeps it in process as an immutable map,
+loaded once at startup and swapped whole when `refresh` sees the table's content
+digest change,
+so resolving a tenant never touches the database and unknown tenants are
+rejected before a tenant session is opened.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import anyio
+from sqlalchemy import Select, func, literal
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlmodel import select
+
+from database.db_session_provider import DBSessionProvider
+from database.public_models.models import CIClient
+
+logger = logging.getLogger("uvicorn.error")
+
+
+@dataclass(frozen=True)
+class Tenant:
+    """A known tenant: the token's org id and the schema its tenant data lives in."""
+
+    org_id: str
+    schema_name: str
+
+
+def _fingerprint_statement(dialect: str) -> Select[Any]:
+    """One value derived from every (org_id, schema_name) pair, in id order.
+
+    PostgreSQL returns the md5 of the concatenated pairs; other dialects (sqlite
+    in tests) return the concatenation itself.
+    """
+    columns = CIClient.__table__.c  # type: ignore[attr-defined]
+    entry = (columns.org_id + ":" + columns.schema_name).label("entry")
+    if dialect == "postgresql":
+        pairs = func.string_agg(entry, aggregate_order_by(literal(","), columns.id))
+        return select(func.md5(pairs))
+    ordered = select(entry).order_by(columns.id).subquery()
+    return select(func.group_concat(ordered.c.entry, ","))
+
+
+class TenantRegistryRepository:
+    """Reads the org id → schema mapping of `CIClient` from the public schema.
+
+    Example:
+        repo = TenantRegistryRepository(db)  # where `db` is the manager.db object
+    """
+
+    def __init__(self, db_provider: DBSessionProvider) -> None:
+        self.db = db_provider
+
+    def get_tenants(self) -> Dict[str, Tenant]:
+        """Return every tenant keyed by its lowercased org id."""
+        statement = select(CIClient.org_id, CIClient.schema_name)
+        with self.db.session(read_only=True) as session:
+            return {
+                org_id.lower(): Tenant(org_id, schema_name.lower())
+                for org_id, schema_name in session.exec(statement).all()
+            }
+
+    def get_fingerprint(self) -> Tuple[Any, ...]:
+        """A digest of the whole mapping, computed in the database, that changes when
+        any tenant is added, removed, or has its org id or schema changed."""
+        with self.db.session(read_only=True) as session:
+            statement = _fingerprint_statement(session.get_bind().dialect.name)
+            row: Optional[Sequence[Any]] = session.exec(statement).first()
+        return tuple(row) if row is not None else ()
+
+
+class TenantRegistry:
+    """`TenantRegistryRepository` held in memory, refreshed by a change-detection probe.
+
+    Example:
+        registry = TenantRegistry(TenantRegistryRepository(db))
+        registry.load()  # at startup
+        tenant = registry.resolve(claims["orgId"])  # None for unknown tenants
+    """
+
+    def __init__(self, repository: TenantRegistryRepository) -> None:
+        self.repository = repository
+        self._tenants: Mapping[str, Tenant] = MappingProxyType({})
+        self._fingerprint: Optional[Tuple[Any, ...]] = None
+        self._counters = {"probes": 0, "reloads": 0, "rejected": 0, "refresh_errors": 0}
+        self._loaded_at = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self._fingerprint is not None
+
+    def load(self) -> None:
+        """(Re)load the whole mapping and remember the fingerprint it was read at."""
+        fingerprint = self.repository.get_fingerprint()
+        self._tenants = MappingProxyType(self.repository.get_tenants())
+        self._fingerprint = fingerprint
+        self._loaded_at = time.monotonic()
+        self._counters["reloads"] += 1
+
+    def refresh(self) -> bool:
+        """Reload only when the fingerprint moved; return whether it did."""
+        self._counters["probes"] += 1
+        if self.loaded and self.repository.get_fingerprint() == self._fingerprint:
+            return False
+        self.load()
+        return True
+
+    async def refresh_forever(self, interval: float) -> None:
+        """Call `refresh` every `interval` seconds off the event loop, keeping the
+        last map when a probe fails."""
+        while True:
+            await anyio.sleep(interval)
+            try:
+                await anyio.to_thread.run_sync(self.refresh)
+            except Exception:
+                self._counters["refresh_errors"] += 1
+                logger.exception("Tenant registry refresh failed; keeping the last mapping")
+
+    def resolve(self, org_id: str) -> Optional[Tenant]:
+        tenant = self._tenants.get(org_id.lower())
+        if tenant is None:
+            self._counters["rejected"] += 1
+        return tenant
+
+    def stats(self) -> Dict[str, float]:
+        stats: Dict[str, float] = {"tenants": len(self._tenants), **self._counters}
+        stats["age_seconds"] = time.monotonic() - self._loaded_at if self.loaded else 0.0
+        return stats
+
+
+__all__ = ["Tenant", "TenantRegistry", "TenantRegistryRepository"]
@@ -0,0 +1,169 @@
+"""Repository for a topic's detail graph.
+
+`TopicGraphRepository` loads a topic with its trend, drivers, sources,
+opportunities and latest maturity scores in a fixed number of queries (one per
+relation, each batched over the topic), however many related rows there are.
+`AsyncTopicGraphRepository` runs the same statements on an
+`AsyncDBSessionProvider`.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import aliased
+from sqlmodel import select
+from sqlmodel.sql.expression import Select, SelectOfScalar
+
+from database.db_session_provider import AsyncDBSessionProvider, DBSessionProvider
+from database.tenant_models.models import (
+    Driver,
+    MaturityScore,
+    Opportunity,
+    Source,
+    Topic,
+    Topic2Driver,
+    Topic2Opportunity,
+    Topic2Source,
+    Trend,
+)
+
+# Queries `get_graph` runs for a topic that exists, whatever its fan-out.
+GRAPH_QUERY_COUNT = 5
+
+
+@dataclass
+class TopicGraph:
+    """A topic and its related rows; `drivers` pairs each edge with its driver."""
+
+    topic: Topic
+    trend: Optional[Trend] = None
+    drivers: List[Tuple[Topic2Driver, Driver]] = field(default_factory=list)
+    sources: List[Source] = field(default_factory=list)
+    opportunities: List[Opportunity] = field(default_factory=list)
+    maturity_scores: List[MaturityScore] = field(default_factory=list)
+
+
+def _topic_with_trend_statement(topic_id: str) -> Select[Tuple[Topic, Trend]]:
+    """Latest-sid topic for `topic_id` (as `TopicRepository.get_by_topic_id`) and its trend."""
+    return (
+        select(Topic, Trend)
+        .outerjoin(Trend, Trend.ssid == Topic.ssid)  # type: ignore[arg-type]
+        .where(Topic.topic_id == topic_id, Topic.for_deletion == False)  # noqa: E712
+        .order_by(Topic.sid.desc())  # type: ignore[attr-defined]
+        .limit(1)
+    )
+
+
+def _drivers_statement(tid: int) -> Select[Tuple[Topic2Driver, Driver]]:
+    return (
+        select(Topic2Driver, Driver)
+        .join(Driver, Driver.did == Topic2Driver.driver_did)  # type: ignore[arg-type]
+        .where(Topic2Driver.topic_tid == tid, Driver.for_deletion == False)  # noqa: E712
+        .order_by(Topic2Driver.strength.desc().nulls_last(), Driver.did)  # type: ignore[union-attr, arg-type]
+    )
+
+
+def _sources_statement(tid: int) -> SelectOfScalar[Source]:
+    return (
+        select(Source)
+        .join(Topic2Source, Topic2Source.source_soid == Source.soid)  # type: ignore[arg-type]
+        .where(Topic2Source.topic_tid == tid, Source.for_deletion == False)  # noqa: E712
+        .order_by(Source.soid)  # type: ignore[arg-type]
+    )
+
+
+def _opportunities_statement(tid: int) -> SelectOfScalar[Opportunity]:
+    return (
+        select(Opportunity)
+        .join(Topic2Opportunity, Topic2Opportunity.opportunity_oid == Opportunity.oid)  # type: ignore[arg-type]
+        .where(Topic2Opportunity.topic_tid == tid, Opportunity.for_deletion == False)  # noqa: E712
+        .order_by(Opportunity.oid)  # type: ignore[arg-type]
+    )
+
+
+def _latest_maturity_scores_statement(tid: int) -> SelectOfScalar[MaturityScore]:
+    """The most recently updated score of each category for the topic."""
+    ranked = (
+        select(
+            MaturityScore,
+            func.row_number()
+            .over(
+                partition_by=MaturityScore.category,
+                order_by=(MaturityScore.updated_at.desc(), MaturityScore.id.desc()),  # type: ignore[attr-defined, union-attr]
+            )
+            .label("rank"),
+        )
+        .where(MaturityScore.topic_id == tid)
+        .subquery()
+    )
+    latest = aliased(MaturityScore, ranked)
+    return select(latest).where(ranked.c.rank == 1).order_by(ranked.c.category)
+
+
+class TopicGraphRepository:
+    """Loads `TopicGraph`s from an injectable DB provider.
+
+    Example:
+        repo = TopicGraphRepository(db)  # where `db` is the manager.db object
+    """
+
+    def __init__(self, db_provider: DBSessionProvider) -> None:
+        self.db = db_provider
+
+    def get_graph(self, tenant_schema: str, topic_id: str) -> Optional[TopicGraph]:
+        """Return the graph of the topic with `topic_id` (or None) in GRAPH_QUERY_COUNT queries."""
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            row: Any = session.exec(_topic_with_trend_statement(topic_id)).first()
+            if row is None:
+                return None
+            topic, trend = row
+            tid = topic.tid
+            return TopicGraph(
+                topic=topic,
+                trend=trend,
+                drivers=[(edge, driver) for edge, driver in session.exec(_drivers_statement(tid))],
+                sources=list(session.exec(_sources_statement(tid)).all()),
+                opportunities=list(session.exec(_opportunities_statement(tid)).all()),
+                maturity_scores=list(session.exec(_latest_maturity_scores_statement(tid)).all()),
+            )
+
+
+class AsyncTopicGraphRepository:
+    """Async variant of `TopicGraphRepository` for an `AsyncDBSessionProvider`.
+
+    Example:
+        repo = AsyncTopicGraphRepository(async_db)  # where `async_db` is manager.async_db
+    """
+
+    def __init__(self, db_provider: AsyncDBSessionProvider) -> None:
+        self.db = db_provider
+
+    async def get_graph(self, tenant_schema: str, topic_id: str) -> Optional[TopicGraph]:
+        """Return the graph of the topic with `topic_id` (or None) in GRAPH_QUERY_COUNT queries."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            row: Any = (await session.exec(_topic_with_trend_statement(topic_id))).first()
+            if row is None:
+                return None
+            topic, trend = row
+            tid = topic.tid
+            drivers = await session.exec(_drivers_statement(tid))
+            sources = await session.exec(_sources_statement(tid))
+            opportunities = await session.exec(_opportunities_statement(tid))
+            maturity_scores = await session.exec(_latest_maturity_scores_statement(tid))
+            return TopicGraph(
+                topic=topic,
+                trend=trend,
+                drivers=[(edge, driver) for edge, driver in drivers],
+                sources=list(sources.all()),
+                opportunities=list(opportunities.all()),
+                maturity_scores=list(maturity_scores.all()),
+            )
+
+
+__all__ = [
+    "GRAPH_QUERY_COUNT",
+    "AsyncTopicGraphRepository",
+    "TopicGraph",
+    "TopicGraphRepository",
+]
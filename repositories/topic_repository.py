@@ -1,15 +1,278 @@
 """Repository for the `Topic` model.
 
 This module provides `TopicRepository`, which accepts a DB session provider
-so callers (FastAPI dependencies or tests) can inject the DB object.
+so callers (FastAPI dependencies or tests) can inject the DB object, and
+`AsyncTopicRepository`, its counterpart for an `AsyncDBSessionProvider`.
+Both build their statements from the same helpers below.
+
+`get_page` reads one keyset page of the topic list, ordered by `(sort, tid)` and
+narrowed by `TopicFilter`s, so a deep page costs the same index range seek as
+the first one. A page that may cross from the values into the NULLs reads one
+range on each side, as the two halves of a UNION ALL.
+
+Queries with `fields` push the projection into the SELECT: only those columns
+are read, and rows come back as plain dicts without ORM hydration.
+
+`get_topics_version` is a cheap probe over the tenant's SOW rows and an aggregate
+of its live topics: loading a new masterfile, or adding, retiring or re-dating a
+topic, changes it, so it can key caches and ETags of the (much larger) topic list.
+Topics edited in place must bump their `load_date` to be seen.
+
+The version probe and the columnar page read are coalesced through
+`repository_flights`: identical calls for a tenant that overlap in time share
+one query and its result. Only reads returning plain values are coalesced; ORM
+rows and dicts belong to the caller's unit of work or may be changed by it.
 """
 
-from typing import List, Optional, cast
+import hashlib
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
+from sqlalchemy import ColumnElement, Select, Subquery, and_, func, literal, tuple_, union_all
+from sqlalchemy.orm import aliased
 from sqlmodel import select
+from sqlmodel.sql.expression import SelectOfScalar
+
+from caching.single_flight import coalesce, coalesce_async, repository_flights
+from database.db_session_provider import AsyncDBSessionProvider, DBSessionProvider
+from database.tenant_models.models import TenantSow, Topic
+
+
+def _all_statement() -> SelectOfScalar[Topic]:
+    return select(Topic).where(Topic.for_deletion == False)  # noqa: E712
+
+
+def _by_sow_id_statement(sow_id: int) -> SelectOfScalar[Topic]:
+    return select(Topic).where(Topic.for_deletion == False, Topic.sid == sow_id)  # noqa: E712
+
+
+def _by_id_statement(tid: int) -> SelectOfScalar[Topic]:
+    return select(Topic).where(Topic.tid == tid, Topic.for_deletion == False)  # noqa: E712
+
+
+def _by_topic_id_statement(topic_id: str) -> SelectOfScalar[Topic]:
+    return (
+        select(Topic)
+        .where(Topic.topic_id == topic_id, Topic.for_deletion == False)  # noqa: E712
+        .order_by(Topic.sid.desc())  # type: ignore[attr-defined]
+    )
+
+
+# Columns the topic list can be sorted and filtered on.
+SORTABLE_TOPIC_FIELDS = (
+    "tid",
+    "topic_growth_normalized",
+    "topic_consensus_normalized",
+    "average_sizing",
+    "topic_status",
+    "new_discovery",
+)
+
+
+def sort_value(field: str, value: Any) -> Any:
+    """Return a cursor's `value` for sort column `field` as that column's Python type.
+
+    Raises ValueError when it is not one (bools are not ints, floats must be
+    finite, ints are accepted for floats) or is None for a NOT NULL column.
+    """
+    column = Topic.__table__.c[field]  # type: ignore[attr-defined]
+    if value is None:
+        if column.nullable:
+            return None
+    elif column.type.python_type is float:
+        if type(value) in (int, float) and math.isfinite(value):
+            return float(value)
+    elif type(value) is column.type.python_type:
+        return value
+    raise ValueError(f"Invalid {field} value: {value!r}")
+
+
+@dataclass(frozen=True)
+class TopicFilter:
+    """A `field <op> value` condition; `op` is "eq", "in" (tuple value), "ge" or "le"."""
+
+    field: str
+    op: str
+    value: Any
+
+
+def _latest_by_topic_ids_statement(topic_ids: Sequence[str]) -> SelectOfScalar[Topic]:
+    """The latest-sid row of each topic_id (as in `_by_topic_id_statement`), in one query."""
+    ranked = (
+        select(
+            Topic,
+            func.row_number()
+            .over(
+                partition_by=Topic.topic_id,
+                order_by=(Topic.sid.desc(), Topic.tid.desc()),  # type: ignore[attr-defined, union-attr]
+            )
+            .label("rank"),
+        )
+        .where(Topic.topic_id.in_(topic_ids), Topic.for_deletion == False)  # type: ignore[attr-defined]  # noqa: E712
+        .subquery()
+    )
+    latest = aliased(Topic, ranked)
+    return select(latest).where(ranked.c.rank == 1)
+
+
+@dataclass(frozen=True)
+class TopicListQuery:
+    """One page of a tenant's topic list, optionally scoped to a SOW.
+
+    Rows are ordered by `(sort, tid)`, both descending when `descending`; NULLs
+    sort as the largest values, as in PostgreSQL. The page starts after the row
+    at `(after_value, after_tid)`. `fields` restricts the Topic columns read;
+    None reads whole Topic rows. `columnar` selects the column-oriented response
+    layout; it is part of the query so cached pages and ETags tell layouts apart.
+    """
+
+    limit: int
+    after_tid: Optional[int] = None
+    sow_id: Optional[int] = None
+    fields: Optional[Tuple[str, ...]] = None
+    filters: Tuple[TopicFilter, ...] = ()
+    sort: str = "tid"
+    descending: bool = False
+    after_value: Any = None
+    columnar: bool = False
+
+    @property
+    def sort_key(self) -> str:
+        """The sort as given in the `sort=` parameter, e.g. `-average_sizing`."""
+        return f"-{self.sort}" if self.descending else self.sort
+
+
+def _filter_clause(topic_filter: TopicFilter) -> ColumnElement[bool]:
+    column = Topic.__table__.c[topic_filter.field]  # type: ignore[attr-defined]
+    if topic_filter.op == "in":
+        return column.in_(topic_filter.value)  # type: ignore[no-any-return]
+    if topic_filter.op == "ge":
+        return column >= topic_filter.value  # type: ignore[no-any-return]
+    if topic_filter.op == "le":
+        return column <= topic_filter.value  # type: ignore[no-any-return]
+    return column == topic_filter.value  # type: ignore[no-any-return]
+
+
+def _keyset_ranges(query: TopicListQuery) -> List[Optional[ColumnElement[bool]]]:
+    """Predicates of the index ranges holding the rows after `(after_value, after_tid)`,
+    in page order; None means the whole (filtered) list.
+
+    Each predicate is a single range of the `(sort, tid)` index. A page that may
+    cross the boundary between the values and the NULLs (last ascending, first
+    descending) reads one range on each side of it.
+    """
+    if query.after_tid is None:
+        return [None]
+    tid = Topic.__table__.c.tid  # type: ignore[attr-defined]
+    after_tid = tid < query.after_tid if query.descending else tid > query.after_tid
+    if query.sort == "tid":
+        return [after_tid]
+    column = Topic.__table__.c[query.sort]  # type: ignore[attr-defined]
+    if query.after_value is None:
+        in_nulls = and_(column.is_(None), after_tid)
+        return [in_nulls, column.is_not(None)] if query.descending else [in_nulls]
+    position = tuple_(column, tid)
+    after = tuple_(literal(query.after_value), literal(query.after_tid))
+    if query.descending:
+        return [position < after]
+    return [position > after, column.is_(None)]
+
+
+def _page_order(query: TopicListQuery, columns: Any) -> List[Any]:
+    """ORDER BY of a page over `columns` (the Topic table's, or a subquery's)."""
+    tid = columns.tid
+    if query.sort == "tid":
+        return [tid.desc() if query.descending else tid.asc()]
+    column = columns[query.sort]
+    if query.descending:
+        return [column.desc().nulls_first(), tid.desc()]
+    return [column.asc().nulls_last(), tid.asc()]
+
+
+def _page_ranges(query: TopicListQuery) -> List[SelectOfScalar[Topic]]:
+    """One ordered, limited statement per keyset range of the page."""
+    statement = _by_sow_id_statement(query.sow_id) if query.sow_id is not None else _all_statement()
+    for topic_filter in query.filters:
+        statement = statement.where(_filter_clause(topic_filter))
+    order = _page_order(query, Topic.__table__.c)  # type: ignore[attr-defined]
+    ranges = []
+    for predicate in _keyset_ranges(query):
+        ranged = statement.where(predicate) if predicate is not None else statement
+        # One extra row tells the caller whether another page follows.
+        ranges.append(ranged.order_by(*order).limit(query.limit + 1))
+    return ranges
+
+
+def _page_union(ranges: Sequence[Select[Any]]) -> Subquery:
+    """The ranges of a page that may cross the NULL boundary, as one UNION ALL subquery."""
+    parts = [select(*ranged.subquery().c) for ranged in ranges]
+    return union_all(*parts).subquery("page")
+
 
-from database.db_session_provider import DBSessionProvider
-from database.tenant_models.models import Topic
+def _page_statement(query: TopicListQuery) -> SelectOfScalar[Topic]:
+    ranges = _page_ranges(query)
+    if len(ranges) == 1:
+        return ranges[0]
+    page = _page_union(ranges)
+    return select(aliased(Topic, page)).order_by(*_page_order(query, page.c)).limit(query.limit + 1)
+
+
+def _page_columns_statement(query: TopicListQuery, fields: Sequence[str]) -> Select[Any]:
+    """`_page_statement` reading only `fields`, which include `tid` and the sort column."""
+    ranges = [_projected(ranged, fields) for ranged in _page_ranges(query)]
+    if len(ranges) == 1:
+        return ranges[0]
+    page = _page_union(ranges)
+    statement: Select[Any] = (
+        select(*page.c).order_by(*_page_order(query, page.c)).limit(query.limit + 1)
+    )
+    return statement
+
+
+def _projected(statement: SelectOfScalar[Topic], fields: Sequence[str]) -> Select[Any]:
+    return statement.with_only_columns(*(Topic.__table__.c[name] for name in fields))  # type: ignore[attr-defined]
+
+
+def _page_fields(query: TopicListQuery) -> Tuple[str, ...]:
+    """The requested fields, plus the `tid` and sort value the next cursor needs."""
+    fields = query.fields or ()
+    return tuple(dict.fromkeys(("tid", query.sort, *fields)))
+
+
+def _column_fields(query: TopicListQuery) -> Tuple[str, ...]:
+    """Like `_page_fields`, with every Topic column when no fields are requested."""
+    fields = query.fields or tuple(Topic.__table__.c.keys())  # type: ignore[attr-defined]
+    return tuple(dict.fromkeys(("tid", query.sort, *fields)))
+
+
+def _sow_versions_statement() -> Select[Any]:
+    statement: Select[Any] = (
+        select(TenantSow.sid, TenantSow.masterfile_version, TenantSow.load_date)
+        .where(TenantSow.for_deletion == False)  # noqa: E712
+        .order_by(TenantSow.sid)  # type: ignore[arg-type]
+    )
+    return statement
+
+
+def _topic_versions_statement() -> Select[Any]:
+    statement: Select[Any] = select(
+        func.count(Topic.tid),  # type: ignore[arg-type]
+        func.max(Topic.tid),
+        func.max(Topic.masterfile_version),
+        func.max(Topic.load_date),
+    ).where(
+        Topic.for_deletion == False  # noqa: E712
+    )
+    return statement
+
+
+def _topics_version(sows: Sequence[Sequence[Any]], topics: Optional[Sequence[Any]]) -> str:
+    """Digest of each SOW's (sid, masterfile_version, load_date), in sid order, and of
+    the live topics' count, largest tid, masterfile_version and load_date."""
+    parts = [tuple(row) for row in sows]
+    parts.append(tuple(topics) if topics is not None else ())
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:16]
 
 
 class TopicRepository:
@@ -24,35 +287,161 @@ class TopicRepository:
 
     def get_all(self, tenant_schema: str) -> List[Topic]:
         """Return all non-deleted Topic rows for a tenant."""
-        with self.db.tenant_session(tenant_schema) as session:
-            statement = select(Topic).where(Topic.for_deletion == False)  # noqa: E712
-            return list(session.exec(statement).all())
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list(session.exec(_all_statement()).all())
 
     def get_all_by_sow_id(self, tenant_schema: str, sow_id: int) -> List[Topic]:
         """Return all non-deleted Topic rows for a given sow_id."""
-        with self.db.tenant_session(tenant_schema) as session:
-            statement = select(Topic).where(
-                Topic.for_deletion == False, Topic.sid == sow_id  # noqa: E712
-            )
-            return list(session.exec(statement).all())
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list(session.exec(_by_sow_id_statement(sow_id)).all())
+
+    def get_page(self, tenant_schema: str, query: TopicListQuery) -> List[Topic]:
+        """Return up to `query.limit + 1` Topic rows after `query.after_tid`, by `tid`."""
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list(session.exec(_page_statement(query)).all())
+
+    def get_page_fields(self, tenant_schema: str, query: TopicListQuery) -> List[Dict[str, Any]]:
+        """Like `get_page`, reading only `query.fields` (and `tid`) into dicts."""
+        fields = _page_fields(query)
+        statement = _page_columns_statement(query, fields)
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            rows = session.connection().execute(statement).all()
+        return [dict(zip(fields, row)) for row in rows]
+
+    @coalesce(repository_flights)
+    def get_page_columns(
+        self, tenant_schema: str, query: TopicListQuery
+    ) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+        """Like `get_page_fields`, returning the column names and the rows as plain tuples."""
+        fields = _column_fields(query)
+        statement = _page_columns_statement(query, fields)
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            rows = session.connection().execute(statement).tuples().all()
+        return fields, list(rows)
 
     def get_by_id(self, tenant_schema: str, tid: int) -> Optional[Topic]:
         """Return a single Topic by its `tid` (or None)."""
-        statement = select(Topic).where(Topic.tid == tid, Topic.for_deletion == False)  # noqa: E712
-        with self.db.tenant_session(tenant_schema) as session:
-            result = session.exec(statement).first()
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            result = session.exec(_by_id_statement(tid)).first()
             return cast(Optional[Topic], result)
 
     def get_by_topic_id(self, tenant_schema: str, topic_id: str) -> Optional[Topic]:
         """Return a single Topic by its `topic_id` (or None)."""
-        statement = (
-            select(Topic)
-            .where(Topic.topic_id == topic_id, Topic.for_deletion == False)  # noqa: E712
-            .order_by(Topic.sid.desc())  # type: ignore[attr-defined]
-        )
-        with self.db.tenant_session(tenant_schema) as session:
-            result = session.exec(statement).first()
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            result = session.exec(_by_topic_id_statement(topic_id)).first()
             return cast(Optional[Topic], result)
 
+    def get_by_topic_ids(self, tenant_schema: str, topic_ids: Sequence[str]) -> List[Topic]:
+        """Return the latest Topic of each of `topic_ids` that exists, in one query."""
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list(session.exec(_latest_by_topic_ids_statement(topic_ids)).all())
+
+    def get_fields_by_topic_id(
+        self, tenant_schema: str, topic_id: str, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Return only `fields` of a single Topic by its `topic_id` (or None)."""
+        statement = _projected(_by_topic_id_statement(topic_id), fields)
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            row = session.connection().execute(statement).first()
+        return dict(zip(fields, row)) if row is not None else None
+
+    @coalesce(repository_flights)
+    def get_topics_version(self, tenant_schema: str) -> str:
+        """Return a version string that changes whenever the tenant's SOWs or topics do."""
+        with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            sows = session.exec(_sow_versions_statement()).all()
+            return _topics_version(sows, session.exec(_topic_versions_statement()).first())
+
+
+class AsyncTopicRepository:
+    """Async variant of `TopicRepository` for an `AsyncDBSessionProvider`.
+
+    Example:
+        repo = AsyncTopicRepository(async_db)  # where `async_db` is manager.async_db
+    """
+
+    def __init__(self, db_provider: AsyncDBSessionProvider) -> None:
+        self.db = db_provider
+
+    async def get_all(self, tenant_schema: str) -> List[Topic]:
+        """Return all non-deleted Topic rows for a tenant."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list((await session.exec(_all_statement())).all())
+
+    async def get_all_by_sow_id(self, tenant_schema: str, sow_id: int) -> List[Topic]:
+        """Return all non-deleted Topic rows for a given sow_id."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list((await session.exec(_by_sow_id_statement(sow_id))).all())
+
+    async def get_page(self, tenant_schema: str, query: TopicListQuery) -> List[Topic]:
+        """Return up to `query.limit + 1` Topic rows after `query.after_tid`, by `tid`."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list((await session.exec(_page_statement(query))).all())
+
+    async def get_page_fields(
+        self, tenant_schema: str, query: TopicListQuery
+    ) -> List[Dict[str, Any]]:
+        """Like `get_page`, reading only `query.fields` (and `tid`) into dicts."""
+        fields = _page_fields(query)
+        statement = _page_columns_statement(query, fields)
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            connection = await session.connection()
+            rows = (await connection.execute(statement)).all()
+        return [dict(zip(fields, row)) for row in rows]
+
+    @coalesce_async(repository_flights)
+    async def get_page_columns(
+        self, tenant_schema: str, query: TopicListQuery
+    ) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+        """Like `get_page_fields`, returning the column names and the rows as plain tuples."""
+        fields = _column_fields(query)
+        statement = _page_columns_statement(query, fields)
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            connection = await session.connection()
+            rows = (await connection.execute(statement)).tuples().all()
+        return fields, list(rows)
+
+    async def get_by_id(self, tenant_schema: str, tid: int) -> Optional[Topic]:
+        """Return a single Topic by its `tid` (or None)."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            result = (await session.exec(_by_id_statement(tid))).first()
+            return cast(Optional[Topic], result)
+
+    async def get_by_topic_id(self, tenant_schema: str, topic_id: str) -> Optional[Topic]:
+        """Return a single Topic by its `topic_id` (or None)."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            result = (await session.exec(_by_topic_id_statement(topic_id))).first()
+            return cast(Optional[Topic], result)
+
+    async def get_by_topic_ids(self, tenant_schema: str, topic_ids: Sequence[str]) -> List[Topic]:
+        """Return the latest Topic of each of `topic_ids` that exists, in one query."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            return list((await session.exec(_latest_by_topic_ids_statement(topic_ids))).all())
+
+    async def get_fields_by_topic_id(
+        self, tenant_schema: str, topic_id: str, fields: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Return only `fields` of a single Topic by its `topic_id` (or None)."""
+        statement = _projected(_by_topic_id_statement(topic_id), fields)
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            connection = await session.connection()
+            row = (await connection.execute(statement)).first()
+        return dict(zip(fields, row)) if row is not None else None
+
+    @coalesce_async(repository_flights)
+    async def get_topics_version(self, tenant_schema: str) -> str:
+        """Return a version string that changes whenever the tenant's SOWs or topics do."""
+        async with self.db.tenant_session(tenant_schema, read_only=True) as session:
+            sows = (await session.exec(_sow_versions_statement())).all()
+            topics = (await session.exec(_topic_versions_statement())).first()
+            return _topics_version(sows, topics)
+
 
-__all__ = ["TopicRepository"]
+__all__ = [
+    "SORTABLE_TOPIC_FIELDS",
+    "AsyncTopicRepository",
+    "TopicFilter",
+    "TopicListQuery",
+    "TopicRepository",
+    "sort_value",
+]
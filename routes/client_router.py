@@ -1,12 +1,14 @@
 import logging
-from typing import Any, Dict
 
 from fastapi import APIRouter, Depends
 
-from database.manager import get_all
+from database.manager import fetch_all
 from database.public_models.models import PublicSow
 from database.tenant_models.models import TenantSow
 from jwt_validator import validate_jwt
+from repositories.tenant_registry_repository import Tenant
+from routes.dependencies import resolve_tenant
+from web.responses import ApiResponse
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -14,12 +16,10 @@ client_router = APIRouter(prefix="/api/v2", dependencies=[Depends(validate_jwt)]
 
 
 @client_router.post("/demo")
-def protected(authorization: Dict[str, Any] = Depends(validate_jwt)) -> dict[str, Any]:
-    org_id = authorization.get("orgId", "")
-    public_sows: list[PublicSow] = get_all(PublicSow, tenant_schema=org_id)
-    tenant_sows: list[TenantSow] = get_all(TenantSow, tenant_schema=org_id)
-    return {
-        "status": "OK",
-        "sows": tenant_sows,
-        "public_sows": public_sows,
-    }
+async def protected(tenant: Tenant = Depends(resolve_tenant)) -> ApiResponse:
+    public_sows: list[PublicSow] = await fetch_all(PublicSow, tenant_schema=tenant.schema_name)
+    tenant_sows: list[TenantSow] = await fetch_all(TenantSow, tenant_schema=tenant.schema_name)
+    return ApiResponse(
+        status_code=200,
+        content={"status": "OK", "sows": tenant_sows, "public_sows": public_sows},
+    )
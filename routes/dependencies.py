@@ -0,0 +1,144 @@
+"""FastAPI dependencies shared by several routers."""
+
+import os
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Callable, Dict, Set, Tuple, TypeVar
+
+import anyio
+from fastapi import Depends, HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+
+from caching import TTLCache
+from database.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from jwt_validator import validate_jwt
+from repositories.reference_data_repository import (
+    CachedReferenceDataRepository,
+    ReferenceDataRepository,
+)
+from repositories.tenant_registry_repository import (
+    Tenant,
+    TenantRegistry,
+    TenantRegistryRepository,
+)
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Endpoints that only read despite an unsafe method (e.g. POST lookups with a body).
+READ_ONLY_ENDPOINTS: Set[Callable[..., Any]] = set()
+REFERENCE_DATA_TTL_SECONDS = float(os.environ.get("REFERENCE_DATA_TTL_SECONDS", 300))
+TENANT_REGISTRY_REFRESH_SECONDS = float(os.environ.get("TENANT_REGISTRY_REFRESH_SECONDS", 30))
+TOPIC_LIST_CACHE_SIZE = int(os.environ.get("TOPIC_LIST_CACHE_SIZE", 1_000))
+TOPIC_LIST_CACHE_MAX_BYTES = int(os.environ.get("TOPIC_LIST_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+# Scope a token must carry to replace a SOW's masterfile data.
+MASTERFILE_WRITE_SCOPE = "masterfile:write"
+
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+
+def read_only_endpoint(endpoint: EndpointT) -> EndpointT:
+    """Give a non-GET endpoint that never writes a read-only unit of work.
+
+    Apply it below the router decorator, so the registered endpoint is marked.
+    """
+    READ_ONLY_ENDPOINTS.add(endpoint)
+    return endpoint
+
+
+async def get_unit_of_work(
+    request: Request,
+) -> AsyncGenerator[UnitOfWork | AsyncUnitOfWork, None]:
+    """Provide one unit of work per request, shared by every repository it builds.
+
+    Safe methods and `read_only_endpoint`s get a read-only unit of work that never
+    issues COMMIT (and may be served by a read replica). The unit
+    of work is closed here however the request ends, rolling back on errors and
+    cancellation (e.g. a client disconnect), so its pooled connection is always returned.
+    """
+    from database import manager as db_manager
+
+    read_only = (
+        request.method in READ_ONLY_METHODS or request.scope.get("endpoint") in READ_ONLY_ENDPOINTS
+    )
+    if db_manager.async_db is not None:
+        async_uow = db_manager.async_db.unit_of_work(read_only=read_only)
+        commit = True
+        try:
+            yield async_uow
+        except BaseException:
+            commit = False
+            raise
+        finally:
+            with anyio.CancelScope(shield=True):
+                await async_uow.close(commit=commit)
+        return
+
+    uow = db_manager.db.unit_of_work(read_only=read_only)
+    commit = True
+    try:
+        yield uow
+    except BaseException:
+        commit = False
+        raise
+    finally:
+        if uow.in_use:
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(uow.close, commit)
+
+
+@lru_cache(maxsize=1)
+def get_reference_data() -> CachedReferenceDataRepository:
+    """Process-wide cache of public-schema reference data (client tiers and tier features)."""
+    from database import manager as db_manager
+
+    return CachedReferenceDataRepository(
+        ReferenceDataRepository(db_manager.db), ttl=REFERENCE_DATA_TTL_SECONDS
+    )
+
+
+@lru_cache(maxsize=1)
+def get_topic_list_cache() -> TTLCache[Tuple[Any, ...], bytes]:
+    """Process-wide LRU of serialized (and precompressed) topic lists, bounded by entries and bytes."""
+    return TTLCache(TOPIC_LIST_CACHE_SIZE, max_weight=TOPIC_LIST_CACHE_MAX_BYTES, weigher=len)
+
+
+@lru_cache(maxsize=1)
+def get_tenant_registry() -> TenantRegistry:
+    """Process-wide org id → tenant schema map, loaded at startup (see `main.lifespan`)."""
+    from database import manager as db_manager
+
+    return TenantRegistry(TenantRegistryRepository(db_manager.db))
+
+
+async def resolve_tenant(
+    authorization: Dict[str, Any] = Depends(validate_jwt),
+    registry: TenantRegistry = Depends(get_tenant_registry),
+) -> Tenant:
+    """Resolve the token's `orgId` to its tenant, from memory.
+
+    Tokens without an `orgId` get 400 and unknown tenants 403, before any tenant
+    session is opened. The registry is loaded here if startup did not load it.
+    """
+    org_id = authorization.get("orgId")
+    if not org_id:
+        raise HTTPException(
+            status_code=400, detail="Authorization token missing tenant schema information."
+        )
+    if not registry.loaded:
+        await run_in_threadpool(registry.load)
+    tenant = registry.resolve(org_id)
+    if tenant is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Unknown tenant.")
+    return tenant
+
+
+def require_scope(scope: str) -> Callable[[Dict[str, Any]], None]:
+    """Dependency rejecting tokens whose space-separated `scope` claim lacks `scope` (403)."""
+
+    def check_scope(authorization: Dict[str, Any] = Depends(validate_jwt)) -> None:
+        granted = authorization.get("scope")
+        if not isinstance(granted, str) or scope not in granted.split():
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail=f"Token lacks the {scope} scope."
+            )
+
+    return check_scope
@@ -0,0 +1,75 @@
+import os
+from typing import Dict
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from repositories.export_repository import AsyncExportRepository, ExportRepository
+from repositories.tenant_registry_repository import Tenant
+from routes.dependencies import resolve_tenant
+from services.export_service import EXPORT_MEDIA_TYPES, ExportFormat, ExportService
+from web.compression import compression_levels
+
+# Most rows one export returns for a tenant table; larger tables are truncated.
+EXPORT_ROW_CAP = int(os.environ.get("EXPORT_ROW_CAP", 1_000_000))
+# Per-tenant caps overriding EXPORT_ROW_CAP, as "schema_name=rows,..." (e.g. "acme=5000000").
+EXPORT_ROW_CAPS: Dict[str, int] = {
+    schema.strip().lower(): int(rows)
+    for schema, _, rows in (
+        item.partition("=") for item in os.environ.get("EXPORT_ROW_CAPS", "").split(",")
+    )
+    if schema.strip()
+}
+# Rows fetched from the server-side cursor (and encoded as one chunk) at a time.
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", 1_000))
+
+export_router = APIRouter(prefix="/api/v2/exports", tags=["exports"])
+
+
+def export_row_cap(tenant: Tenant) -> int:
+    """The tenant's row cap: its EXPORT_ROW_CAPS entry, else EXPORT_ROW_CAP."""
+    return EXPORT_ROW_CAPS.get(tenant.schema_name.lower(), EXPORT_ROW_CAP)
+
+
+def get_export_service() -> ExportService:
+    """Exports hold a transaction of their own for the cursor, so they skip the unit of work."""
+    from database import manager as db_manager
+
+    if db_manager.async_db is not None:
+        return ExportService(AsyncExportRepository(db_manager.async_db))
+    return ExportService(ExportRepository(db_manager.db))
+
+
+@export_router.get("/{table}")
+@compression_levels(zstd=1, br=1, gzip=1)
+async def export_table(
+    table: str,
+    request: Request,
+    format: ExportFormat = "ndjson",
+    tenant: Tenant = Depends(resolve_tenant),
+    service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """Stream every row of a tenant table (topics, trends, drivers, sources,
+    opportunities, topic_deltas or maturity_scores), in primary-key order, up to
+    the tenant's row cap (EXPORT_ROW_CAPS, defaulting to EXPORT_ROW_CAP).
+
+    `ndjson` and `csv` are text; `arrow` (an Arrow IPC stream, one record batch per
+    EXPORT_BATCH_SIZE rows) and `parquet` carry typed columns matching the models.
+    """
+    row_cap = export_row_cap(tenant)
+    chunks = service.stream_table(
+        tenant.schema_name,
+        table,
+        format,
+        row_cap,
+        EXPORT_BATCH_SIZE,
+        request.is_disconnected,
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{table}.{format}"',
+            "X-Export-Row-Cap": str(row_cap),
+        },
+    )
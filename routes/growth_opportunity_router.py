@@ -0,0 +1,54 @@
+import os
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
+
+from database.schemas.growth_opportunity import GrowthOpportunityHierarchyResponse
+from database.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from repositories.growth_opportunity_repository import (
+    MAX_HIERARCHY_DEPTH,
+    AsyncGrowthOpportunityRepository,
+    GrowthOpportunityRepository,
+)
+from repositories.tenant_registry_repository import Tenant
+from routes.dependencies import get_unit_of_work, resolve_tenant
+from services.growth_opportunity_service import GrowthOpportunityService
+from web.responses import ApiResponse
+
+GROWTH_OPPORTUNITY_STREAM_BATCH = int(os.environ.get("GROWTH_OPPORTUNITY_STREAM_BATCH", 200))
+
+growth_opportunity_router = APIRouter(prefix="/api/v2", tags=["growth-opportunities"])
+
+
+def get_growth_opportunity_service(
+    uow: UnitOfWork | AsyncUnitOfWork = Depends(get_unit_of_work),
+) -> GrowthOpportunityService:
+    if isinstance(uow, AsyncUnitOfWork):
+        return GrowthOpportunityService(AsyncGrowthOpportunityRepository(uow))
+    return GrowthOpportunityService(GrowthOpportunityRepository(uow))
+
+
+@growth_opportunity_router.get(
+    "/growth-opportunities/{sow_id}", response_model=GrowthOpportunityHierarchyResponse
+)
+async def get_growth_opportunities(
+    sow_id: int,
+    depth: int = Query(MAX_HIERARCHY_DEPTH, ge=0, le=MAX_HIERARCHY_DEPTH),
+    stream: bool = False,
+    tenant: Tenant = Depends(resolve_tenant),
+    service: GrowthOpportunityService = Depends(get_growth_opportunity_service),
+) -> Response:
+    """Growth opportunity trees of a SOW, down to `depth` levels below the roots
+    (1: geographies, 2: markets, 3: estimators).
+
+    With `stream=true` the trees are sent as NDJSON, one root per line, loaded
+    GROWTH_OPPORTUNITY_STREAM_BATCH roots at a time.
+    """
+    tenant_schema = tenant.schema_name
+    if stream:
+        lines = service.stream_hierarchy(
+            tenant_schema, sow_id, depth, GROWTH_OPPORTUNITY_STREAM_BATCH
+        )
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+    roots = await service.get_hierarchy(tenant_schema, sow_id, depth)
+    return ApiResponse(status_code=200, content={"growth_opportunities": roots})
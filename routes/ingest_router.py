@@ -0,0 +1,80 @@
+import os
+from typing import Dict, Optional
+
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+
+from repositories.ingest_repository import AsyncIngestRepository, IngestRepository
+from repositories.reference_data_repository import CachedReferenceDataRepository
+from repositories.tenant_registry_repository import Tenant
+from routes.dependencies import (
+    MASTERFILE_WRITE_SCOPE,
+    get_reference_data,
+    require_scope,
+    resolve_tenant,
+)
+from services.ingest_service import IngestFormat, IngestService, IngestUpload
+from web.responses import ApiResponse
+
+# Rows validated and written (one COPY) at a time during a masterfile load.
+INGEST_BATCH_SIZE = int(os.environ.get("INGEST_BATCH_SIZE", 5_000))
+
+ingest_router = APIRouter(prefix="/api/v2/ingest", tags=["ingest"])
+
+
+def get_ingest_service(
+    reference_data: CachedReferenceDataRepository = Depends(get_reference_data),
+) -> IngestService:
+    """Loads commit in a transaction of their own before responding, outside the unit of work."""
+    from database import manager as db_manager
+
+    if db_manager.async_db is not None:
+        return IngestService(AsyncIngestRepository(db_manager.async_db), reference_data)
+    return IngestService(IngestRepository(db_manager.db), reference_data)
+
+
+def _upload_format(upload: UploadFile) -> IngestFormat:
+    if upload.content_type == "text/csv" or (upload.filename or "").endswith(".csv"):
+        return "csv"
+    return "ndjson"
+
+
+@ingest_router.post("/{sow_id}", dependencies=[Depends(require_scope(MASTERFILE_WRITE_SCOPE))])
+async def ingest_masterfile(
+    sow_id: int,
+    masterfile_version: int = Query(..., ge=1),
+    trends: Optional[UploadFile] = File(None),
+    drivers: Optional[UploadFile] = File(None),
+    topics: Optional[UploadFile] = File(None),
+    topic2drivers: Optional[UploadFile] = File(None),
+    topic_deltas: Optional[UploadFile] = File(None),
+    tenant: Tenant = Depends(resolve_tenant),
+    service: IngestService = Depends(get_ingest_service),
+) -> ApiResponse:
+    """Load a SOW's masterfile as `masterfile_version`, replacing the current one.
+
+    Each table is an NDJSON or CSV (`.csv` / `text/csv`) multipart file. Rows are
+    validated against the models, written with COPY and swapped in atomically:
+    the whole load commits or nothing does. Responds with rows per table and
+    rows per second. The token needs the `masterfile:write` scope.
+
+    Uploads are multipart rather than a raw request body so one request can carry
+    every table; Starlette spools each part to disk past 1 MB and rows are read
+    from the spooled file batch by batch, so memory stays bounded.
+    """
+    tenant_schema = tenant.schema_name
+    files = {
+        "trends": trends,
+        "drivers": drivers,
+        "topics": topics,
+        "topic2drivers": topic2drivers,
+        "topic_deltas": topic_deltas,
+    }
+    uploads: Dict[str, IngestUpload] = {
+        name: (upload.file, _upload_format(upload))
+        for name, upload in files.items()
+        if upload is not None
+    }
+    report = await service.ingest(
+        tenant_schema, sow_id, masterfile_version, uploads, INGEST_BATCH_SIZE
+    )
+    return ApiResponse(status_code=200, content=report)
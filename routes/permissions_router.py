@@ -1,36 +1,41 @@
-from typing import Any, Dict
-
 from fastapi import APIRouter, Depends
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
 
 from database.schemas.permissions import PermissionsResponse
-from jwt_validator import validate_jwt
-from repositories.permissions_repository import PermissionsRepository
+from database.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from repositories.permissions_repository import (
+    AsyncPermissionsRepository,
+    PermissionsRepository,
+)
+from repositories.reference_data_repository import CachedReferenceDataRepository
+from repositories.tenant_registry_repository import Tenant
+from routes.dependencies import get_reference_data, get_unit_of_work, resolve_tenant
 from services.permissions_service import PermissionsService
+from web.responses import ApiResponse
 
 permissions_router = APIRouter(prefix="/api/v2", tags=["permissions"])
 
 
-def get_permissions_repository() -> PermissionsRepository:
-    from database import manager as db_manager
-
-    return PermissionsRepository(db_manager.db)
+def get_permissions_repository(
+    uow: UnitOfWork | AsyncUnitOfWork = Depends(get_unit_of_work),
+) -> PermissionsRepository | AsyncPermissionsRepository:
+    if isinstance(uow, AsyncUnitOfWork):
+        return AsyncPermissionsRepository(uow)
+    return PermissionsRepository(uow)
 
 
 def get_permissions_service(
-    repo: PermissionsRepository = Depends(get_permissions_repository),
+    repo: PermissionsRepository | AsyncPermissionsRepository = Depends(get_permissions_repository),
+    reference_data: CachedReferenceDataRepository = Depends(get_reference_data),
 ) -> PermissionsService:
-    return PermissionsService(repo)
+    return PermissionsService(repo, reference_data)
 
 
 @permissions_router.get("/permissions/{sow_id}", response_model=PermissionsResponse)
-def get_permissions(
+async def get_permissions(
     sow_id: int,
-    authorization: Dict[str, Any] = Depends(validate_jwt),
+    tenant: Tenant = Depends(resolve_tenant),
     service: PermissionsService = Depends(get_permissions_service),
-) -> JSONResponse:
+) -> ApiResponse:
     """Return experiments, feature permissions, and opportunity platform flag for a SOW."""
-    tenant_schema = authorization.get("orgId")
-    result = service.get_permissions(tenant_schema, sow_id)
-    return JSONResponse(status_code=200, content=jsonable_encoder(result))
+    result = await service.get_permissions(tenant.schema_name, sow_id, tenant.org_id)
+    return ApiResponse(status_code=200, content=result)
@@ -1,53 +1,254 @@
-from typing import Any, Dict
+import os
+from typing import List, Literal, Optional, Tuple, Union
 
-from fastapi import APIRouter, Depends
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
 
-from database.schemas.topic import TopicItemResponse, TopicsListResponse
-from jwt_validator import validate_jwt
-from repositories.topic_repository import TopicRepository
-from services.topic_services import TopicService
+from database.schemas.topic import (
+    TopicBatchRequest,
+    TopicBatchResponse,
+    TopicGraphResponse,
+    TopicItemResponse,
+    TopicResponse,
+    TopicsColumnarResponse,
+    TopicsListResponse,
+)
+from database.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from repositories.tenant_registry_repository import Tenant
+from repositories.topic_graph_repository import AsyncTopicGraphRepository, TopicGraphRepository
+from repositories.topic_repository import (
+    SORTABLE_TOPIC_FIELDS,
+    AsyncTopicRepository,
+    TopicFilter,
+    TopicListQuery,
+    TopicRepository,
+    sort_value,
+)
+from routes.dependencies import (
+    get_topic_list_cache,
+    get_unit_of_work,
+    read_only_endpoint,
+    resolve_tenant,
+)
+from services.topic_graph_service import TopicGraphService
+from services.topic_services import TopicListCache, TopicService
+from web.compression import negotiate
+from web.conditional import REVALIDATE_HEADERS, etag_for, etag_matches, not_modified
+from web.negotiation import response_media_type
+from web.pagination import decode_cursor
+from web.responses import ApiResponse
+
+TOPICS_MAX_PAGE_SIZE = int(os.environ.get("TOPICS_MAX_PAGE_SIZE", 1_000))
 
 topic_router = APIRouter(prefix="/api/v2/topics", tags=["topics"])
 
 
-def get_topic_repository() -> TopicRepository:
-    """Create a `TopicRepository` using the real DB provider.
+def get_topic_fields(
+    fields: Optional[str] = Query(None, description="Comma-separated TopicResponse fields"),
+) -> Optional[Tuple[str, ...]]:
+    """Parse `fields=`, rejecting names that are not `TopicResponse` fields."""
+    if fields is None:
+        return None
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in TopicResponse.model_fields]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown topic fields: {', '.join(unknown) or fields!r}"
+        )
+    return names
+
+
+def get_topic_filters(
+    topic_status: Optional[List[int]] = Query(None),
+    new_discovery: Optional[bool] = None,
+    min_topic_growth_normalized: Optional[float] = None,
+    max_topic_growth_normalized: Optional[float] = None,
+    min_topic_consensus_normalized: Optional[float] = None,
+    max_topic_consensus_normalized: Optional[float] = None,
+    min_average_sizing: Optional[float] = None,
+    max_average_sizing: Optional[float] = None,
+) -> Tuple[TopicFilter, ...]:
+    """Collect the topic list filters; `topic_status` may be repeated to match any of them."""
+    filters: List[TopicFilter] = []
+    if topic_status:
+        filters.append(TopicFilter("topic_status", "in", tuple(sorted(set(topic_status)))))
+    if new_discovery is not None:
+        filters.append(TopicFilter("new_discovery", "eq", new_discovery))
+    bounds = {
+        "topic_growth_normalized": (min_topic_growth_normalized, max_topic_growth_normalized),
+        "topic_consensus_normalized": (
+            min_topic_consensus_normalized,
+            max_topic_consensus_normalized,
+        ),
+        "average_sizing": (min_average_sizing, max_average_sizing),
+    }
+    for field, (low, high) in bounds.items():
+        if low is not None:
+            filters.append(TopicFilter(field, "ge", low))
+        if high is not None:
+            filters.append(TopicFilter(field, "le", high))
+    return tuple(filters)
+
+
+def get_topic_list_query(
+    sid: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    sort: str = Query("tid", description="Sort field, prefixed with - for descending"),
+    fields: Optional[Tuple[str, ...]] = Depends(get_topic_fields),
+    filters: Tuple[TopicFilter, ...] = Depends(get_topic_filters),
+    format: Literal["rows", "columnar"] = Query(
+        "rows",
+        description="`rows`: a list of topic objects; `columnar`: each field once with an "
+        "array of values (see TopicsColumnarResponse)",
+    ),
+) -> TopicListQuery:
+    """Build the page query; `limit` defaults to, and is capped at, TOPICS_MAX_PAGE_SIZE."""
+    sort_field = sort.removeprefix("-")
+    if sort_field not in SORTABLE_TOPIC_FIELDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Topics can be sorted by: {', '.join(SORTABLE_TOPIC_FIELDS)}",
+        )
+    after_tid, after_value = None, None
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        after_tid = position.get("tid")
+        if type(after_tid) is not int or position.get("s", "tid") != sort:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+        if sort_field != "tid":
+            try:
+                after_value = sort_value(sort_field, position.get("v"))
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+    return TopicListQuery(
+        limit=min(limit or TOPICS_MAX_PAGE_SIZE, TOPICS_MAX_PAGE_SIZE),
+        after_tid=after_tid,
+        sow_id=sid,
+        fields=fields,
+        filters=filters,
+        sort=sort_field,
+        descending=sort.startswith("-"),
+        after_value=after_value,
+        columnar=format == "columnar",
+    )
+
 
-    Importing `database.manager` inside the function defers construction of
-    the `db` object until the dependency is resolved (request time), and
-    allows tests to override the dependency with a mock provider.
+def get_topic_repository(
+    uow: UnitOfWork | AsyncUnitOfWork = Depends(get_unit_of_work),
+) -> TopicRepository | AsyncTopicRepository:
+    """Create a `TopicRepository` over the request's unit of work.
+
+    The unit of work is built from `database.manager` at request time, which
+    allows tests to override the dependency with a mock provider. When
+    `POSTGRES_ASYNC` is enabled the async repository is used.
     """
-    from database import manager as db_manager
+    if isinstance(uow, AsyncUnitOfWork):
+        return AsyncTopicRepository(uow)
+    return TopicRepository(uow)
+
 
-    return TopicRepository(db_manager.db)
+def get_topic_service(
+    repo: TopicRepository | AsyncTopicRepository = Depends(get_topic_repository),
+    topic_list_cache: TopicListCache = Depends(get_topic_list_cache),
+) -> TopicService:
+    return TopicService(repo, topic_list_cache)
 
 
-def get_topic_service(repo: TopicRepository = Depends(get_topic_repository)) -> TopicService:
-    return TopicService(repo)
+def get_topic_graph_service(
+    uow: UnitOfWork | AsyncUnitOfWork = Depends(get_unit_of_work),
+) -> TopicGraphService:
+    if isinstance(uow, AsyncUnitOfWork):
+        return TopicGraphService(AsyncTopicGraphRepository(uow))
+    return TopicGraphService(TopicGraphRepository(uow))
 
 
-@topic_router.get("/", response_model=TopicsListResponse)
-def list_topics(
-    authorization: Dict[str, Any] = Depends(validate_jwt),
+@topic_router.get("/", response_model=Union[TopicsListResponse, TopicsColumnarResponse])
+async def list_topics(
+    request: Request,
+    query: TopicListQuery = Depends(get_topic_list_query),
+    tenant: Tenant = Depends(resolve_tenant),
     topic_service: TopicService = Depends(get_topic_service),
-) -> JSONResponse:
-    """List all topics. Depends on JWT authentication and injected service."""
-    tenant_schema = authorization.get("orgId", None)
-    topics = topic_service.get_all_topics(tenant_schema)
-    return JSONResponse(status_code=200, content=jsonable_encoder({"topics": topics}))
+) -> Response:
+    """List topics one keyset page at a time. Depends on JWT authentication and injected service.
+
+    Pass the returned `next_cursor` as `cursor` to fetch the following page; `sid`
+    scopes the list to one SOW, `fields` selects the columns returned, and `sort`
+    plus the metric filters are applied in the database. Answers `If-None-Match` with 304 from the version
+    probe alone. Compressed bodies are cached next to the plain one, and MessagePack
+    pages (`Accept: application/msgpack`) next to the JSON ones.
+    """
+    tenant_schema = tenant.schema_name
+    version = await topic_service.get_topics_version(tenant_schema)
+    media_type = response_media_type()
+    etag = etag_for(tenant_schema, version, query, media_type)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    body, encoding = await topic_service.get_topics_page_body(
+        tenant_schema, query, version, encoding, media_type
+    )
+    headers = {"ETag": etag, "Vary": "Accept-Encoding", **REVALIDATE_HEADERS}
+    if encoding is not None:
+        headers.update({"Content-Encoding": encoding, "ETag": f"W/{etag}"})
+    return Response(status_code=200, content=body, media_type=media_type, headers=headers)
+
+
+@topic_router.post("/batch", response_model=TopicBatchResponse)
+@read_only_endpoint
+async def get_topics_batch(
+    batch: TopicBatchRequest,
+    tenant: Tenant = Depends(resolve_tenant),
+    topic_service: TopicService = Depends(get_topic_service),
+) -> ApiResponse:
+    """Fetch up to TOPICS_MAX_BATCH_SIZE topics by `topic_id` in one query.
+
+    Each id resolves like `GET /{topic_id}` (latest sid wins); unknown ids are
+    listed in `missing`.
+    """
+    tenant_schema = tenant.schema_name
+    topics, missing = await topic_service.get_topics_by_topic_ids(tenant_schema, batch.topic_ids)
+    return ApiResponse(status_code=200, content={"topics": topics, "missing": missing})
 
 
 @topic_router.get("/{topic_id}", response_model=TopicItemResponse)
-def get_topic(
+async def get_topic(
     topic_id: str,
-    authorization: Dict[str, Any] = Depends(validate_jwt),
+    request: Request,
+    fields: Optional[Tuple[str, ...]] = Depends(get_topic_fields),
+    tenant: Tenant = Depends(resolve_tenant),
     topic_service: TopicService = Depends(get_topic_service),
-) -> JSONResponse:
-    """Fetch a single topic by `topic_id`. Depends on JWT authentication."""
-    tenant_schema = authorization.get("orgId", None)
-    topic = topic_service.get_topic_by_topic_id(tenant_schema, topic_id)
+) -> Response:
+    """Fetch a single topic by `topic_id`. Depends on JWT authentication.
+
+    `fields` selects the columns returned. Answers `If-None-Match` with 304 from the version probe alone.
+    """
+    tenant_schema = tenant.schema_name
+    version = await topic_service.get_topics_version(tenant_schema)
+    etag = etag_for(tenant_schema, version, topic_id, fields, response_media_type())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    topic = await topic_service.get_topic_by_topic_id(tenant_schema, topic_id, fields)
     if not topic:
-        return JSONResponse(status_code=404, content={"error": "Topic not found"})
-    return JSONResponse(status_code=200, content=jsonable_encoder({"topic": topic}))
+        return ApiResponse(status_code=404, content={"error": "Topic not found"})
+    return ApiResponse(
+        status_code=200,
+        content={"topic": topic},
+        headers={"ETag": etag, **REVALIDATE_HEADERS},
+    )
+
+
+@topic_router.get("/{topic_id}/graph", response_model=TopicGraphResponse)
+async def get_topic_graph(
+    topic_id: str,
+    tenant: Tenant = Depends(resolve_tenant),
+    topic_graph_service: TopicGraphService = Depends(get_topic_graph_service),
+) -> ApiResponse:
+    """Fetch a topic with its trend, drivers, sources, opportunities and latest maturity
+    scores, in a fixed number of queries. Depends on JWT authentication.
+    """
+    tenant_schema = tenant.schema_name
+    graph = await topic_graph_service.get_topic_graph(tenant_schema, topic_id)
+    if graph is None:
+        return ApiResponse(status_code=404, content={"error": "Topic not found"})
+    return ApiResponse(status_code=200, content=graph)
@@ -0,0 +1,46 @@
+"""Helpers for calling sync or async repositories from async services."""
+
+import inspect
+from typing import Any, AsyncGenerator, Callable
+
+import anyio
+from starlette.concurrency import run_in_threadpool
+
+_EXHAUSTED = object()
+
+
+async def call_repository(method: Callable[..., Any], *args: Any) -> Any:
+    """Await an async repository method, or run a sync one in the threadpool.
+
+    Lets the same service drive `TopicRepository` (blocking psycopg2 calls) and
+    `AsyncTopicRepository` without ever blocking the event loop. Callers should
+    annotate the variable they assign the result to.
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+    return await run_in_threadpool(method, *args)
+
+
+async def iterate_repository(method: Callable[..., Any], *args: Any) -> AsyncGenerator[Any, None]:
+    """Iterate an async repository generator, or advance a sync one in the threadpool.
+
+    The repository's iterator is closed (releasing its session and cursor) however
+    iteration ends, including when the consumer stops early or is cancelled.
+    """
+    if inspect.isasyncgenfunction(method):
+        generator = method(*args)
+        try:
+            async for item in generator:
+                yield item
+        finally:
+            with anyio.CancelScope(shield=True):
+                await generator.aclose()
+        return
+
+    iterator = method(*args)
+    try:
+        while (item := await run_in_threadpool(next, iterator, _EXHAUSTED)) is not _EXHAUSTED:
+            yield item
+    finally:
+        with anyio.CancelScope(shield=True):
+            await run_in_threadpool(iterator.close)
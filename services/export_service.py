@@ -0,0 +1,156 @@
+"""Service layer for streaming exports of tenant tables."""
+
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+)
+
+from fastapi import HTTPException
+from sqlalchemy import Table
+
+from repositories.export_repository import (
+    EXPORT_TABLES,
+    AsyncExportRepository,
+    ExportRepository,
+    ExportRow,
+)
+from services.concurrency import iterate_repository
+from web.responses import render_json
+
+ExportFormat = Literal["ndjson", "csv", "arrow", "parquet"]
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+class _Encoder(Protocol):
+    def start(self) -> bytes: ...
+
+    def encode(self, rows: List[ExportRow]) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+class _CsvEncoder:
+    def __init__(self, table: Table) -> None:
+        self.header = [column.name for column in table.columns]
+
+    def _write(self, rows: List[List[Any]]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+    def start(self) -> bytes:
+        return self._write([self.header])
+
+    def encode(self, rows: List[ExportRow]) -> bytes:
+        return self._write([[_csv_value(value) for value in row.values()] for row in rows])
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _NdjsonEncoder:
+    def start(self) -> bytes:
+        return b""
+
+    def encode(self, rows: List[ExportRow]) -> bytes:
+        return b"".join(render_json(row) + b"\n" for row in rows)
+
+    def finish(self) -> bytes:
+        return b""
+
+
+def _encoder(export_format: ExportFormat, table: Table) -> _Encoder:
+    if export_format == "csv":
+        return _CsvEncoder(table)
+    if export_format in ("arrow", "parquet"):
+        from web.arrow import ArrowEncoder  # pyarrow is only loaded by columnar exports
+
+        return ArrowEncoder(table, parquet=export_format == "parquet")
+    return _NdjsonEncoder()
+
+
+class ExportService:
+    """Streams a tenant table as NDJSON, CSV, Arrow IPC or Parquet, one chunk per fetched batch."""
+
+    def __init__(self, export_repository: ExportRepository | AsyncExportRepository) -> None:
+        self.export_repository = export_repository
+
+    def stream_table(
+        self,
+        organization_id: Optional[str],
+        table: str,
+        export_format: ExportFormat,
+        limit: int,
+        batch_size: int,
+        is_disconnected: Callable[[], Awaitable[bool]],
+    ) -> AsyncIterator[bytes]:
+        """Return the encoded rows of `table`, at most `limit` of them.
+
+        The tenant and table are checked before the stream starts. Between batches
+        the stream stops as soon as `is_disconnected` reports that the client left,
+        which closes the cursor instead of reading the rest of the table.
+        """
+        if not organization_id:
+            raise HTTPException(
+                status_code=400, detail="Authorization token missing tenant schema information."
+            )
+        if table not in EXPORT_TABLES:
+            raise HTTPException(status_code=404, detail="Unknown export table.")
+        return self._stream(
+            organization_id, table, export_format, limit, batch_size, is_disconnected
+        )
+
+    async def _stream(
+        self,
+        organization_id: str,
+        table: str,
+        export_format: ExportFormat,
+        limit: int,
+        batch_size: int,
+        is_disconnected: Callable[[], Awaitable[bool]],
+    ) -> AsyncIterator[bytes]:
+        encoder = _encoder(export_format, EXPORT_TABLES[table])
+        if header := encoder.start():
+            yield header
+        batches = iterate_repository(
+            self.export_repository.iter_batches, organization_id, table, limit, batch_size
+        )
+        try:
+            async for rows in batches:
+                if await is_disconnected():
+                    return
+                yield encoder.encode(rows)
+        finally:
+            await batches.aclose()
+        if footer := encoder.finish():
+            yield footer
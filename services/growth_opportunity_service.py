@@ -0,0 +1,102 @@
+"""Service layer for the growth opportunity hierarchy endpoint."""
+
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from repositories.growth_opportunity_repository import (
+    AsyncGrowthOpportunityRepository,
+    GrowthOpportunityLevels,
+    GrowthOpportunityRepository,
+)
+from services.concurrency import call_repository
+from web.responses import render_json
+
+GrowthOpportunityNode = Dict[str, Any]
+
+
+def assemble_hierarchy(levels: GrowthOpportunityLevels) -> List[GrowthOpportunityNode]:
+    """Nest the levels into one tree per root, in a single pass over each level."""
+    estimators_by_market: Dict[int, List[Any]] = defaultdict(list)
+    for estimator in levels.estimators:
+        estimators_by_market[estimator.mid].append(estimator.model_dump())
+
+    markets_by_geography: Dict[int, List[Any]] = defaultdict(list)
+    for market in levels.markets:
+        node = market.model_dump()
+        node["estimators"] = estimators_by_market.get(market.mid, [])  # type: ignore[arg-type]
+        markets_by_geography[market.ggoid].append(node)
+
+    geographies_by_root: Dict[int, List[Any]] = defaultdict(list)
+    for geography in levels.geographies:
+        node = geography.model_dump()
+        node["markets"] = markets_by_geography.get(geography.ggoid, [])  # type: ignore[arg-type]
+        geographies_by_root[geography.goid].append(node)
+
+    topics_by_root: Dict[int, List[Any]] = defaultdict(list)
+    for topic in levels.topics:
+        topics_by_root[topic.goid].append(topic.model_dump())
+
+    roots = []
+    for root in levels.roots:
+        node = root.model_dump()
+        node["topics"] = topics_by_root.get(root.goid, [])  # type: ignore[arg-type]
+        node["geographies"] = geographies_by_root.get(root.goid, [])  # type: ignore[arg-type]
+        roots.append(node)
+    return roots
+
+
+class GrowthOpportunityService:
+    """Loads growth opportunity hierarchies breadth-first and assembles them in memory."""
+
+    def __init__(
+        self, repository: GrowthOpportunityRepository | AsyncGrowthOpportunityRepository
+    ) -> None:
+        self.growth_opportunity_repository = repository
+
+    async def get_hierarchy(
+        self, organization_id: Optional[str], sow_id: int, depth: int
+    ) -> List[GrowthOpportunityNode]:
+        """Return every root of the SOW with `depth` levels below it."""
+        _require_tenant(organization_id)
+        levels: GrowthOpportunityLevels = await call_repository(
+            self.growth_opportunity_repository.get_levels, organization_id, sow_id, depth
+        )
+        return assemble_hierarchy(levels)
+
+    def stream_hierarchy(
+        self, organization_id: Optional[str], sow_id: int, depth: int, batch_size: int
+    ) -> AsyncIterator[bytes]:
+        """Return NDJSON lines, one root tree each, loading `batch_size` roots at a time.
+
+        Memory stays bounded by one batch; the tenant is checked before the stream starts.
+        """
+        _require_tenant(organization_id)
+        return self._stream(organization_id, sow_id, depth, batch_size)  # type: ignore[arg-type]
+
+    async def _stream(
+        self, organization_id: str, sow_id: int, depth: int, batch_size: int
+    ) -> AsyncIterator[bytes]:
+        after_goid = None
+        while True:
+            levels: GrowthOpportunityLevels = await call_repository(
+                self.growth_opportunity_repository.get_levels,
+                organization_id,
+                sow_id,
+                depth,
+                after_goid,
+                batch_size,
+            )
+            for node in assemble_hierarchy(levels):
+                yield render_json(node) + b"\n"
+            if len(levels.roots) < batch_size:
+                return
+            after_goid = levels.roots[-1].goid
+
+
+def _require_tenant(organization_id: Optional[str]) -> None:
+    if not organization_id:
+        raise HTTPException(
+            status_code=400, detail="Authorization token missing tenant schema information."
+        )
@@ -0,0 +1,165 @@
+"""Service layer for bulk masterfile loads."""
+
+import csv
+import io
+import json
+import time
+from typing import IO, Any, Dict, Iterator, List, Literal, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import JSON
+
+from repositories.ingest_repository import (
+    INGEST_TABLES,
+    SOW_COLUMNS,
+    AsyncIngestRepository,
+    IngestBatches,
+    IngestRepository,
+    IngestResult,
+    IngestRow,
+    StaleMasterfileVersion,
+    ingest_table,
+)
+from repositories.reference_data_repository import CachedReferenceDataRepository
+from services.concurrency import call_repository
+
+IngestFormat = Literal["ndjson", "csv"]
+IngestUpload = Tuple[IO[bytes], IngestFormat]
+
+MIXED_KEYS_ERROR = "Every row of a table must either supply or omit its primary key."
+
+
+class _InvalidRow(Exception):
+    def __init__(self, table: str, line: int, errors: List[Any]) -> None:
+        super().__init__(f"Invalid {table} row on line {line}.")
+        self.detail = {"table": table, "line": line, "errors": errors}
+
+
+def _raw_rows(name: str, upload: IngestUpload) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(line number, raw fields) of each uploaded row; empty CSV fields are left out."""
+    file, upload_format = upload
+    text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    if upload_format == "csv":
+        json_columns = {c.name for c in ingest_table(name).columns if isinstance(c.type, JSON)}
+        reader = csv.DictReader(text)
+        for record in reader:
+            raw = {key: value for key, value in record.items() if value != ""}
+            try:
+                for key in json_columns & raw.keys():
+                    raw[key] = json.loads(raw[key])
+            except json.JSONDecodeError as error:
+                raise _InvalidRow(name, reader.line_num, [str(error)]) from error
+            yield reader.line_num, raw
+        return
+
+    for number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise _InvalidRow(name, number, [str(error)]) from error
+        if not isinstance(raw, dict):
+            raise _InvalidRow(name, number, ["Expected a JSON object."])
+        yield number, raw
+
+
+def _validated_batches(
+    uploads: Dict[str, IngestUpload], sow_id: int, masterfile_version: int, batch_size: int
+) -> IngestBatches:
+    """Validate each uploaded row against its SQLModel and yield `batch_size` column dicts at a time.
+
+    Every row is pinned to the SOW and masterfile being loaded. Primary keys are
+    written only when the upload supplies them (link rows refer to them), so every
+    row of a table must either supply or omit them.
+    """
+    for name, model in INGEST_TABLES.items():
+        if name not in uploads:
+            continue
+        table = ingest_table(name)
+        primary_keys = [c.name for c in table.primary_key.columns]
+        pinned: Dict[str, Any] = {}
+        if name in SOW_COLUMNS:
+            pinned[SOW_COLUMNS[name]] = sow_id
+        if "masterfile_version" in table.c:
+            pinned["masterfile_version"] = masterfile_version
+        columns: Optional[List[str]] = None
+        keys: List[str] = []
+        batch: List[IngestRow] = []
+        for line, raw in _raw_rows(name, uploads[name]):
+            raw.update(pinned)
+            try:
+                row = model.model_validate(raw)
+            except ValidationError as error:
+                errors = error.errors(include_url=False, include_context=False, include_input=False)
+                raise _InvalidRow(name, line, list(errors)) from error
+            supplied_keys = [key for key in primary_keys if key in raw]
+            if columns is None:
+                keys = supplied_keys
+                columns = [c.name for c in table.columns if not c.primary_key or c.name in keys]
+            elif supplied_keys != keys:
+                raise _InvalidRow(name, line, [MIXED_KEYS_ERROR])
+            batch.append({column: getattr(row, column) for column in columns})
+            if len(batch) >= batch_size:
+                yield name, batch
+                batch = []
+        if batch:
+            yield name, batch
+
+
+class IngestService:
+    """Validates uploaded masterfile tables and loads them as one new masterfile_version.
+
+    After a load commits, `reference_data` (when given) is invalidated, so
+    reference data cached alongside the old masterfile is read again.
+    """
+
+    def __init__(
+        self,
+        ingest_repository: IngestRepository | AsyncIngestRepository,
+        reference_data: Optional[CachedReferenceDataRepository] = None,
+    ) -> None:
+        self.ingest_repository = ingest_repository
+        self.reference_data = reference_data
+
+    async def ingest(
+        self,
+        organization_id: Optional[str],
+        sow_id: int,
+        masterfile_version: int,
+        uploads: Dict[str, IngestUpload],
+        batch_size: int,
+    ) -> Dict[str, Any]:
+        """Load `uploads` (keyed by table) and report rows written and throughput."""
+        if not organization_id:
+            raise HTTPException(
+                status_code=400, detail="Authorization token missing tenant schema information."
+            )
+        if not uploads:
+            raise HTTPException(status_code=400, detail="No masterfile tables were uploaded.")
+
+        batches = _validated_batches(uploads, sow_id, masterfile_version, batch_size)
+        started = time.perf_counter()
+        try:
+            result: Optional[IngestResult] = await call_repository(
+                self.ingest_repository.ingest, organization_id, sow_id, masterfile_version, batches
+            )
+        except StaleMasterfileVersion as error:
+            raise HTTPException(status_code=409, detail=str(error)) from error
+        except _InvalidRow as error:
+            raise HTTPException(status_code=422, detail=error.detail) from error
+        seconds = time.perf_counter() - started
+        if result is None:
+            raise HTTPException(status_code=404, detail="SOW not found.")
+        if self.reference_data is not None:
+            self.reference_data.invalidate()
+
+        return {
+            "sow_id": sow_id,
+            "masterfile_version": masterfile_version,
+            "rows": result.rows,
+            "total_rows": result.total_rows,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(result.total_rows / seconds) if seconds else None,
+        }
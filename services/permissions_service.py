@@ -1,47 +1,59 @@
 """Service layer for the permissions endpoint."""
 
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import HTTPException
 
 from database.schemas.permissions import ExperimentSchema, PermissionsResponse
-from repositories.permissions_repository import PermissionsRepository
+from repositories.permissions_repository import (
+    AsyncPermissionsRepository,
+    PermissionsBundle,
+    PermissionsRepository,
+)
+from repositories.reference_data_repository import (
+    CachedReferenceDataRepository,
+    ReferenceDataRepository,
+)
+from services.concurrency import call_repository
 
 
 class PermissionsService:
     """Orchestrates data fetching and assembles the permissions response."""
 
-    def __init__(self, repository: PermissionsRepository) -> None:
+    def __init__(
+        self,
+        repository: PermissionsRepository | AsyncPermissionsRepository,
+        reference_data: CachedReferenceDataRepository | ReferenceDataRepository,
+    ) -> None:
         self.permissions_repository = repository
+        self.reference_data = reference_data
 
-    def get_permissions(
+    async def get_permissions(
         self,
         tenant_schema: Optional[str],
         sow_id: int,
+        org_id: Optional[str] = None,
     ) -> PermissionsResponse:
+        """Permissions for a SOW of the tenant; features follow the tier of `org_id`
+        (by default the tenant schema name)."""
         if not tenant_schema:
             raise HTTPException(
                 status_code=400,
                 detail="Authorization token missing tenant schema information.",
             )
 
-        sow = self.permissions_repository.get_sow(tenant_schema, sow_id)
-        if sow is None:
-            raise HTTPException(status_code=404, detail="SowModel not available")
-
-        tier_id = self.permissions_repository.get_client_tier_id(tenant_schema)
-        feature_codes = (
-            self.permissions_repository.get_feature_codes(tier_id) if tier_id is not None else []
+        bundle: Optional[PermissionsBundle] = await call_repository(
+            self.permissions_repository.get_permissions_bundle, tenant_schema, sow_id
         )
+        if bundle is None:
+            raise HTTPException(status_code=404, detail="SowModel not available")
 
-        experiments = self.permissions_repository.get_experiments(sow.cs_sow_id)
-
-        has_opportunities = self.permissions_repository.has_opportunity_platforms(
-            tenant_schema, sow.sid  # type: ignore[arg-type]
+        feature_codes: List[str] = await call_repository(
+            self.reference_data.get_feature_codes_for_org, org_id or tenant_schema
         )
 
         return PermissionsResponse(
-            experiments=[ExperimentSchema.model_validate(e) for e in experiments],
+            experiments=[ExperimentSchema.model_validate(e) for e in bundle.experiments],
             permissions={code: True for code in feature_codes},
-            opportunity_platforms=has_opportunities,
+            opportunity_platforms=bundle.has_opportunity_platforms,
         )
@@ -0,0 +1,53 @@
+"""Service layer for the topic detail graph endpoint."""
+
+from typing import Optional
+
+from fastapi import HTTPException
+
+from database.schemas.topic import TopicDriverResponse, TopicGraphResponse, TopicResponse
+from repositories.topic_graph_repository import (
+    AsyncTopicGraphRepository,
+    TopicGraph,
+    TopicGraphRepository,
+)
+from services.concurrency import call_repository
+
+
+class TopicGraphService:
+    """Loads a topic's graph and assembles the response."""
+
+    def __init__(self, repository: TopicGraphRepository | AsyncTopicGraphRepository) -> None:
+        self.topic_graph_repository = repository
+
+    async def get_topic_graph(
+        self, organization_id: Optional[str], topic_id: str
+    ) -> Optional[TopicGraphResponse]:
+        if not organization_id:
+            raise HTTPException(
+                status_code=400, detail="Authorization token missing tenant schema information."
+            )
+        graph: Optional[TopicGraph] = await call_repository(
+            self.topic_graph_repository.get_graph, organization_id, topic_id
+        )
+        if graph is None:
+            return None
+
+        return TopicGraphResponse(
+            topic=TopicResponse.model_validate(graph.topic, from_attributes=True),
+            trend=graph.trend,
+            drivers=[
+                TopicDriverResponse(
+                    did=driver.did,
+                    driver_id=driver.driver_id,
+                    driver_name=driver.driver_name,
+                    driver_description=driver.driver_description,
+                    strength=edge.strength,
+                    polarity=edge.polarity,
+                    cooccurrence=edge.cooccurrence,
+                )
+                for edge, driver in graph.drivers
+            ],
+            sources=graph.sources,
+            opportunities=graph.opportunities,
+            maturity_scores=graph.maturity_scores,
+        )
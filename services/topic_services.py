@@ -1,32 +1,228 @@
 """Topic services handle business logic related to topics, such as fetching and processing topic data."""
 
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
 
+from caching import TTLCache
+from caching.single_flight import repository_flights
 from database.tenant_models.models import Topic
-from repositories.topic_repository import TopicRepository
+from repositories.topic_repository import AsyncTopicRepository, TopicListQuery, TopicRepository
+from services.concurrency import call_repository
+from web.compression import COMPRESSION_MIN_SIZE, PRECOMPRESSION_LEVELS, compress
+from web.negotiation import JSON_MEDIA_TYPE
+from web.pagination import encode_cursor
+from web.responses import render
+
+# A topic projected onto the requested `fields`.
+TopicFields = Dict[str, Any]
+# A page of topics in the columnar layout: each field name once, with its values in row order.
+TopicColumns = Dict[str, Sequence[Any]]
+
+# Serialized topic list pages keyed by (tenant schema, topics version, page query, media
+# type, content encoding), the plain body under "identity" and each compressed variant next to it.
+TopicListCache = TTLCache[Tuple[str, str, TopicListQuery, str, str], bytes]
+
+
+def _next_cursor(query: TopicListQuery, last_tid: Optional[int], last_value: Any) -> str:
+    """Cursor after the last row served; it records the sort so it cannot be reused with another."""
+    if query.sort == "tid" and not query.descending:
+        return encode_cursor({"tid": last_tid})
+    return encode_cursor({"tid": last_tid, "v": last_value, "s": query.sort_key})
 
 
 class TopicService:
     """Service layer for Topic-related business logic."""
 
-    def __init__(self, topic_repository: TopicRepository) -> None:
+    def __init__(
+        self,
+        topic_repository: TopicRepository | AsyncTopicRepository,
+        topic_list_cache: Optional[TopicListCache] = None,
+    ) -> None:
         self.topic_repository = topic_repository
+        self.topic_list_cache = topic_list_cache
 
-    def get_all_topics(self, organization_id: Optional[str]) -> list[Topic]:
+    async def get_all_topics(self, organization_id: Optional[str]) -> list[Topic]:
         """List all topics for a given organization."""
         if not organization_id:
             raise HTTPException(
                 status_code=400, detail="Authorization token missing tenant schema information."
             )
-        return self.topic_repository.get_all(organization_id)
+        topics: list[Topic] = await call_repository(self.topic_repository.get_all, organization_id)
+        return topics
+
+    async def get_topics_version(self, organization_id: Optional[str]) -> str:
+        """Return the tenant's topics version, which changes on every masterfile load."""
+        if not organization_id:
+            raise HTTPException(
+                status_code=400, detail="Authorization token missing tenant schema information."
+            )
+        version: str = await call_repository(
+            self.topic_repository.get_topics_version, organization_id
+        )
+        return version
+
+    async def get_topics_page(
+        self, organization_id: Optional[str], query: TopicListQuery
+    ) -> Tuple[list[Topic] | list[TopicFields], Optional[str]]:
+        """Return one page of topics and the cursor of the next page (None on the last).
+
+        With `query.fields`, topics are dicts holding just those fields.
+        """
+        if not organization_id:
+            raise HTTPException(
+                status_code=400, detail="Authorization token missing tenant schema information."
+            )
+        if query.fields is None:
+            rows: list[Topic] = await call_repository(
+                self.topic_repository.get_page, organization_id, query
+            )
+            topics = rows[: query.limit]
+            if len(rows) <= query.limit:
+                return topics, None
+            last = topics[-1]
+            return topics, _next_cursor(query, last.tid, getattr(last, query.sort))
+
+        field_rows: list[TopicFields] = await call_repository(
+            self.topic_repository.get_page_fields, organization_id, query
+        )
+        projected = field_rows[: query.limit]
+        next_cursor = None
+        if len(field_rows) > query.limit:
+            next_cursor = _next_cursor(query, projected[-1]["tid"], projected[-1][query.sort])
+        wanted = set(query.fields)
+        return [{k: v for k, v in row.items() if k in wanted} for row in projected], next_cursor
+
+    async def get_topics_page_columns(
+        self, organization_id: Optional[str], query: TopicListQuery
+    ) -> Tuple[TopicColumns, Optional[str]]:
+        """Return one page as `{field: [values...]}` and the next cursor.
 
-    def get_topic_by_topic_id(
-        self, organization_id: Optional[str], topic_id: str
-    ) -> Optional[Topic]:
+        The row tuples from the database are transposed directly; no per-row dict
+        or model is built.
+        """
         if not organization_id:
             raise HTTPException(
                 status_code=400, detail="Authorization token missing tenant schema information."
             )
-        return self.topic_repository.get_by_topic_id(organization_id, topic_id)
+        names: Tuple[str, ...]
+        rows: list[Tuple[Any, ...]]
+        names, rows = await call_repository(
+            self.topic_repository.get_page_columns, organization_id, query
+        )
+        page = rows[: query.limit]
+        next_cursor = None
+        if len(rows) > query.limit:
+            last = page[-1]
+            next_cursor = _next_cursor(
+                query, last[names.index("tid")], last[names.index(query.sort)]
+            )
+        values = list(zip(*page)) if page else [()] * len(names)
+        wanted = set(query.fields) if query.fields else set(names)
+        return {name: values[i] for i, name in enumerate(names) if name in wanted}, next_cursor
+
+    async def get_topics_page_serialized(
+        self,
+        organization_id: Optional[str],
+        query: TopicListQuery,
+        version: Optional[str] = None,
+        media_type: str = JSON_MEDIA_TYPE,
+    ) -> bytes:
+        """Return the `{"topics": [...], "next_cursor": ...}` body of one page, serialized as `media_type`.
+
+        With a cache, a version probe replaces the reload until the tenant's
+        masterfile changes; entries for older versions age out of the LRU. Pass
+        `version` when the caller already probed it. Concurrent misses for the same
+        page share one load and render (the body is bytes, so it is safe to share).
+        """
+        if self.topic_list_cache is None or not organization_id:
+            return await self._render_page(organization_id, query, media_type)
+
+        if version is None:
+            version = await self.get_topics_version(organization_id)
+        cache = self.topic_list_cache
+        key = (organization_id, version, query, media_type, "identity")
+        body = cache.get(key)
+        if body is not None:
+            return body
+
+        async def render() -> bytes:
+            rendered = await self._render_page(organization_id, query, media_type)
+            cache.set(key, rendered)
+            return rendered
+
+        return await repository_flights.do_async(("TopicService.page", *key), render)
+
+    async def get_topics_page_body(
+        self,
+        organization_id: Optional[str],
+        query: TopicListQuery,
+        version: str,
+        encoding: Optional[str],
+        media_type: str = JSON_MEDIA_TYPE,
+    ) -> Tuple[bytes, Optional[str]]:
+        """Return one page's body, compressed with `encoding` when it is large enough,
+        and the encoding actually applied.
+
+        Compressed variants are cached next to the plain body, so a hot page is
+        compressed once per masterfile version, at PRECOMPRESSION_LEVELS.
+        """
+        body = await self.get_topics_page_serialized(organization_id, query, version, media_type)
+        if encoding is None or len(body) < COMPRESSION_MIN_SIZE:
+            return body, None
+        level = PRECOMPRESSION_LEVELS[encoding]
+        if self.topic_list_cache is None or not organization_id:
+            return await run_in_threadpool(compress, body, encoding, level), encoding
+
+        key = (organization_id, version, query, media_type, encoding)
+        compressed = self.topic_list_cache.get(key)
+        if compressed is None:
+            compressed = await run_in_threadpool(compress, body, encoding, level)
+            self.topic_list_cache.set(key, compressed)
+        return compressed, encoding
+
+    async def _render_page(
+        self, organization_id: Optional[str], query: TopicListQuery, media_type: str
+    ) -> bytes:
+        topics: list[Topic] | list[TopicFields] | TopicColumns
+        if query.columnar:
+            topics, next_cursor = await self.get_topics_page_columns(organization_id, query)
+        else:
+            topics, next_cursor = await self.get_topics_page(organization_id, query)
+        return render({"topics": topics, "next_cursor": next_cursor}, media_type)
+
+    async def get_topics_by_topic_ids(
+        self, organization_id: Optional[str], topic_ids: Sequence[str]
+    ) -> Tuple[Dict[str, Topic], list[str]]:
+        """Return the latest topic of each id, keyed by topic_id, and the ids not found."""
+        if not organization_id:
+            raise HTTPException(
+                status_code=400, detail="Authorization token missing tenant schema information."
+            )
+        unique_ids = list(dict.fromkeys(topic_ids))
+        rows: list[Topic] = await call_repository(
+            self.topic_repository.get_by_topic_ids, organization_id, unique_ids
+        )
+        found = {topic.topic_id: topic for topic in rows}
+        return found, [topic_id for topic_id in unique_ids if topic_id not in found]
+
+    async def get_topic_by_topic_id(
+        self,
+        organization_id: Optional[str],
+        topic_id: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[Topic | TopicFields]:
+        if not organization_id:
+            raise HTTPException(
+                status_code=400, detail="Authorization token missing tenant schema information."
+            )
+        if fields is not None:
+            projected: Optional[TopicFields] = await call_repository(
+                self.topic_repository.get_fields_by_topic_id, organization_id, topic_id, fields
+            )
+            return projected
+        topic: Optional[Topic] = await call_repository(
+            self.topic_repository.get_by_topic_id, organization_id, topic_id
+        )
+        return topic
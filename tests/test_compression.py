@@ -0,0 +1,88 @@
+import gzip
+from typing import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from web.compression import CompressionMiddleware, compression_levels, negotiate
+from web.negotiation import negotiate_media_type
+
+BODY = "repetitive label, s3://bucket/icon.png " * 100
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+
+@app.get("/large")
+async def large() -> PlainTextResponse:
+    return PlainTextResponse(BODY, headers={"ETag": '"v1"'})
+
+
+@app.get("/small")
+async def small() -> PlainTextResponse:
+    return PlainTextResponse("tiny")
+
+
+@app.get("/stream")
+@compression_levels(gzip=1)
+async def stream() -> StreamingResponse:
+    async def lines() -> AsyncIterator[bytes]:
+        for number in range(3):
+            yield f'{{"line": {number}}}\n'.encode()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, br, zstd", "zstd"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("*", "zstd"),
+        ("*;q=0, gzip", "gzip"),
+        ("identity", None),
+        ("br;q=0", None),
+        (None, None),
+    ],
+)
+def test_negotiate_prefers_client_weights_then_server_order(
+    header: str | None, expected: str | None
+) -> None:
+    assert negotiate(header) == expected
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("application/msgpack", "application/msgpack"),
+        ("application/x-msgpack, application/json;q=0.5", "application/msgpack"),
+        ("application/json, application/msgpack", "application/json"),
+        ("*/*", "application/json"),
+        ("application/msgpack;q=0", "application/json"),
+        (None, "application/json"),
+    ],
+)
+def test_negotiate_media_type_prefers_json_on_ties(header: str | None, expected: str) -> None:
+    assert negotiate_media_type(header) == expected
+
+
+def test_middleware_compresses_large_and_streamed_bodies_only() -> None:
+    client = TestClient(app)
+
+    response = client.get("/large", headers={"Accept-Encoding": "br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert int(response.headers["content-length"]) < len(BODY) / 10
+    assert response.text == BODY
+
+    assert "content-encoding" not in client.get("/small").headers
+    assert "content-encoding" not in client.get("/large", headers={"Accept-Encoding": "x"}).headers
+
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        raw = b"".join(response.iter_raw())
+    assert gzip.decompress(raw) == b'{"line": 0}\n{"line": 1}\n{"line": 2}\n'
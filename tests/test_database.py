@@ -0,0 +1,295 @@
+import asyncio
+import datetime
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterator, List
+
+import pytest
+from fastapi import Request
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, select
+
+from database.json_array import json_array_contains
+from database.public_models.models import CIClient
+from database.replicas import ReplicaSet
+from database.session import DBSession
+from database.tenant_models.models import GrowthOpportunity, Source, Topic
+from database.tenant_routing import TenantRouting, schema_translate_options
+from database.unit_of_work import UnitOfWork
+from repositories.reverse_lookup_repository import ReverseLookupRepository
+from repositories.tenant_registry_repository import Tenant, TenantRegistry, TenantRegistryRepository
+from routes.dependencies import get_unit_of_work
+
+
+def make_engine() -> Engine:
+    return create_engine("sqlite://", poolclass=StaticPool)
+
+
+def record(engine: Engine, event_name: str) -> List[Any]:
+    calls: List[Any] = []
+    event.listen(engine, event_name, lambda *args: calls.append(args))
+    return calls
+
+
+def test_unit_of_work_shares_one_connection_and_skips_commit_when_read_only() -> None:
+    engine = make_engine()
+    checkouts = record(engine, "checkout")
+    commits = record(engine, "commit")
+    uow = UnitOfWork(sessionmaker(bind=engine, class_=Session), read_only=True)
+
+    with uow.session() as first:
+        first.execute(text("SELECT 1"))
+    with uow.session() as second:
+        second.execute(text("SELECT 2"))
+    uow.close()
+
+    assert first is second
+    assert len(checkouts) == 1
+    assert commits == []
+    assert not uow.in_use
+
+
+def test_unit_of_work_commits_once_when_writable() -> None:
+    engine = make_engine()
+    commits = record(engine, "commit")
+    uow = UnitOfWork(sessionmaker(bind=engine, class_=Session))
+
+    for _ in range(3):
+        with uow.session() as session:
+            session.execute(text("SELECT 1"))
+    uow.close()
+
+    assert len(commits) == 1
+
+
+def test_request_unit_of_work_is_released_when_the_request_is_cancelled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from database import manager as db_manager
+
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    checkins = record(engine, "checkin")
+    uow = UnitOfWork(sessionmaker(bind=engine, class_=Session))
+    monkeypatch.setattr(db_manager, "async_db", None)
+    monkeypatch.setattr(db_manager, "db", SimpleNamespace(unit_of_work=lambda read_only: uow))
+    request = Request({"type": "http", "method": "POST", "headers": []})
+
+    async def cancelled_request() -> None:
+        dependency = get_unit_of_work(request)
+        assert await dependency.__anext__() is uow
+        with uow.session() as session:
+            session.execute(text("SELECT 1"))
+        with pytest.raises(asyncio.CancelledError):
+            await dependency.athrow(asyncio.CancelledError())
+
+    asyncio.run(cancelled_request())
+    assert not uow.in_use
+    assert len(checkins) == 1
+
+
+def test_schema_translate_routing_reuses_compiled_statement_across_tenants() -> None:
+    db = DBSession("sqlite://", tenant_routing=TenantRouting.SCHEMA_TRANSLATE)
+
+    @event.listens_for(db.engine, "connect")
+    def attach_tenant_schemas(dbapi_connection: Any, _: Any) -> None:
+        for schema in ("tenant_a", "tenant_b"):
+            dbapi_connection.execute(f"ATTACH DATABASE ':memory:' AS {schema}")
+
+    for schema in ("tenant_a", "tenant_b"):
+        tenant_engine = db.engine.execution_options(**schema_translate_options(schema))
+        SQLModel.metadata.create_all(tenant_engine, tables=[Topic.__table__])  # type: ignore[attr-defined]
+
+    executed: List[Any] = []
+    event.listen(
+        db.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, params, context, many: executed.append(
+            (statement, context.compiled)
+        ),
+    )
+    for schema in ("TENANT_A", "tenant_b"):
+        with db.tenant_session(schema) as session:
+            session.exec(select(Topic.tid)).all()
+
+    (first_sql, first_compiled), (second_sql, second_compiled) = executed
+    assert "tenant_a.client_interface_topicmodel" in first_sql
+    assert "tenant_b.client_interface_topicmodel" in second_sql
+    assert first_compiled is second_compiled
+    assert not any(sql.upper().startswith("SET") for sql, _ in executed)
+
+
+def test_read_only_sessions_use_healthy_replicas_and_fall_back_to_primary(tmp_path: Path) -> None:
+    db = DBSession(
+        f"sqlite:///{tmp_path / 'primary.db'}",
+        replica_urls=[
+            f"sqlite:///{tmp_path / 'replica.db'}",
+            f"sqlite:///{tmp_path / 'missing' / 'replica.db'}",
+        ],
+    )
+    healthy, unreachable = db.replicas.replicas
+
+    for _ in range(2):
+        with db.session(read_only=True) as session:
+            assert session.get_bind() is healthy.engine
+    assert unreachable.down_until > 0
+
+    with db.session() as session:
+        assert session.get_bind() is db.engine
+
+    healthy.down_until = float("inf")
+    with db.session(read_only=True) as session:
+        assert session.get_bind() is db.engine
+
+
+def test_replica_set_skips_lagging_replicas_until_rechecked() -> None:
+    now = [0.0]
+    engines = [
+        create_engine("postgresql://replica-a/db"),
+        create_engine("postgresql://replica-b/db"),
+    ]
+    replicas = ReplicaSet(engines, max_lag_seconds=5, lag_check_interval=10, clock=lambda: now[0])
+    first, second = replicas.replicas
+
+    replicas.record_lag(first, 30.0)
+    replicas.record_lag(second, 0.0)
+    assert replicas.candidates() == [second]
+
+    now[0] = 10.0
+    assert first in replicas.candidates()
+    replicas.record_lag(first, 1.0)
+    assert {r.engine for r in replicas.candidates()} == set(engines)
+
+
+def test_json_array_contains_renders_indexable_jsonb_containment() -> None:
+    def statement(tid: int) -> Any:
+        return select(Source.soid).where(json_array_contains(Source.topic_ids, tid))
+
+    assert statement(5)._generate_cache_key().key == statement(6)._generate_cache_key().key
+    compiled = statement(5).compile(dialect=postgresql.dialect())
+    assert "CAST(client_interface_sourcemodel.topic_ids AS JSONB) @> CAST(" in str(compiled)
+    assert list(compiled.params.values()) == ["[5]"]
+
+
+def test_reverse_lookups_match_json_array_members() -> None:
+    engine = make_engine()
+    SQLModel.metadata.create_all(
+        engine, tables=[Source.__table__, GrowthOpportunity.__table__]  # type: ignore[attr-defined]
+    )
+    now = datetime.datetime.now(datetime.UTC)
+
+    def source(soid: int, topic_ids: List[int], for_deletion: bool = False) -> Source:
+        return Source(
+            soid=soid,
+            sow_sid=1,
+            source_url="u",
+            source_title="s",
+            topic_ids=topic_ids,
+            load_date=now,
+            masterfile_version=1,
+            for_deletion=for_deletion,
+        )
+
+    def opportunity(goid: int, topic_ids: List[str]) -> GrowthOpportunity:
+        return GrowthOpportunity(
+            goid=goid,
+            load_date=now,
+            name="n",
+            market="m",
+            category="c",
+            customer_segment="s",
+            customer_segment_description="d",
+            customer_segment_occasion="o",
+            granular_consumer_need="g",
+            potential_customers=1,
+            avr_annual_spend=Decimal(1),
+            customer_segment_market_size=Decimal(1),
+            growth_opportunity_id=f"go-{goid}",
+            description="d",
+            customer_need="n",
+            topic_ids=topic_ids,
+            geography_id="g",
+            geography_name="G",
+            growth_space_market_size=Decimal(1),
+            market_level_market_size=Decimal(1),
+        )
+
+    with Session(engine) as session:
+        session.add_all([source(1, [5, 12]), source(2, [125]), source(3, [5], True)])
+        session.add_all([source(4, [12, 5]), opportunity(1, ["t-5"]), opportunity(2, ["5"])])
+        session.commit()
+
+    class Provider:
+        @contextmanager
+        def session(self, read_only: bool = False) -> Iterator[Session]:
+            with Session(engine) as session:
+                yield session
+
+        def tenant_session(self, schema: str, read_only: bool = False) -> Any:
+            return self.session(read_only)
+
+    repo = ReverseLookupRepository(Provider())  # type: ignore[arg-type]
+    assert [s.soid for s in repo.get_sources_for_topic("tenant", 5)] == [1, 4]
+    assert [s.soid for s in repo.get_sources_for_topic("tenant", 125)] == [2]
+    assert [o.goid for o in repo.get_growth_opportunities_for_topic("tenant", "5")] == [2]
+
+
+def test_tenant_registry_reloads_only_when_the_mapping_changes() -> None:
+    engine = make_engine()
+
+    @event.listens_for(engine, "connect")
+    def attach_public_schema(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS public")
+
+    SQLModel.metadata.create_all(engine, tables=[CIClient.__table__])  # type: ignore[attr-defined]
+    with Session(engine) as session:
+        session.add(CIClient(schema_name="Acme", name="Acme", org_id="ORG-1"))
+        session.commit()
+
+    class Provider:
+        @contextmanager
+        def session(self, read_only: bool = False) -> Iterator[Session]:
+            with Session(engine) as session:
+                yield session
+
+    statements = record(engine, "before_cursor_execute")
+    registry = TenantRegistry(TenantRegistryRepository(Provider()))  # type: ignore[arg-type]
+    registry.load()
+    assert registry.resolve("org-1") == Tenant("ORG-1", "acme")
+    assert registry.resolve("org-2") is None
+
+    loaded = len(statements)
+    assert not registry.refresh()
+    assert len(statements) == loaded + 1
+
+    with Session(engine) as session:
+        session.add(CIClient(schema_name="globex", name="Globex", org_id="org-2"))
+        session.commit()
+    assert registry.refresh()
+    assert registry.resolve("ORG-2") == Tenant("org-2", "globex")
+    assert registry.stats()["rejected"] == 1
+
+    def rename(org_id: str, schema_name: str) -> None:
+        with Session(engine) as session:
+            client = session.exec(select(CIClient).where(CIClient.org_id == org_id)).one()
+            client.schema_name = schema_name
+            session.add(client)
+            session.commit()
+
+    rename("ORG-1", "acmf")
+    assert registry.refresh()
+    assert registry.resolve("org-1") == Tenant("ORG-1", "acmf")
+
+    rename("ORG-1", "globex")
+    rename("org-2", "acmf")
+    assert registry.refresh()
+    assert registry.resolve("org-1") == Tenant("ORG-1", "globex")
+    assert registry.resolve("org-2") == Tenant("org-2", "acmf")
+    assert not registry.refresh()
@@ -0,0 +1,166 @@
+import asyncio
+import csv
+import datetime
+import io
+import json
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any, Generator, Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, MetaData, Numeric, Table, create_engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+
+from database.tenant_models.models import Driver
+from jwt_validator import validate_jwt
+from main import app
+from repositories.export_repository import ExportRepository
+from repositories.tenant_registry_repository import Tenant
+from routes.dependencies import resolve_tenant
+from routes.export_router import get_export_service
+from services.export_service import ExportService
+
+
+class SqliteProvider:
+    def __init__(self, drivers: int) -> None:
+        self.engine = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        SQLModel.metadata.create_all(self.engine, tables=[Driver.__table__])  # type: ignore[attr-defined]
+        self.open_sessions = 0
+        now = datetime.datetime(2025, 1, 1)
+        with self.session() as session:
+            session.add_all(
+                Driver(
+                    did=did,
+                    sow_sid=10,
+                    load_date=now,
+                    driver_id=f"d{did}",
+                    driver_name=f"Driver, {did}",
+                    masterfile_version=1,
+                )
+                for did in range(drivers, 0, -1)
+            )
+
+    @contextmanager
+    def session(self, read_only: bool = False) -> Iterator[Session]:
+        self.open_sessions += 1
+        try:
+            with Session(self.engine) as session:
+                yield session
+                session.commit()
+        finally:
+            self.open_sessions -= 1
+
+    def tenant_session(self, schema: str, read_only: bool = False) -> Any:
+        return self.session(read_only)
+
+
+@pytest.fixture
+def client() -> Generator[TestClient, None, None]:
+    app.dependency_overrides[validate_jwt] = lambda: {"orgId": "test_schema"}
+    app.dependency_overrides[resolve_tenant] = lambda: Tenant("test_schema", "test_schema")
+    yield TestClient(app)
+    app.dependency_overrides = {}
+
+
+def test_export_streams_capped_rows_in_batches(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    provider = SqliteProvider(drivers=7)
+    app.dependency_overrides[get_export_service] = lambda: ExportService(ExportRepository(provider))  # type: ignore[arg-type]
+    monkeypatch.setattr("routes.export_router.EXPORT_ROW_CAP", 5)
+    monkeypatch.setattr("routes.export_router.EXPORT_BATCH_SIZE", 2)
+
+    response = client.get("/api/v2/exports/drivers")
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["did"] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]["load_date"] == "2025-01-01T00:00:00"
+
+    response = client.get("/api/v2/exports/drivers?format=csv")
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = list(csv.reader(io.StringIO(response.text)))
+    assert lines[0][:3] == ["did", "sow_sid", "load_date"]
+    assert [line[0] for line in lines[1:]] == ["1", "2", "3", "4", "5"]
+    assert lines[1][4] == "Driver, 1"
+
+    monkeypatch.setattr("routes.export_router.EXPORT_ROW_CAPS", {"test_schema": 3})
+    response = client.get("/api/v2/exports/drivers")
+    assert response.headers["x-export-row-cap"] == "3"
+    assert len(response.text.splitlines()) == 3
+
+    assert client.get("/api/v2/exports/users").status_code == 404
+    assert client.get("/api/v2/exports/drivers?format=xml").status_code == 422
+    assert provider.open_sessions == 0
+
+
+def test_export_stops_reading_when_the_client_disconnects() -> None:
+    provider = SqliteProvider(drivers=10)
+    statements: List[str] = []
+    event.listen(provider.engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    service = ExportService(ExportRepository(provider))  # type: ignore[arg-type]
+    batches = 0
+
+    async def is_disconnected() -> bool:
+        return batches >= 2
+
+    async def consume() -> None:
+        nonlocal batches
+        async for _ in service.stream_table(
+            "test_schema", "drivers", "ndjson", 100, 3, is_disconnected
+        ):
+            batches += 1
+            assert provider.open_sessions == 1
+
+    asyncio.run(consume())
+    assert batches == 2
+    assert len(statements) == 1
+    assert provider.open_sessions == 0
+
+
+@pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+def test_columnar_export_has_typed_columns(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, export_format: str
+) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    provider = SqliteProvider(drivers=5)
+    app.dependency_overrides[get_export_service] = lambda: ExportService(ExportRepository(provider))  # type: ignore[arg-type]
+    monkeypatch.setattr("routes.export_router.EXPORT_BATCH_SIZE", 2)
+
+    response = client.get(f"/api/v2/exports/drivers?format={export_format}")
+    if export_format == "arrow":
+        assert len(list(pa.ipc.open_stream(response.content))) == 3
+        table = pa.ipc.open_stream(response.content).read_all()
+    else:
+        table = pq.read_table(io.BytesIO(response.content))
+        assert pq.ParquetFile(io.BytesIO(response.content)).num_row_groups == 3
+
+    assert table.schema.field("did").type == pa.int32()
+    assert table.schema.field("load_date").type == pa.timestamp("us")
+    assert table.schema.field("for_deletion").type == pa.bool_()
+    assert table.column("driver_id").to_pylist() == ["d1", "d2", "d3", "d4", "d5"]
+
+
+@pytest.mark.parametrize("parquet", [False, True])
+def test_columnar_export_keeps_large_unconstrained_decimals(parquet: bool) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from web.arrow import ArrowEncoder
+
+    table = Table("amounts", MetaData(), Column("amount", Numeric(), nullable=True))
+    values = [Decimal("12345678901.25"), Decimal("99999999999999999999.5"), None]
+    encoder = ArrowEncoder(table, parquet=parquet)
+    body = encoder.start() + encoder.encode([{"amount": value} for value in values])
+    body += encoder.finish()
+
+    if parquet:
+        read = pq.read_table(io.BytesIO(body))
+    else:
+        read = pa.ipc.open_stream(body).read_all()
+    assert read.column("amount").to_pylist() == values
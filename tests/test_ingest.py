@@ -0,0 +1,200 @@
+import datetime
+import json
+from contextlib import contextmanager
+from typing import Any, Generator, Iterator, List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, select
+
+from database.tenant_models.models import Driver, TenantSow, Topic, Topic2Driver, TopicDelta, Trend
+from jwt_validator import validate_jwt
+from main import app
+from repositories.ingest_repository import IngestRepository, _copy_data, _sequence_statements
+from repositories.reference_data_repository import CachedReferenceDataRepository
+from repositories.tenant_registry_repository import Tenant
+from routes.dependencies import resolve_tenant
+from routes.ingest_router import get_ingest_service
+from services.ingest_service import MIXED_KEYS_ERROR, IngestService
+
+
+class SqliteProvider:
+    def __init__(self) -> None:
+        self.engine = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+        tables = [TenantSow, Trend, Driver, Topic, Topic2Driver, TopicDelta]
+        SQLModel.metadata.create_all(self.engine, tables=[t.__table__ for t in tables])  # type: ignore[attr-defined]
+
+    @contextmanager
+    def session(self, read_only: bool = False) -> Iterator[Session]:
+        with Session(self.engine) as session:
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
+    def tenant_session(self, schema: str, read_only: bool = False) -> Any:
+        return self.session(read_only)
+
+
+def topic_line(tid: int, **fields: Any) -> str:
+    row = {"tid": tid, "load_date": "2025-01-01T00:00:00", "topic_id": f"t{tid}"}
+    row.update({"topic_name": "Topic", "topic_status": 1, "sid": 99, **fields})
+    return json.dumps(row)
+
+
+@pytest.fixture
+def provider() -> Generator[SqliteProvider, None, None]:
+    provider = SqliteProvider()
+    now = datetime.datetime(2025, 1, 1)
+    with provider.session() as session:
+        session.add(
+            TenantSow(sid=10, load_date=now, sow_name="S", sow_status="a", masterfile_version=1)
+        )
+        session.add(Topic.model_validate(json.loads(topic_line(1, sid=10, masterfile_version=1))))
+        session.add(Topic2Driver(topic_tid=1, driver_did=6))
+    app.dependency_overrides[validate_jwt] = lambda: {
+        "orgId": "test_schema",
+        "scope": "topics:read masterfile:write",
+    }
+    app.dependency_overrides[resolve_tenant] = lambda: Tenant("test_schema", "test_schema")
+    app.dependency_overrides[get_ingest_service] = lambda: IngestService(
+        IngestRepository(provider)  # type: ignore[arg-type]
+    )
+    yield provider
+    app.dependency_overrides = {}
+
+
+def test_ingest_swaps_in_the_new_masterfile_atomically(
+    provider: SqliteProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("routes.ingest_router.INGEST_BATCH_SIZE", 1)
+    client = TestClient(app)
+    files = {
+        "topics": ("topics.ndjson", "\n".join([topic_line(2), "", topic_line(3)])),
+        "drivers": ("drivers.csv", "did,load_date,driver_id,driver_name\n7,2025-01-01,d7,Driver\n"),
+        "topic2drivers": ("links.ndjson", json.dumps({"topic_tid": 2, "driver_did": 7})),
+    }
+
+    response = client.post("/api/v2/ingest/10?masterfile_version=2", files=files)
+    assert response.status_code == 200
+    report = response.json()
+    assert report["rows"] == {"drivers": 1, "topics": 2, "topic2drivers": 1}
+    assert report["total_rows"] == 4 and report["rows_per_second"] > 0
+
+    with provider.session() as session:
+        topics = {t.tid: t for t in session.exec(select(Topic)).all()}
+        assert [tid for tid, t in sorted(topics.items()) if not t.for_deletion] == [2, 3]
+        assert {(t.sid, t.masterfile_version) for t in topics.values() if t.tid != 1} == {(10, 2)}
+        assert session.exec(select(Driver)).one().sow_sid == 10
+        links = session.exec(select(Topic2Driver)).all()
+        assert [(link.topic_tid, link.driver_did) for link in links] == [(2, 7)]
+        assert session.exec(select(TenantSow)).one().masterfile_version == 2
+
+    assert client.post("/api/v2/ingest/10?masterfile_version=2", files=files).status_code == 409
+    assert client.post("/api/v2/ingest/11?masterfile_version=3", files=files).status_code == 404
+
+
+def test_ingest_rolls_back_on_an_invalid_row(provider: SqliteProvider) -> None:
+    bad = "\n".join([topic_line(2), topic_line(3, topic_status="high")])
+    response = TestClient(app).post(
+        "/api/v2/ingest/10?masterfile_version=2", files={"topics": ("topics.ndjson", bad)}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"]["line"] == 2
+    assert response.json()["detail"]["errors"][0]["loc"] == ["topic_status"]
+
+    with provider.session() as session:
+        assert [t.tid for t in session.exec(select(Topic)).all()] == [1]
+        assert session.exec(select(TenantSow)).one().masterfile_version == 1
+
+
+def test_copy_data_escapes_text_format() -> None:
+    row = {"a": None, "b": True, "c": "tab\there\\", "d": [1, 2]}
+    assert _copy_data([row], ["a", "b", "c", "d"]) == b"\\N\tt\ttab\\there\\\\\t[1, 2]\n"
+
+
+def test_ingest_rejects_tables_mixing_supplied_and_generated_keys(
+    provider: SqliteProvider,
+) -> None:
+    keyless = {k: v for k, v in json.loads(topic_line(3)).items() if k != "tid"}
+    mixed = "\n".join([topic_line(2), json.dumps(keyless)])
+    response = TestClient(app).post(
+        "/api/v2/ingest/10?masterfile_version=2", files={"topics": ("topics.ndjson", mixed)}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"] == {
+        "table": "topics",
+        "line": 2,
+        "errors": [MIXED_KEYS_ERROR],
+    }
+
+
+def test_ingest_with_supplied_keys_leaves_room_for_ordinary_inserts(
+    provider: SqliteProvider,
+) -> None:
+    topics = "\n".join([topic_line(40), topic_line(41)])
+    response = TestClient(app).post(
+        "/api/v2/ingest/10?masterfile_version=2", files={"topics": ("topics.ndjson", topics)}
+    )
+    assert response.status_code == 200
+
+    with provider.session() as session:
+        row = json.loads(topic_line(0, sid=10, masterfile_version=2))
+        fresh = Topic.model_validate({k: v for k, v in row.items() if k != "tid"})
+        session.add(fresh)
+        session.flush()
+        assert fresh.tid == 42
+
+    (statement,) = _sequence_statements(postgresql.dialect(), "test_schema", ["topics"])
+    assert str(statement.compile(dialect=postgresql.dialect())) == (
+        "SELECT setval(pg_get_serial_sequence(%(pg_get_serial_sequence_1)s, "
+        "%(pg_get_serial_sequence_2)s), max(client_interface_topicmodel.tid)) AS setval_1 "
+        "\nFROM client_interface_topicmodel"
+    )
+    assert statement.compile().params["pg_get_serial_sequence_1"] == (
+        "test_schema.client_interface_topicmodel"
+    )
+
+
+def test_ingest_requires_the_masterfile_write_scope(provider: SqliteProvider) -> None:
+    client = TestClient(app)
+    files = {"topics": ("topics.ndjson", topic_line(2))}
+    for claims in ({"orgId": "test_schema"}, {"orgId": "test_schema", "scope": "topics:read"}):
+        app.dependency_overrides[validate_jwt] = lambda: claims
+        response = client.post("/api/v2/ingest/10?masterfile_version=2", files=files)
+        assert response.status_code == 403
+
+    with provider.session() as session:
+        assert [t.tid for t in session.exec(select(Topic)).all()] == [1]
+
+
+def test_successful_ingest_invalidates_cached_reference_data(provider: SqliteProvider) -> None:
+    calls: List[str] = []
+
+    class CountingRepo:
+        def get_client_tier_id(self, org_id: str) -> Optional[int]:
+            calls.append(org_id)
+            return 1
+
+    reference_data = CachedReferenceDataRepository(CountingRepo())  # type: ignore[arg-type]
+    app.dependency_overrides[get_ingest_service] = lambda: IngestService(
+        IngestRepository(provider), reference_data  # type: ignore[arg-type]
+    )
+    client = TestClient(app)
+    files = {"topics": ("topics.ndjson", topic_line(2))}
+
+    reference_data.get_client_tier_id("acme")
+    assert client.post("/api/v2/ingest/10?masterfile_version=2", files=files).status_code == 200
+    reference_data.get_client_tier_id("acme")
+    assert calls == ["acme", "acme"]
+
+    assert client.post("/api/v2/ingest/10?masterfile_version=2", files=files).status_code == 409
+    reference_data.get_client_tier_id("acme")
+    assert calls == ["acme", "acme"]
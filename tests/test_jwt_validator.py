@@ -0,0 +1,38 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+import jwt_validator
+from jwt_validator import ALGORITHM, SECRET_KEY, jwt_cache_stats, validate_jwt
+
+
+def bearer(**claims: object) -> HTTPAuthorizationCredentials:
+    token = jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_verified_claims_are_cached_until_exp(monkeypatch: pytest.MonkeyPatch) -> None:
+    jwt_validator._claims_cache.invalidate()
+    credentials = bearer(orgId="acme", exp=int(time.time()) + 60)
+    verifications = jwt_cache_stats()["verifications"]
+
+    assert validate_jwt(credentials)["orgId"] == "acme"
+    assert validate_jwt(credentials)["orgId"] == "acme"
+    assert jwt_cache_stats()["verifications"] == verifications + 1
+
+    now = time.time()
+    monkeypatch.setattr(jwt_validator.time, "time", lambda: now + 61)
+    with pytest.raises(HTTPException) as error:
+        validate_jwt(credentials)
+    assert error.value.status_code == 401
+
+
+def test_tokens_without_exp_or_invalid_are_not_cached() -> None:
+    jwt_validator._claims_cache.invalidate()
+    validate_jwt(bearer(orgId="acme"))
+    with pytest.raises(HTTPException):
+        validate_jwt(HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-jwt"))
+    assert jwt_cache_stats()["size"] == 0
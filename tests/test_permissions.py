@@ -1,5 +1,6 @@
 import datetime
-from typing import Generator, List, Optional
+from contextlib import contextmanager
+from typing import Any, Generator, List, Optional
 
 import pytest
 from fastapi.testclient import TestClient
@@ -9,6 +10,10 @@ from database.public_models.models import Experiment
 from database.tenant_models.models import TenantSow
 from jwt_validator import validate_jwt
 from main import app
+from repositories.permissions_repository import PermissionsBundle, PermissionsRepository
+from repositories.reference_data_repository import CachedReferenceDataRepository
+from repositories.tenant_registry_repository import Tenant
+from routes.dependencies import resolve_tenant
 from routes.permissions_router import get_permissions_service
 from services.permissions_service import PermissionsService
 
@@ -19,6 +24,7 @@ def client() -> Generator[TestClient, None, None]:
         return {"orgId": "test_schema"}
 
     app.dependency_overrides[validate_jwt] = override_validate_jwt
+    app.dependency_overrides[resolve_tenant] = lambda: Tenant("test_schema", "test_schema")
     test_client = TestClient(app)
 
     yield test_client
@@ -51,24 +57,26 @@ def make_experiment() -> Experiment:
     )
 
 
-def test_get_permissions_success(client: TestClient) -> None:
-    class FakeRepo:
-        def get_sow(self, tenant_schema: str, sow_id: int) -> TenantSow:  # type: ignore[return]
-            return make_sow()
+def make_bundle(**overrides: Any) -> PermissionsBundle:
+    sow = make_sow()
+    return PermissionsBundle(sow_sid=sow.sid, cs_sow_id=sow.cs_sow_id, **overrides)  # type: ignore[arg-type]
 
-        def get_client_tier_id(self, org_id: str) -> int:
-            return 1
 
-        def get_feature_codes(self, tier_id: int) -> List[str]:
-            return ["displays_growth_opportunities", "api_access"]
+class FakeReferenceData:
+    def __init__(self, feature_codes: Optional[List[str]] = None) -> None:
+        self.feature_codes = feature_codes or []
+
+    def get_feature_codes_for_org(self, org_id: str) -> List[str]:
+        return self.feature_codes
 
-        def get_experiments(self, cs_sow_id: Optional[str]) -> List[Experiment]:
-            return [make_experiment()]
 
-        def has_opportunity_platforms(self, tenant_schema: str, sow_sid: int) -> bool:
-            return True
+def test_get_permissions_success(client: TestClient) -> None:
+    class FakeRepo:
+        def get_permissions_bundle(self, tenant_schema: str, sow_id: int) -> PermissionsBundle:
+            return make_bundle(experiments=[make_experiment()], has_opportunity_platforms=True)
 
-    app.dependency_overrides[get_permissions_service] = lambda: PermissionsService(FakeRepo())  # type: ignore[arg-type]
+    reference_data = FakeReferenceData(["displays_growth_opportunities", "api_access"])
+    app.dependency_overrides[get_permissions_service] = lambda: PermissionsService(FakeRepo(), reference_data)  # type: ignore[arg-type]
 
     resp = client.get("/api/v2/permissions/42")
     assert resp.status_code == 200
@@ -85,22 +93,10 @@ def test_get_permissions_success(client: TestClient) -> None:
 
 def test_get_permissions_sow_not_found(client: TestClient) -> None:
     class FakeRepo:
-        def get_sow(self, tenant_schema: str, sow_id: int) -> None:
+        def get_permissions_bundle(self, tenant_schema: str, sow_id: int) -> None:
             return None
 
-        def get_client_tier_id(self, org_id: str) -> int:
-            return 1
-
-        def get_feature_codes(self, tier_id: int) -> List[str]:
-            return []
-
-        def get_experiments(self, cs_sow_id: Optional[str]) -> List[Experiment]:
-            return []
-
-        def has_opportunity_platforms(self, tenant_schema: str, sow_sid: int) -> bool:
-            return False
-
-    app.dependency_overrides[get_permissions_service] = lambda: PermissionsService(FakeRepo())  # type: ignore[arg-type]
+    app.dependency_overrides[get_permissions_service] = lambda: PermissionsService(FakeRepo(), FakeReferenceData())  # type: ignore[arg-type]
 
     resp = client.get("/api/v2/permissions/999")
     assert resp.status_code == 404
@@ -109,22 +105,10 @@ def test_get_permissions_sow_not_found(client: TestClient) -> None:
 
 def test_get_permissions_no_features(client: TestClient) -> None:
     class FakeRepo:
-        def get_sow(self, tenant_schema: str, sow_id: int) -> TenantSow:  # type: ignore[return]
-            return make_sow()
-
-        def get_client_tier_id(self, org_id: str) -> None:
-            return None
-
-        def get_feature_codes(self, tier_id: int) -> List[str]:
-            return []
+        def get_permissions_bundle(self, tenant_schema: str, sow_id: int) -> PermissionsBundle:
+            return make_bundle()
 
-        def get_experiments(self, cs_sow_id: Optional[str]) -> List[Experiment]:
-            return []
-
-        def has_opportunity_platforms(self, tenant_schema: str, sow_sid: int) -> bool:
-            return False
-
-    app.dependency_overrides[get_permissions_service] = lambda: PermissionsService(FakeRepo())  # type: ignore[arg-type]
+    app.dependency_overrides[get_permissions_service] = lambda: PermissionsService(FakeRepo(), FakeReferenceData())  # type: ignore[arg-type]
 
     resp = client.get("/api/v2/permissions/42")
     assert resp.status_code == 200
@@ -132,3 +116,70 @@ def test_get_permissions_no_features(client: TestClient) -> None:
     assert data["permissions"] == {}
     assert data["opportunity_platforms"] is False
     assert data["experiments"] == []
+
+
+def test_permissions_bundle_is_a_single_round_trip() -> None:
+    sow, experiment = make_sow(), make_experiment()
+    rows = [
+        (sow.sid, sow.cs_sow_id, True, experiment),
+        (sow.sid, sow.cs_sow_id, True, make_experiment()),
+    ]
+    statements: List[Any] = []
+
+    class RecordingSession:
+        def exec(self, statement: Any) -> Any:
+            statements.append(statement)
+            return type("Result", (), {"all": lambda self: rows})()
+
+    class RecordingProvider:
+        @contextmanager
+        def session(self, read_only: bool = False) -> Generator[RecordingSession, None, None]:
+            yield RecordingSession()
+
+        def tenant_session(self, schema: str, read_only: bool = False) -> Any:
+            return self.session(read_only)
+
+    bundle = PermissionsRepository(RecordingProvider()).get_permissions_bundle("test_schema", 42)
+
+    assert len(statements) == 1
+    assert bundle == make_bundle(
+        experiments=[experiment, rows[1][3]], has_opportunity_platforms=True
+    )
+
+
+def test_reference_data_is_cached_until_ttl_or_invalidation() -> None:
+    calls: List[str] = []
+
+    class CountingRepo:
+        def get_client_tier_id(self, org_id: str) -> Optional[int]:
+            calls.append(f"tier:{org_id}")
+            return 1 if org_id == "acme" else None
+
+        def get_feature_codes(self, tier_id: int) -> List[str]:
+            calls.append(f"features:{tier_id}")
+            return ["api_access"]
+
+    now = [0.0]
+    reference_data = CachedReferenceDataRepository(CountingRepo(), ttl=60, max_clients=1)  # type: ignore[arg-type]
+    for cache in (reference_data.client_tiers, reference_data.tier_features):
+        cache._clock = lambda: now[0]
+
+    assert reference_data.get_feature_codes_for_org("ACME") == ["api_access"]
+    assert reference_data.get_feature_codes_for_org("acme") == ["api_access"]
+    assert calls == ["tier:acme", "features:1"]
+
+    now[0] = 61
+    reference_data.get_feature_codes_for_org("acme")
+    assert calls[2:] == ["tier:acme", "features:1"]
+
+    reference_data.invalidate()
+    assert reference_data.get_feature_codes_for_org("other") == []
+    assert reference_data.get_feature_codes_for_org("other") == []
+    reference_data.get_feature_codes_for_org("acme")  # evicts "other" (max_clients=1)
+    reference_data.get_feature_codes_for_org("other")
+    assert calls[4:] == ["tier:other", "tier:acme", "features:1", "tier:other"]
+
+    stats = reference_data.stats()["client_tiers"]
+    assert stats["expirations"] == 1
+    assert stats["evictions"] == 2
+    assert stats["size"] == 1
@@ -0,0 +1,122 @@
+import datetime
+import json
+from decimal import Decimal
+from typing import Any
+
+import msgpack
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from database.tenant_models.enums import MaturityCategory
+from database.tenant_models.models import MaturityScore, Topic
+from web.negotiation import MSGPACK_MEDIA_TYPE
+from web.responses import ApiResponse, render_msgpack
+
+UTC = datetime.timezone.utc
+
+
+def legacy_body(content: Any) -> bytes:
+    """What routes returned before `ApiResponse`: `jsonable_encoder`, then `json.dumps`."""
+    return JSONResponse(jsonable_encoder(content)).body  # type: ignore[return-value]
+
+
+def make_score() -> MaturityScore:
+    return MaturityScore(
+        id=1,
+        topic_id=2,
+        category=list(MaturityCategory)[0],
+        score=Decimal("12345678901.250"),
+        created_at=datetime.datetime(2025, 1, 2, 3, 4, 5, 6),
+        updated_at=datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+    )
+
+
+def make_topic() -> Topic:
+    return Topic(
+        tid=1,
+        sid=10,
+        load_date=datetime.datetime(2025, 1, 2, 3, 4, 5),
+        topic_id="t1",
+        topic_name="Thé",
+        topic_status=1,
+        topic_growth_normalized=0.25,
+        average_sizing_label="",
+        timeline_label="",
+        topic_consensus_label="",
+        industry_impact_label="",
+        action_required="",
+        masterfile_version=1,
+        for_deletion=False,
+        new_discovery=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        make_topic(),
+        {"topics": [make_topic(), make_topic()], "next_cursor": None},
+        {"score": make_score(), "count": 3, "labels": ("a", "b")},
+        {"naive": datetime.datetime(2025, 1, 2, 3, 4, 5, 6), "day": datetime.date(2025, 1, 2)},
+    ],
+)
+def test_models_and_containers_render_as_before(content: Any) -> None:
+    assert ApiResponse(content).body == legacy_body(content)
+
+
+def test_plain_values_follow_pydantic_rules() -> None:
+    content = {
+        "decimal": Decimal("1.50"),
+        "utc": datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "elapsed": datetime.timedelta(seconds=90),
+        "missing": float("nan"),
+    }
+    assert json.loads(ApiResponse(content).body) == {
+        "decimal": "1.50",
+        "utc": "2025-01-02T03:04:05Z",
+        "elapsed": "PT1M30S",
+        "missing": None,
+    }
+    legacy = {"decimal": 1.5, "utc": "2025-01-02T03:04:05+00:00", "elapsed": 90.0}
+    assert json.loads(legacy_body({k: content[k] for k in legacy})) == legacy
+    with pytest.raises(ValueError):
+        legacy_body(content)
+
+
+def as_utc(value: Any) -> Any:
+    """JSON's rendering of a MessagePack value: naive timestamps are UTC, Z-suffixed."""
+    if isinstance(value, datetime.datetime):
+        return value.astimezone(UTC)
+    if isinstance(value, dict):
+        return {key: as_utc(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [as_utc(item) for item in value]
+    return value
+
+
+def parsed_json(value: Any, template: Any) -> Any:
+    """`value` from JSON with the strings that are datetimes in `template` parsed back."""
+    if isinstance(template, datetime.datetime):
+        return datetime.datetime.fromisoformat(value).replace(tzinfo=template.tzinfo)
+    if isinstance(template, dict):
+        return {key: parsed_json(value[key], template[key]) for key in template}
+    if isinstance(template, list):
+        return [parsed_json(item, part) for item, part in zip(value, template)]
+    return value
+
+
+def test_msgpack_carries_the_same_values_as_json() -> None:
+    content = {
+        "topics": [make_topic()],
+        "score": make_score(),
+        "decimal": Decimal("1.50"),
+        "when": datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+    }
+    unpacked = as_utc(msgpack.unpackb(render_msgpack(content), timestamp=3))
+    assert parsed_json(json.loads(ApiResponse(content).body), unpacked) == unpacked
+    assert unpacked["score"]["score"] == "12345678901.250"
+    assert unpacked["topics"][0]["topic_growth_normalized"] == 0.25
+
+    response = ApiResponse(content, media_type=MSGPACK_MEDIA_TYPE)
+    assert response.body == render_msgpack(content)
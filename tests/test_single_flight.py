@@ -0,0 +1,211 @@
+import datetime
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+import anyio
+import pytest
+from sqlalchemy import Engine, event
+from sqlmodel import Session, SQLModel, create_engine
+
+from caching import TTLCache
+from caching.single_flight import SingleFlight, coalesce, coalesce_async
+from database.tenant_models.models import Topic
+from database.tenant_routing import TenantRouting
+from database.unit_of_work import UnitOfWork
+from repositories.topic_repository import TopicListQuery, TopicRepository
+from services.topic_services import TopicListCache, TopicService
+from web.negotiation import JSON_MEDIA_TYPE
+from web.responses import render
+
+
+def release_when_coalesced(release: threading.Event, flights: SingleFlight, coalesced: int) -> None:
+    deadline = time.monotonic() + 5
+    while flights.stats()["coalesced"] < coalesced and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+
+
+def test_concurrent_identical_sync_calls_share_one_execution() -> None:
+    flights = SingleFlight()
+    release = threading.Event()
+    queries: List[str] = []
+
+    class Repo:
+        @coalesce(flights)
+        def get_page(self, tenant_schema: str, page: int) -> List[str]:
+            queries.append(tenant_schema)
+            release.wait(5)
+            return [f"{tenant_schema}-{page}"]
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        same = [pool.submit(Repo().get_page, "acme", 1) for _ in range(5)]
+        other = pool.submit(Repo().get_page, "globex", 1)
+        release_when_coalesced(release, flights, coalesced=4)
+        results = [future.result() for future in same]
+
+    assert other.result() == ["globex-1"]
+    assert sorted(queries) == ["acme", "globex"]
+    assert all(result is results[0] for result in results)
+    assert flights.stats() == {"executions": 2, "coalesced": 4, "errors": 0, "in_flight": 0}
+
+
+def test_concurrent_identical_async_calls_share_one_execution_and_its_error() -> None:
+    flights = SingleFlight()
+    queries: List[int] = []
+
+    class Repo:
+        @coalesce_async(flights)
+        async def get_bundle(self, tenant_schema: str, sow_id: int) -> int:
+            queries.append(sow_id)
+            await anyio.sleep(0.01)
+            if sow_id < 0:
+                raise LookupError(sow_id)
+            return sow_id * 10
+
+    async def main() -> None:
+        results: List[int] = []
+        errors: List[BaseException] = []
+
+        async def call(sow_id: int) -> None:
+            try:
+                results.append(await Repo().get_bundle("acme", sow_id))
+            except LookupError as error:
+                errors.append(error)
+
+        async with anyio.create_task_group() as group:
+            for sow_id in (1, 1, 1, -1, -1):
+                group.start_soon(call, sow_id)
+
+        assert results == [10, 10, 10]
+        assert len(errors) == 2 and errors[0] is errors[1]
+
+    anyio.run(main)
+    assert queries == [1, -1]
+    assert flights.stats() == {"executions": 2, "coalesced": 3, "errors": 1, "in_flight": 0}
+    assert anyio.run(Repo().get_bundle, "acme", 1) == 10
+    with pytest.raises(LookupError):
+        anyio.run(Repo().get_bundle, "acme", -1)
+
+
+def sqlite_topics_engine(path: Path, count: int) -> Engine:
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine, tables=[Topic.__table__])  # type: ignore[attr-defined]
+    now = datetime.datetime.now(datetime.UTC)
+    with Session(engine) as session:
+        for tid in range(1, count + 1):
+            session.add(
+                Topic(
+                    tid=tid,
+                    sid=10,
+                    load_date=now,
+                    topic_id=f"topic-{tid}",
+                    topic_name=f"Topic {tid}",
+                    topic_status=1,
+                    topic_description="desc",
+                    average_sizing_label="",
+                    timeline_label="",
+                    topic_consensus_label="",
+                    industry_impact_label="",
+                    action_required="",
+                    masterfile_version=1,
+                    for_deletion=False,
+                    new_discovery=False,
+                )
+            )
+        session.commit()
+    return engine
+
+
+def test_overlapping_topic_page_requests_each_render_their_own_rows(tmp_path: Path) -> None:
+    """Two requests for the same page, each with its own unit of work, overlap in
+    the page query; the first closes its unit of work before the other renders."""
+    engine = sqlite_topics_engine(tmp_path / "topics.db", count=3)
+    page_queries: List[str] = []
+
+    def slow_page_query(*args: Any) -> None:
+        if args[2].lstrip().startswith("SELECT") and "topic_id" in args[2]:
+            page_queries.append(args[2])
+            time.sleep(0.05)
+
+    event.listen(engine, "before_cursor_execute", slow_page_query)
+
+    async def request(query: TopicListQuery, render_delay: float) -> bytes:
+        # "main" is sqlite's own schema, so schema translation routes to the seeded table.
+        uow = UnitOfWork(
+            lambda: Session(engine), read_only=True, tenant_routing=TenantRouting.SCHEMA_TRANSLATE
+        )
+        service = TopicService(TopicRepository(uow))
+        try:
+            topics, next_cursor = await service.get_topics_page("main", query)
+            await anyio.sleep(render_delay)
+            return render({"topics": topics, "next_cursor": next_cursor}, JSON_MEDIA_TYPE)
+        finally:
+            await anyio.to_thread.run_sync(uow.close)
+
+    async def main(query: TopicListQuery) -> List[Dict[str, Any]]:
+        bodies: Dict[float, bytes] = {}
+
+        async def run(render_delay: float) -> None:
+            bodies[render_delay] = await request(query, render_delay)
+
+        async with anyio.create_task_group() as group:
+            group.start_soon(run, 0.0)
+            group.start_soon(run, 0.02)
+        return [json.loads(body) for body in bodies.values()]
+
+    for query in (TopicListQuery(limit=2), TopicListQuery(limit=2, fields=("topic_id",))):
+        page_queries.clear()
+        pages = anyio.run(main, query)
+        assert len(page_queries) == 2
+        for page in pages:
+            assert [topic["topic_id"] for topic in page["topics"]] == ["topic-1", "topic-2"]
+            assert page["next_cursor"] is not None
+        assert pages[0] == pages[1]
+    assert set(pages[0]["topics"][0]) == {"topic_id"}
+
+
+def test_overlapping_cached_page_misses_share_one_render(tmp_path: Path) -> None:
+    engine = sqlite_topics_engine(tmp_path / "topics.db", count=3)
+    page_queries: List[str] = []
+
+    def slow_page_query(*args: Any) -> None:
+        if args[2].lstrip().startswith("SELECT") and "topic_id" in args[2]:
+            page_queries.append(args[2])
+            time.sleep(0.05)
+
+    event.listen(engine, "before_cursor_execute", slow_page_query)
+    cache: TopicListCache = TTLCache(10, max_weight=10_000, weigher=len)
+    query = TopicListQuery(limit=2)
+
+    async def request() -> bytes:
+        uow = UnitOfWork(
+            lambda: Session(engine), read_only=True, tenant_routing=TenantRouting.SCHEMA_TRANSLATE
+        )
+        service = TopicService(TopicRepository(uow), cache)
+        try:
+            return await service.get_topics_page_serialized("main", query, version="1:1:")
+        finally:
+            await anyio.to_thread.run_sync(uow.close)
+
+    async def main() -> List[bytes]:
+        bodies: List[bytes] = []
+
+        async def run() -> None:
+            bodies.append(await request())
+
+        async with anyio.create_task_group() as group:
+            for _ in range(3):
+                group.start_soon(run)
+        return bodies
+
+    bodies = anyio.run(main)
+    assert len(page_queries) == 1
+    assert bodies[0] == bodies[1] == bodies[2]
+    assert [topic["topic_id"] for topic in json.loads(bodies[0])["topics"]] == [
+        "topic-1",
+        "topic-2",
+    ]
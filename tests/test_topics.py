@@ -1,14 +1,55 @@
+import asyncio
 import datetime
-from typing import Generator
+import json
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Dict, Generator, Iterator, List, Optional
 
+import msgpack
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from database.tenant_models.models import Topic
+from caching import TTLCache
+from database.tenant_models.enums import MaturityCategory
+from database.tenant_models.models import (
+    BaseGrowthOpportunity,
+    Driver,
+    Estimator,
+    GeographyGrowthOpportunity,
+    GrowthOpportunityTopics,
+    Market,
+    MaturityScore,
+    Opportunity,
+    Source,
+    TenantSow,
+    Topic,
+    Topic2Driver,
+    Topic2Opportunity,
+    Topic2Source,
+    Trend,
+)
 from jwt_validator import validate_jwt
 from main import app
-from routes.topic_router import get_topic_service
-from services.topic_services import TopicService
+from repositories.growth_opportunity_repository import GrowthOpportunityRepository
+from repositories.tenant_registry_repository import Tenant, TenantRegistry
+from repositories.topic_graph_repository import GRAPH_QUERY_COUNT, TopicGraphRepository
+from repositories.topic_repository import (
+    AsyncTopicRepository,
+    TopicListQuery,
+    TopicRepository,
+    sort_value,
+)
+from routes.dependencies import get_tenant_registry, resolve_tenant
+from routes.growth_opportunity_router import get_growth_opportunity_service
+from routes.topic_router import get_topic_graph_service, get_topic_service
+from services.growth_opportunity_service import GrowthOpportunityService
+from services.topic_graph_service import TopicGraphService
+from services.topic_services import TopicListCache, TopicService
+from web.pagination import encode_cursor
 
 
 @pytest.fixture
@@ -18,6 +59,7 @@ def client() -> Generator[TestClient, None, None]:
         return {"orgId": "test_schema"}
 
     app.dependency_overrides[validate_jwt] = override_validate_jwt
+    app.dependency_overrides[resolve_tenant] = lambda: Tenant("test_schema", "test_schema")
     client = TestClient(app)
 
     yield client
@@ -61,11 +103,18 @@ def make_topic(topic_id: str = "t1") -> Topic:
     )
 
 
+class VersionedRepo:
+    version = "1:1:"
+
+    def get_topics_version(self, tenant_schema: str) -> str:
+        return self.version
+
+
 def test_list_topics(monkeypatch: pytest.MonkeyPatch, client: TestClient) -> None:
     topics = [make_topic("topic-1"), make_topic("topic-2")]
 
-    class FakeRepo:
-        def get_all(self, tenant_schema):  # type: ignore[no-untyped-def]
+    class FakeRepo(VersionedRepo):
+        def get_page(self, tenant_schema, query):  # type: ignore[no-untyped-def]
             return topics
 
     app.dependency_overrides[get_topic_service] = lambda: TopicService(FakeRepo())  # type: ignore[arg-type]
@@ -80,10 +129,35 @@ def test_list_topics(monkeypatch: pytest.MonkeyPatch, client: TestClient) -> Non
     assert data["topics"][0]["topic_id"] == "topic-1"
 
 
+def test_unknown_tenants_are_rejected_before_any_query(client: TestClient) -> None:
+    class FakeRegistryRepo:
+        def get_fingerprint(self) -> tuple[int, ...]:
+            return (1,)
+
+        def get_tenants(self) -> dict[str, Tenant]:
+            return {"acme": Tenant("acme", "acme")}
+
+    registry = TenantRegistry(FakeRegistryRepo())  # type: ignore[arg-type]
+    del app.dependency_overrides[resolve_tenant]
+    app.dependency_overrides[get_tenant_registry] = lambda: registry
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(None)  # type: ignore[arg-type]
+
+    response = client.get("/api/v2/topics")
+    assert response.status_code == 403
+    assert registry.stats() | {"age_seconds": 0} == {
+        "tenants": 1,
+        "probes": 0,
+        "reloads": 1,
+        "rejected": 1,
+        "refresh_errors": 0,
+        "age_seconds": 0,
+    }
+
+
 def test_get_topic_found(monkeypatch: pytest.MonkeyPatch, client: TestClient) -> None:
     t = make_topic("topic-42")
 
-    class FakeRepo:
+    class FakeRepo(VersionedRepo):
         def get_by_topic_id(self, tenant_schema, topic_id):  # type: ignore[no-untyped-def]
             return t
 
@@ -97,7 +171,7 @@ def test_get_topic_found(monkeypatch: pytest.MonkeyPatch, client: TestClient) ->
 
 
 def test_get_topic_not_found(client: TestClient) -> None:
-    class FakeRepo:
+    class FakeRepo(VersionedRepo):
         def get_by_topic_id(self, tenant_schema: str, topic_id: str):  # type: ignore[no-untyped-def]
             return None
 
@@ -106,3 +180,600 @@ def test_get_topic_not_found(client: TestClient) -> None:
     resp = client.get("/api/v2/topics/does-not-exist")
     assert resp.status_code == 404
     assert resp.json().get("error") == "Topic not found"
+
+
+def test_list_topics_async_repository(client: TestClient) -> None:
+    class FakeAsyncRepo:
+        async def get_topics_version(self, tenant_schema: str) -> str:
+            return "1:1:"
+
+        async def get_page(self, tenant_schema: str, query: TopicListQuery) -> list[Topic]:
+            return [make_topic("topic-async")]
+
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(FakeAsyncRepo())  # type: ignore[arg-type]
+
+    resp = client.get("/api/v2/topics")
+    assert resp.status_code == 200
+    assert resp.json()["topics"][0]["topic_id"] == "topic-async"
+
+
+def test_async_topic_repository_latest_sid_wins() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    class SqliteAsyncProvider:
+        @asynccontextmanager
+        async def session(self, read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                yield session
+                await session.commit()
+
+        def tenant_session(self, schema: str, read_only: bool = False) -> Any:
+            return self.session(read_only)
+
+    async def scenario() -> Optional[Topic]:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all, tables=[Topic.__table__])  # type: ignore[attr-defined]
+        repo = AsyncTopicRepository(SqliteAsyncProvider())
+        async with SqliteAsyncProvider().session() as session:
+            older, newer = make_topic("shared"), make_topic("shared")
+            older.tid, older.sid = 1, 10
+            newer.tid, newer.sid = 2, 11
+            session.add_all([older, newer])
+        return await repo.get_by_topic_id("test_schema", "shared")
+
+    topic = asyncio.run(scenario())
+    assert topic is not None
+    assert topic.sid == 11
+
+
+def test_topic_list_cache_follows_masterfile_version() -> None:
+    version, loads = ["1:1:"], []
+
+    class FakeRepo:
+        def get_topics_version(self, tenant_schema: str) -> str:
+            return version[0]
+
+        def get_page(self, tenant_schema: str, query: TopicListQuery) -> List[Topic]:
+            loads.append(tenant_schema)
+            return [make_topic(f"topic-{len(loads)}")]
+
+    cache: TopicListCache = TTLCache(10, max_weight=10_000, weigher=len)
+    service = TopicService(FakeRepo(), cache)  # type: ignore[arg-type]
+    page = TopicListQuery(limit=10)
+
+    first = asyncio.run(service.get_topics_page_serialized("test_schema", page))
+    assert asyncio.run(service.get_topics_page_serialized("test_schema", page)) == first
+    assert loads == ["test_schema"]
+
+    version[0] = "1:2:"
+    assert b"topic-2" in asyncio.run(service.get_topics_page_serialized("test_schema", page))
+    assert len(loads) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_topic_list_serves_precompressed_variants_from_the_cache(client: TestClient) -> None:
+    loads: List[str] = []
+
+    class FakeRepo(VersionedRepo):
+        def get_page(self, tenant_schema: str, query: TopicListQuery) -> List[Topic]:
+            loads.append(tenant_schema)
+            return [make_topic(f"topic-{i}") for i in range(20)]
+
+    cache: TopicListCache = TTLCache(10, max_weight=1_000_000, weigher=len)
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(FakeRepo(), cache)  # type: ignore[arg-type]
+
+    plain = client.get("/api/v2/topics", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    for encoding in ("br", "zstd", "gzip", "br"):
+        response = client.get("/api/v2/topics", headers={"Accept-Encoding": encoding})
+        assert response.headers["content-encoding"] == encoding
+        assert response.headers["etag"] == f"W/{plain.headers['etag']}"
+        assert response.content == plain.content
+    assert loads == ["test_schema"]
+    assert cache.stats()["size"] == 4
+    assert (
+        client.get(
+            "/api/v2/topics", headers={"If-None-Match": response.headers["etag"]}
+        ).status_code
+        == 304
+    )
+
+
+def test_topics_negotiate_msgpack_with_native_types(client: TestClient) -> None:
+    topic = make_topic("topic-1")
+
+    class FakeRepo(VersionedRepo):
+        def get_page(self, tenant_schema: str, query: TopicListQuery) -> List[Topic]:
+            return [topic]
+
+        def get_by_topic_id(self, tenant_schema: str, topic_id: str) -> Topic:
+            return topic
+
+    cache: TopicListCache = TTLCache(10, max_weight=1_000_000, weigher=len)
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(FakeRepo(), cache)  # type: ignore[arg-type]
+    accept = {"Accept": "application/msgpack"}
+
+    as_json = client.get("/api/v2/topics")
+    as_msgpack = client.get("/api/v2/topics", headers=accept)
+    assert as_msgpack.headers["content-type"] == "application/msgpack"
+    assert "Accept" in as_msgpack.headers["vary"]
+    assert as_msgpack.headers["etag"] != as_json.headers["etag"]
+    page = msgpack.unpackb(as_msgpack.content, timestamp=3)
+    assert page["topics"][0]["load_date"] == topic.load_date
+    assert page["topics"][0]["topic_growth"] == topic.topic_growth
+    assert client.get("/api/v2/topics", headers=accept).content == as_msgpack.content
+    assert cache.stats()["size"] == 2
+
+    item = client.get("/api/v2/topics/topic-1", headers=accept)
+    assert item.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(item.content)["topic"]["topic_id"] == "topic-1"
+    assert client.get("/api/v2/topics/topic-1").json()["topic"]["topic_id"] == "topic-1"
+
+
+def test_conditional_get_skips_loading_topics(client: TestClient) -> None:
+    loads: List[str] = []
+
+    class FakeRepo(VersionedRepo):
+        def get_page(self, tenant_schema: str, query: TopicListQuery) -> List[Topic]:
+            loads.append("list")
+            return [make_topic("topic-1")]
+
+        def get_by_topic_id(self, tenant_schema: str, topic_id: str) -> Topic:
+            loads.append("item")
+            return make_topic(topic_id)
+
+    repo = FakeRepo()
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(repo)  # type: ignore[arg-type]
+
+    for path in ("/api/v2/topics", "/api/v2/topics/topic-1"):
+        etag = client.get(path).headers["etag"]
+        resp = client.get(path, headers={"If-None-Match": f'"stale", W/{etag}'})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+    assert loads == ["list", "item"]
+
+    repo.version = "1:2:"
+    assert client.get("/api/v2/topics", headers={"If-None-Match": etag}).status_code == 200
+
+
+def sqlite_topic_repository(
+    topics: List[Topic],
+    statements: Optional[List[str]] = None,
+    sows: Optional[List[TenantSow]] = None,
+) -> TopicRepository:
+    """Topic repository over in-memory sqlite; with `sows` it keeps its real version probe."""
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    tables = [Topic, TenantSow] if sows is not None else [Topic]
+    SQLModel.metadata.create_all(engine, tables=[t.__table__ for t in tables])  # type: ignore[attr-defined]
+
+    class SqliteProvider:
+        @contextmanager
+        def session(self, read_only: bool = False) -> Iterator[Session]:
+            with Session(engine, expire_on_commit=False) as session:
+                yield session
+                session.commit()
+
+        def tenant_session(self, schema: str, read_only: bool = False) -> Any:
+            return self.session(read_only)
+
+    with SqliteProvider().session() as session:
+        session.add_all([*topics, *(sows or [])])
+    if statements is not None:
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    repo = TopicRepository(SqliteProvider())  # type: ignore[arg-type]
+    if sows is None:
+        repo.get_topics_version = lambda tenant_schema: "1:1:"  # type: ignore[method-assign]
+    return repo
+
+
+def make_sow(sid: int, masterfile_version: int) -> TenantSow:
+    load_date = datetime.datetime(2025, 1, 1)
+    return TenantSow(
+        sid=sid,
+        load_date=load_date,
+        sow_name="S",
+        sow_status="a",
+        masterfile_version=masterfile_version,
+    )
+
+
+def test_topics_version_follows_topic_and_sow_changes() -> None:
+    topic = make_topic("topic-1")
+    repo = sqlite_topic_repository([topic], sows=[make_sow(10, 1), make_sow(11, 2)])
+    seen = {repo.get_topics_version("test_schema")}
+
+    def changed() -> bool:
+        version = repo.get_topics_version("test_schema")
+        fresh = version not in seen
+        seen.add(version)
+        return fresh
+
+    with repo.db.session() as session:
+        edited = session.get(Topic, topic.tid)
+        assert edited is not None
+        edited.topic_description, edited.load_date = "new", datetime.datetime(2030, 1, 1)
+    assert changed()
+
+    with repo.db.session() as session:
+        extra = make_topic("topic-2")
+        extra.tid = 2
+        session.add(extra)
+    assert changed()
+
+    # Same number of SOWs and the same sum of masterfile versions, but a different state.
+    with repo.db.session() as session:
+        first, second = session.get(TenantSow, 10), session.get(TenantSow, 11)
+        assert first is not None and second is not None
+        first.masterfile_version, second.masterfile_version = 2, 1
+    assert changed()
+    assert not changed()
+
+
+def test_etags_change_when_a_topic_row_changes(client: TestClient) -> None:
+    topic = make_topic("topic-1")
+    repo = sqlite_topic_repository([topic], sows=[make_sow(10, 1)])
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(repo)
+
+    paths = ("/api/v2/topics", "/api/v2/topics/topic-1")
+    etags = {path: client.get(path).headers["etag"] for path in paths}
+    for path, etag in etags.items():
+        assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+    with repo.db.session() as session:
+        edited = session.get(Topic, topic.tid)
+        assert edited is not None
+        edited.topic_name, edited.load_date = "Renamed", datetime.datetime(2030, 1, 1)
+
+    for path, etag in etags.items():
+        resp = client.get(path, headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert "Renamed" in resp.text
+
+
+def test_keyset_pages_cover_every_topic_once(client: TestClient) -> None:
+    topics = []
+    for tid in range(1, 8):
+        topic = make_topic(f"topic-{tid}")
+        topic.tid, topic.sid, topic.for_deletion = tid, 10 + tid % 2, tid == 4
+        topics.append(topic)
+    repo = sqlite_topic_repository(topics)
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(repo)
+
+    def collect(params: str) -> List[str]:
+        seen, cursor = [], ""
+        while True:
+            data = client.get(f"/api/v2/topics?{params}{cursor}").json()
+            assert len(data["topics"]) <= 2
+            seen += [topic["topic_id"] for topic in data["topics"]]
+            if data["next_cursor"] is None:
+                return seen
+            cursor = f"&cursor={data['next_cursor']}"
+
+    assert collect("limit=2") == ["topic-1", "topic-2", "topic-3", "topic-5", "topic-6", "topic-7"]
+    assert collect("limit=2&sid=11") == ["topic-1", "topic-3", "topic-5", "topic-7"]
+    assert client.get("/api/v2/topics?cursor=not-a-cursor").status_code == 400
+
+
+def test_sparse_fieldsets_select_only_requested_columns(client: TestClient) -> None:
+    topics = [make_topic(f"topic-{tid}") for tid in range(1, 4)]
+    for tid, topic in enumerate(topics, start=1):
+        topic.tid = tid
+    repo = sqlite_topic_repository(topics)
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(repo)
+
+    page = client.get("/api/v2/topics?fields=topic_id,topic_name&limit=2").json()
+    assert page["topics"] == [
+        {"topic_id": "topic-1", "topic_name": "Test Topic"},
+        {"topic_id": "topic-2", "topic_name": "Test Topic"},
+    ]
+    rest = client.get(f"/api/v2/topics?fields=topic_id&cursor={page['next_cursor']}").json()
+    assert rest == {"topics": [{"topic_id": "topic-3"}], "next_cursor": None}
+
+    item = client.get("/api/v2/topics/topic-2?fields=tid,topic_growth").json()
+    assert item == {"topic": {"tid": 2, "topic_growth": None}}
+
+    resp = client.get("/api/v2/topics?fields=topic_id,password")
+    assert resp.status_code == 400
+    assert "password" in resp.json()["detail"]
+
+
+def test_columnar_pages_carry_each_field_name_once(client: TestClient) -> None:
+    topics = [make_topic(f"topic-{tid}") for tid in range(1, 4)]
+    for tid, topic in enumerate(topics, start=1):
+        topic.tid, topic.topic_growth_normalized = tid, tid / 10
+    repo = sqlite_topic_repository(topics)
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(repo)
+
+    params = "fields=topic_id&sort=-topic_growth_normalized&limit=2"
+    page = client.get(f"/api/v2/topics?format=columnar&{params}").json()
+    assert page["topics"] == {"topic_id": ["topic-3", "topic-2"]}
+    rows = client.get(f"/api/v2/topics?{params}").json()
+    assert page["next_cursor"] == rows["next_cursor"]
+    rest = client.get(f"/api/v2/topics?format=columnar&{params}&cursor={page['next_cursor']}")
+    assert rest.json() == {"topics": {"topic_id": ["topic-1"]}, "next_cursor": None}
+
+    full = client.get("/api/v2/topics?format=columnar").json()["topics"]
+    rows = client.get("/api/v2/topics").json()["topics"]
+    assert set(full) == set(rows[0])
+    assert full["tid"] == [1, 2, 3] and full["topic_name"] == ["Test Topic"] * 3
+    assert full["load_date"] == [row["load_date"] for row in rows]
+
+    schemas = client.get("/openapi.json").json()["components"]["schemas"]
+    assert "TopicsColumnarResponse" in schemas
+
+
+def test_sorted_and_filtered_pages_match_in_memory_order(client: TestClient) -> None:
+    growth = [0.5, None, 0.2, 0.5, None, 0.9, 0.1, 0.5]
+    topics = []
+    for tid, value in enumerate(growth, start=1):
+        topic = make_topic(f"topic-{tid}")
+        topic.tid, topic.topic_growth_normalized = tid, value
+        topic.topic_status, topic.new_discovery = tid % 3, tid % 2 == 0
+        topics.append(topic)
+    statements: List[str] = []
+    repo = sqlite_topic_repository(topics, statements)
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(repo)
+
+    def collect(params: str) -> List[int]:
+        seen, cursor = [], ""
+        while True:
+            data = client.get(f"/api/v2/topics?fields=tid&limit=2&{params}{cursor}").json()
+            seen += [topic["tid"] for topic in data["topics"]]
+            if data["next_cursor"] is None:
+                return seen
+            cursor = f"&cursor={data['next_cursor']}"
+
+    def order(topic: Topic) -> tuple[bool, float, int]:
+        value = topic.topic_growth_normalized
+        return value is None, value or 0.0, topic.tid or 0
+
+    ascending = [t.tid for t in sorted(topics, key=order)]
+    assert collect("sort=topic_growth_normalized") == ascending
+    assert collect("sort=-topic_growth_normalized") == ascending[::-1]
+    # Pages are index range seeks; one that may cross into the NULLs unions a seek on each side.
+    assert not [statement for statement in statements if " OR " in statement]
+    assert any("UNION ALL" in statement for statement in statements)
+
+    above = collect("sort=-topic_growth_normalized&min_topic_growth_normalized=0.3")
+    assert above == [6, 8, 4, 1]
+    assert collect("topic_status=1&topic_status=2&new_discovery=true") == [2, 4, 8]
+
+    first = client.get("/api/v2/topics?limit=1&sort=-topic_status").json()["next_cursor"]
+    assert client.get(f"/api/v2/topics?cursor={first}").status_code == 400
+    assert client.get("/api/v2/topics?sort=topic_description").status_code == 400
+
+
+@pytest.mark.parametrize(
+    "sort, position",
+    [
+        ("tid", {"tid": True}),
+        ("tid", {"tid": "7"}),
+        ("topic_growth_normalized", {"tid": 1, "v": "2025-01-01", "s": "topic_growth_normalized"}),
+        ("topic_growth_normalized", {"tid": 1, "v": [0.5], "s": "topic_growth_normalized"}),
+        ("topic_growth_normalized", {"tid": 1, "v": True, "s": "topic_growth_normalized"}),
+        ("topic_growth_normalized", {"tid": 1, "v": float("nan"), "s": "topic_growth_normalized"}),
+        ("topic_status", {"tid": 1, "v": 1.5, "s": "topic_status"}),
+        ("topic_status", {"tid": 1, "v": None, "s": "topic_status"}),
+        ("-new_discovery", {"tid": 1, "v": 0, "s": "-new_discovery"}),
+    ],
+)
+def test_malformed_cursors_are_rejected(
+    client: TestClient, sort: str, position: Dict[str, Any]
+) -> None:
+    repo = sqlite_topic_repository([make_topic("topic-1")])
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(repo)
+
+    resp = client.get(f"/api/v2/topics?sort={sort}&cursor={encode_cursor(position)}")
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Invalid pagination cursor."
+
+
+def test_cursor_values_are_coerced_to_the_sort_column() -> None:
+    assert sort_value("topic_growth_normalized", 1) == 1.0
+    assert sort_value("topic_growth_normalized", None) is None
+    assert sort_value("new_discovery", False) is False
+
+
+def test_batch_lookup_keeps_latest_sid_and_reports_misses(client: TestClient) -> None:
+    older, newer, other = make_topic("shared"), make_topic("shared"), make_topic("other")
+    older.tid, older.sid = 1, 10
+    newer.tid, newer.sid = 2, 11
+    other.tid = 3
+    statements: List[str] = []
+    repo = sqlite_topic_repository([older, newer, other], statements)
+    app.dependency_overrides[get_topic_service] = lambda: TopicService(repo)
+
+    resp = client.post(
+        "/api/v2/topics/batch", json={"topic_ids": ["shared", "nope", "other", "shared"]}
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert {topic_id: topic["sid"] for topic_id, topic in data["topics"].items()} == {
+        "shared": 11,
+        "other": 10,
+    }
+    assert data["missing"] == ["nope"]
+    assert len(statements) == 1
+
+    assert client.post("/api/v2/topics/batch", json={"topic_ids": []}).status_code == 422
+
+
+@pytest.mark.parametrize("fan_out", [1, 6])
+def test_topic_graph_query_budget_is_constant(client: TestClient, fan_out: int) -> None:
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    tables = [Topic, Trend, Driver, Topic2Driver, Source, Topic2Source, Opportunity]
+    tables += [Topic2Opportunity, MaturityScore]
+    SQLModel.metadata.create_all(engine, tables=[t.__table__ for t in tables])  # type: ignore[attr-defined]
+
+    now = datetime.datetime.now(datetime.UTC)
+    topic = make_topic("graph")
+    topic.ssid = 7
+    rows: List[Any] = [topic]
+    rows.append(
+        Trend(
+            ssid=7,
+            sid=10,
+            load_date=now,
+            trend_id="tr",
+            trend_name="Trend",
+            shift_id="s",
+            shift_name="Shift",
+            masterfile_version=1,
+        )
+    )
+    for i in range(1, fan_out + 1):
+        rows.append(
+            Driver(
+                did=i,
+                sow_sid=10,
+                load_date=now,
+                driver_id=f"d{i}",
+                driver_name="D",
+                masterfile_version=1,
+            )
+        )
+        rows.append(Topic2Driver(topic_tid=1, driver_did=i, strength=float(i)))
+        rows.append(
+            Source(
+                soid=i,
+                sow_sid=10,
+                source_url="u",
+                source_title="S",
+                load_date=now,
+                masterfile_version=1,
+            )
+        )
+        rows.append(Topic2Source(topic_tid=1, source_soid=i))
+        rows.append(
+            Opportunity(oid=i, sid=10, opportunity_name="O", opportunity=i, masterfile_version=1)
+        )
+        rows.append(Topic2Opportunity(topic_tid=1, opportunity_oid=i))
+        for category in (MaturityCategory.GLOBAL, MaturityCategory.ADOPTION):
+            updated = now + datetime.timedelta(minutes=i)
+            rows.append(
+                MaturityScore(topic_id=1, category=category, rationale=f"r{i}", updated_at=updated)
+            )
+
+    class SqliteProvider:
+        @contextmanager
+        def session(self, read_only: bool = False) -> Iterator[Session]:
+            with Session(engine, expire_on_commit=False) as session:
+                yield session
+                session.commit()
+
+        def tenant_session(self, schema: str, read_only: bool = False) -> Any:
+            return self.session(read_only)
+
+    with SqliteProvider().session() as session:
+        session.add_all(rows)
+
+    statements: List[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    repo = TopicGraphRepository(SqliteProvider())  # type: ignore[arg-type]
+    app.dependency_overrides[get_topic_graph_service] = lambda: TopicGraphService(repo)
+
+    data = client.get("/api/v2/topics/graph/graph").json()
+    assert len(statements) == GRAPH_QUERY_COUNT
+    assert data["topic"]["topic_id"] == "graph"
+    assert data["trend"]["trend_id"] == "tr"
+    assert [d["driver_id"] for d in data["drivers"]] == [f"d{i}" for i in range(fan_out, 0, -1)]
+    assert len(data["sources"]) == len(data["opportunities"]) == fan_out
+    assert sorted(m["rationale"] for m in data["maturity_scores"]) == [f"r{fan_out}"] * 2
+
+    assert client.get("/api/v2/topics/missing/graph").status_code == 404
+
+
+def test_growth_opportunity_hierarchy_loads_one_query_per_level(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    tables = [Topic, BaseGrowthOpportunity, GrowthOpportunityTopics, GeographyGrowthOpportunity]
+    tables += [Market, Estimator]
+    SQLModel.metadata.create_all(engine, tables=[t.__table__ for t in tables])  # type: ignore[attr-defined]
+
+    now = datetime.datetime.now(datetime.UTC)
+    other_sow = make_topic("elsewhere")
+    other_sow.tid, other_sow.sid = 2, 11
+    rows: List[Any] = [make_topic("t1"), other_sow]
+    for goid in range(1, 6):
+        rows.append(
+            BaseGrowthOpportunity(goid=goid, load_date=now, growth_opportunity_id=f"go{goid}")
+        )
+        topic_id = "elsewhere" if goid == 5 else "t1"
+        rows.append(GrowthOpportunityTopics(goid=goid, topic_id=topic_id, topic_name="T"))
+        for geo in range(2):
+            ggoid = goid * 10 + geo
+            rows.append(
+                GeographyGrowthOpportunity(
+                    ggoid=ggoid,
+                    goid=goid,
+                    name="G",
+                    geography_id="us",
+                    geography_name="US",
+                    description="",
+                    customer_need="",
+                    growth_space_market_size=1,
+                )
+            )
+            rows.append(Market(mid=ggoid, ggoid=ggoid, market="M", market_level_market_size=2))
+            rows.append(
+                Estimator(
+                    mid=ggoid,
+                    category="c",
+                    customer_segment="s",
+                    customer_segment_description="",
+                    customer_segment_occasion="",
+                    granular_consumer_need="",
+                    potential_customers=3,
+                    avr_annual_spend=4,
+                    customer_segment_market_size=5,
+                )
+            )
+
+    class SqliteProvider:
+        @contextmanager
+        def session(self, read_only: bool = False) -> Iterator[Session]:
+            with Session(engine, expire_on_commit=False) as session:
+                yield session
+                session.commit()
+
+        def tenant_session(self, schema: str, read_only: bool = False) -> Any:
+            return self.session(read_only)
+
+    with SqliteProvider().session() as session:
+        session.add_all(rows)
+
+    statements: List[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    repo = GrowthOpportunityRepository(SqliteProvider())  # type: ignore[arg-type]
+    app.dependency_overrides[get_growth_opportunity_service] = lambda: GrowthOpportunityService(
+        repo
+    )
+
+    data = client.get("/api/v2/growth-opportunities/10").json()["growth_opportunities"]
+    assert len(statements) == 5
+    assert [root["growth_opportunity_id"] for root in data] == ["go1", "go2", "go3", "go4"]
+    assert [topic["topic_id"] for topic in data[0]["topics"]] == ["t1"]
+    assert [geo["ggoid"] for geo in data[1]["geographies"]] == [20, 21]
+    assert data[1]["geographies"][1]["markets"][0]["estimators"][0]["mid"] == 21
+
+    statements.clear()
+    data = client.get("/api/v2/growth-opportunities/10?depth=1").json()["growth_opportunities"]
+    assert len(statements) == 3
+    assert data[0]["geographies"][0]["markets"] == []
+
+    monkeypatch.setattr("routes.growth_opportunity_router.GROWTH_OPPORTUNITY_STREAM_BATCH", 3)
+    response = client.get("/api/v2/growth-opportunities/10?stream=true")
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["goid"] for line in lines] == [1, 2, 3, 4]
+    assert len(lines[3]["geographies"][0]["markets"][0]["estimators"]) == 1
@@ -0,0 +1,20 @@
+"""HTTP helpers shared by routers: conditional requests and response encoding."""
+
+from .conditional import etag_for, etag_matches, not_modified
+from .negotiation import NegotiationMiddleware, response_media_type
+from .pagination import decode_cursor, encode_cursor
+from .responses import ApiResponse, render, render_json, render_msgpack
+
+__all__ = [
+    "ApiResponse",
+    "NegotiationMiddleware",
+    "decode_cursor",
+    "encode_cursor",
+    "etag_for",
+    "etag_matches",
+    "not_modified",
+    "render",
+    "render_json",
+    "render_msgpack",
+    "response_media_type",
+]
@@ -0,0 +1,147 @@
+"""Arrow IPC stream and Parquet encoding of tenant table rows.
+
+Kept out of `web/__init__` so pyarrow is only imported by the first columnar
+export, not at application start-up.
+"""
+
+import decimal
+import enum
+import io
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    Integer,
+    Numeric,
+    SmallInteger,
+    String,
+    Table,
+)
+
+# Scale of `Decimal` fields declared without `decimal_places` (plain `Decimal` annotations).
+UNCONSTRAINED_DECIMAL_SCALE = 18
+# Digits of Arrow's decimal128, which leaves 38 - scale digits before the point.
+DECIMAL128_PRECISION = 38
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def _quantizer(scale: int) -> Callable[[Any], Any]:
+    """Round to `scale` places within decimal128's 38 digits, not the default context's 28."""
+    quantum = decimal.Decimal(1).scaleb(-scale)
+    context = decimal.Context(prec=DECIMAL128_PRECISION)
+    return lambda value: None if value is None else value.quantize(quantum, context=context)
+
+
+def _arrow_type(column_type: Any) -> Tuple[pa.DataType, Converter]:
+    """The Arrow type of a column, and how to convert its Python values (None: as they are)."""
+    if isinstance(column_type, Boolean):
+        return pa.bool_(), None
+    if isinstance(column_type, SmallInteger):
+        return pa.int16(), None
+    if isinstance(column_type, BigInteger):
+        return pa.int64(), None
+    if isinstance(column_type, Integer):
+        return pa.int32(), None
+    if isinstance(column_type, Numeric) and not isinstance(column_type, Float):
+        scale = column_type.scale
+        if scale is None:
+            return pa.decimal128(DECIMAL128_PRECISION, UNCONSTRAINED_DECIMAL_SCALE), _quantizer(
+                UNCONSTRAINED_DECIMAL_SCALE
+            )
+        return pa.decimal128(column_type.precision or DECIMAL128_PRECISION, scale), None
+    if isinstance(column_type, Float):
+        return pa.float64(), None
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us", tz="UTC" if column_type.timezone else None), None
+    if isinstance(column_type, Date):
+        return pa.date32(), None
+    if isinstance(column_type, Enum):
+        return pa.string(), lambda value: value.value if isinstance(value, enum.Enum) else value
+    if isinstance(column_type, JSON):
+        return pa.string(), lambda value: None if value is None else json.dumps(value)
+    if isinstance(column_type, String):
+        return pa.string(), None
+    return pa.string(), lambda value: None if value is None else str(value)
+
+
+def arrow_schema(table: Table) -> pa.Schema:
+    """Typed Arrow schema matching the table's SQLModel field types."""
+    return pa.schema(
+        pa.field(column.name, _arrow_type(column.type)[0], nullable=column.nullable)
+        for column in table.columns
+    )
+
+
+class _Sink(io.RawIOBase):
+    """Write-only file collecting what the writer emits until `take` hands it out."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ArrowEncoder:
+    """Encodes batches of row dicts as one Arrow IPC stream or Parquet file.
+
+    Each `encode` call becomes one record batch (or Parquet row group) and returns
+    the bytes written for it; `finish` returns the end-of-stream marker or footer.
+    """
+
+    def __init__(self, table: Table, parquet: bool = False) -> None:
+        self.schema = arrow_schema(table)
+        self._converters: Dict[str, Converter] = {
+            column.name: _arrow_type(column.type)[1] for column in table.columns
+        }
+        self._sink = _Sink()
+        self._writer: Any = (
+            pq.ParquetWriter(self._sink, self.schema)
+            if parquet
+            else pa.ipc.new_stream(self._sink, self.schema)
+        )
+
+    def start(self) -> bytes:
+        return self._sink.take()
+
+    def encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        columns = []
+        for field, (name, converter) in zip(self.schema, self._converters.items()):
+            values = [row[name] for row in rows]
+            if converter is not None:
+                values = [converter(value) for value in values]
+            columns.append(pa.array(values, type=field.type))
+        self._writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=self.schema))
+        return self._sink.take()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.take()
+
+
+__all__ = ["UNCONSTRAINED_DECIMAL_SCALE", "ArrowEncoder", "arrow_schema"]
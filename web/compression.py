@@ -0,0 +1,198 @@
+"""Content-negotiated response compression (zstd, brotli, gzip).
+
+`CompressionMiddleware` compresses responses whose type is worth compressing
+once they reach COMPRESSION_MIN_SIZE bytes, and compresses streamed responses
+chunk by chunk, flushing each chunk so clients still receive data as it is
+produced. Routes tune their level with `compression_levels`; routes that cache
+their bodies compress them once with `compress` and set `Content-Encoding`
+themselves, which the middleware leaves untouched.
+"""
+
+import os
+import zlib
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import brotli
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from web.negotiation import MSGPACK_MEDIA_TYPE, accept_weights
+
+# Bodies smaller than this are sent as they are.
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1_024))
+# Levels for compressing on the fly, per request.
+DEFAULT_LEVELS = {
+    "zstd": int(os.environ.get("COMPRESSION_ZSTD_LEVEL", 3)),
+    "br": int(os.environ.get("COMPRESSION_BR_LEVEL", 4)),
+    "gzip": int(os.environ.get("COMPRESSION_GZIP_LEVEL", 6)),
+}
+# Levels for bodies that are compressed once and cached.
+PRECOMPRESSION_LEVELS = {"zstd": 12, "br": 8, "gzip": 9}
+
+# Server preference when a client accepts several encodings with the same q-value.
+ENCODINGS = ("zstd", "br", "gzip")
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    MSGPACK_MEDIA_TYPE,
+    "application/vnd.apache.arrow.stream",
+    "text/",
+)
+
+# Per-endpoint levels registered by `compression_levels`.
+ROUTE_LEVELS: Dict[Callable[..., Any], Dict[str, int]] = {}
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+
+def compression_levels(**levels: int) -> Callable[[EndpointT], EndpointT]:
+    """Override DEFAULT_LEVELS for one endpoint, e.g. `@compression_levels(gzip=1, zstd=1)`.
+
+    Apply it below the router decorator, so the registered endpoint is marked.
+    """
+    unknown = set(levels).difference(ENCODINGS)
+    if unknown:
+        raise ValueError(f"Unknown encodings: {', '.join(sorted(unknown))}")
+
+    def mark(endpoint: EndpointT) -> EndpointT:
+        ROUTE_LEVELS[endpoint] = levels
+        return endpoint
+
+    return mark
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """The supported encoding the client prefers (by q-value, then server preference), if any."""
+    if not accept_encoding:
+        return None
+    weights = accept_weights(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """Compress a whole body; `level` defaults to DEFAULT_LEVELS."""
+    level = DEFAULT_LEVELS[encoding] if level is None else level
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if encoding == "br":
+        return brotli.compress(data, quality=level)  # type: ignore[no-any-return]
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+class _StreamCompressor:
+    """Compresses a body chunk by chunk, flushing after each so it can be sent at once."""
+
+    def __init__(self, encoding: str, level: int) -> None:
+        self._compressor: Any
+        if encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            self._flush: Callable[[], bytes] = lambda: self._compressor.flush(
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+            self._finish: Callable[[], bytes] = self._compressor.flush
+        elif encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+            self._flush = self._compressor.flush
+            self._finish = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self._flush = lambda: self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._finish = self._compressor.flush
+
+    def compress(self, chunk: bytes, last: bool = False) -> bytes:
+        data: bytes = self._compressor.compress(chunk) if chunk else b""
+        return data + (self._finish() if last else self._flush())
+
+
+def _compressible(start: Message, headers: MutableHeaders) -> bool:
+    if start["status"] < 200 or start["status"] in (204, 304) or "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class _CompressingResponder:
+    def __init__(self, scope: Scope, send: Send, encoding: str, minimum_size: int) -> None:
+        self.scope = scope
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+        if self.start is None:
+            if self.compressor is not None:
+                last = not message.get("more_body", False)
+                message = {**message, "body": self.compressor.compress(message["body"], last)}
+            await self.send(message)
+            return
+
+        start, self.start = self.start, None
+        body: bytes = message.get("body", b"")
+        streaming: bool = message.get("more_body", False)
+        headers = MutableHeaders(raw=start["headers"])
+        if not _compressible(start, headers) or (not streaming and len(body) < self.minimum_size):
+            await self.send(start)
+            await self.send(message)
+            return
+
+        levels = ROUTE_LEVELS.get(self.scope.get("endpoint"), {})  # type: ignore[arg-type]
+        level = levels.get(self.encoding, DEFAULT_LEVELS[self.encoding])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"  # the encoded bytes differ, so the validator is weak
+        if streaming:
+            del headers["Content-Length"]
+            self.compressor = _StreamCompressor(self.encoding, level)
+            body = self.compressor.compress(body)
+        else:
+            body = compress(body, self.encoding, level)
+            headers["Content-Length"] = str(len(body))
+        await self.send(start)
+        await self.send({**message, "body": body})
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with the encoding negotiated from Accept-Encoding."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(scope, send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder)
+
+
+__all__ = [
+    "COMPRESSION_MIN_SIZE",
+    "PRECOMPRESSION_LEVELS",
+    "CompressionMiddleware",
+    "compress",
+    "compression_levels",
+    "negotiate",
+]
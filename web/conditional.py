@@ -0,0 +1,31 @@
+"""Strong ETags and `If-None-Match` handling for conditional GETs."""
+
+import hashlib
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# Clients must revalidate every time, but may keep the body to replay on a 304.
+REVALIDATE_HEADERS = {"Cache-Control": "private, no-cache"}
+
+
+def etag_for(*parts: object) -> str:
+    """Return a strong, quoted ETag derived from `parts` (tenant, version, ...)."""
+    digest = hashlib.sha256("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether `If-None-Match` lists `etag` (weak comparison, per RFC 9110) or is `*`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, **REVALIDATE_HEADERS})
+
+
+__all__ = ["REVALIDATE_HEADERS", "etag_for", "etag_matches", "not_modified"]
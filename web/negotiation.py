@@ -0,0 +1,91 @@
+"""`Accept` negotiation between JSON and MessagePack response bodies.
+
+`NegotiationMiddleware` picks the media type once per request and records it in
+a context variable, so `ApiResponse` (and services that render cached bodies)
+answer in it without every route threading the request through. Responses in a
+negotiated type get `Vary: Accept`.
+"""
+
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# Names clients use for MessagePack; the response always uses MSGPACK_MEDIA_TYPE.
+MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON_MEDIA_TYPE)
+
+
+def accept_weights(header: str) -> Dict[str, float]:
+    """The q-value of each item of an `Accept`-style header, keyed by its lowercased name."""
+    weights: Dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+    return weights
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """MSGPACK_MEDIA_TYPE when the client weighs it above JSON, else JSON_MEDIA_TYPE."""
+    if not accept:
+        return JSON_MEDIA_TYPE
+    weights = accept_weights(accept)
+    wildcard = weights.get("application/*", weights.get("*/*", 0.0))
+    msgpack = max((weights[alias] for alias in MSGPACK_ALIASES if alias in weights), default=None)
+    json = weights.get(JSON_MEDIA_TYPE, wildcard)
+    if msgpack is not None and msgpack > 0 and msgpack > json:
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def response_media_type() -> str:
+    """The media type negotiated for the current request (JSON outside of one)."""
+    return _media_type.get()
+
+
+class NegotiationMiddleware:
+    """ASGI middleware recording the negotiated media type for the request it wraps."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                media_type = headers.get("content-type", "").partition(";")[0]
+                if media_type in (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE):
+                    headers.add_vary_header("Accept")
+            await send(message)
+
+        token = _media_type.set(negotiate_media_type(Headers(scope=scope).get("accept")))
+        try:
+            await self.app(scope, receive, send_with_vary)
+        finally:
+            _media_type.reset(token)
+
+
+__all__ = [
+    "JSON_MEDIA_TYPE",
+    "MSGPACK_MEDIA_TYPE",
+    "NegotiationMiddleware",
+    "accept_weights",
+    "negotiate_media_type",
+    "response_media_type",
+]
@@ -0,0 +1,31 @@
+"""Opaque keyset-pagination cursors.
+
+A cursor is the URL-safe base64 of a small JSON object holding the position of
+the last row served (e.g. `{"tid": 1234}`). Clients must treat it as opaque.
+"""
+
+import base64
+import json
+from typing import Any, Dict
+
+from fastapi import HTTPException
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    raw = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Return the position encoded in `cursor`; 400 if it was not produced by `encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+    except (ValueError, UnicodeDecodeError):
+        position = None
+    if not isinstance(position, dict):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+    return position
+
+
+__all__ = ["decode_cursor", "encode_cursor"]
@@ -0,0 +1,73 @@
+"""Response body encoding shared by routers and by services that cache or stream output."""
+
+import datetime
+import enum
+from typing import Any, Optional
+
+import msgpack
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from web.negotiation import MSGPACK_MEDIA_TYPE, response_media_type
+
+# Serializes models and containers to plain Python values with pydantic-core, in one pass.
+_python_values: TypeAdapter[Any] = TypeAdapter(Any)
+
+
+def render_json(content: Any) -> bytes:
+    """Encode `content` as compact UTF-8 JSON in a single pass.
+
+    SQLModel rows and response models are written by their compiled pydantic-core
+    serializers, straight to bytes, exactly as `jsonable_encoder` rendered them.
+    Values outside a model follow the same pydantic rules, which differ from
+    `jsonable_encoder`'s: Decimals are strings ("1.50", not 1.5), UTC datetimes
+    end in "Z" rather than "+00:00", timedeltas are ISO 8601 durations rather than
+    seconds, and NaN/Infinity become null instead of failing the response.
+    """
+    return pydantic_core.to_json(content, inf_nan_mode="null")
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        # Naive timestamps in the database are UTC.
+        return value.replace(tzinfo=datetime.timezone.utc)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return pydantic_core.to_jsonable_python(value)
+
+
+def render_msgpack(content: Any) -> bytes:
+    """Encode `content` as MessagePack, keeping the types JSON has to spell as text.
+
+    Models go through the same compiled pydantic-core serializers as `render_json`,
+    in one pass in python mode, so floats stay binary floats and datetimes become
+    MessagePack timestamps (read them back with `msgpack.unpackb(data, timestamp=3)`).
+    Other values (Decimals, dates, UUIDs, ...) are written as `render_json` writes them.
+    """
+    values = _python_values.dump_python(content)
+    return msgpack.packb(values, default=_msgpack_default, datetime=True)  # type: ignore[no-any-return]
+
+
+def render(content: Any, media_type: Optional[str] = None) -> bytes:
+    """Encode `content` in `media_type`, by default the one negotiated for the request."""
+    if (media_type or response_media_type()) == MSGPACK_MEDIA_TYPE:
+        return render_msgpack(content)
+    return render_json(content)
+
+
+class ApiResponse(JSONResponse):
+    """`JSONResponse` that renders with `render_json` instead of `jsonable_encoder` + `json.dumps`.
+
+    Routes hand it rows and response models as they are. It is also the app's
+    `default_response_class`. When the request negotiated MessagePack (see
+    `web.negotiation`) it renders with `render_msgpack` instead.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == JSONResponse.media_type:
+            self.media_type = response_media_type()
+        return render(content, self.media_type)
+
+
+__all__ = ["ApiResponse", "render", "render_json", "render_msgpack"]